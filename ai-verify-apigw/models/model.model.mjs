@@ -106,6 +106,9 @@ const modelAPISchema = new Schema({
     batchLimit: { type: Number, default: -1 },
     connectionRetries: { type: Number, default: 3 },
     maxConnections: { type: Number, default: -1 },
+    responseCacheSize: { type: Number, default: 0 },
+    responseCacheTimeout: { type: Number, default: -1 },
+    adaptiveConnections: { type: Boolean, default: false },
     batchStrategy: {
       type: String,
       enum: ["none", "multipart"],
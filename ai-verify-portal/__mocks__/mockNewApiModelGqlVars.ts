@@ -57,6 +57,8 @@ export const saveConfigVariables_tc000 = {
       rateLimit: -1,
       rateLimitTimeout: -1,
       connectionRetries: 3,
+      responseCacheSize: 0,
+      responseCacheTimeout: -1,
       batchStrategy: 'none',
       batchLimit: -1,
       maxConnections: -1,
@@ -127,6 +129,8 @@ export const saveConfigVariables_tc001 = {
       rateLimit: -1,
       rateLimitTimeout: -1,
       connectionRetries: 3,
+      responseCacheSize: 0,
+      responseCacheTimeout: -1,
       batchStrategy: 'none',
       batchLimit: -1,
       maxConnections: -1,
@@ -197,6 +201,8 @@ export const saveConfigVariables_tc002 = {
       rateLimit: -1,
       rateLimitTimeout: -1,
       connectionRetries: 3,
+      responseCacheSize: 0,
+      responseCacheTimeout: -1,
       batchStrategy: 'none',
       batchLimit: -1,
       maxConnections: -1,
@@ -263,6 +269,8 @@ export const saveConfigVariables_tc003 = {
       rateLimit: -1,
       rateLimitTimeout: -1,
       connectionRetries: 3,
+      responseCacheSize: 0,
+      responseCacheTimeout: -1,
       batchStrategy: 'none',
       batchLimit: -1,
       maxConnections: -1,
@@ -329,6 +337,8 @@ export const saveConfigVariables_tc004 = {
       rateLimit: -1,
       rateLimitTimeout: -1,
       connectionRetries: 3,
+      responseCacheSize: 0,
+      responseCacheTimeout: -1,
       batchStrategy: 'none',
       batchLimit: -1,
       maxConnections: -1,
@@ -397,6 +407,8 @@ export const saveConfigVariables_tc005 = {
       rateLimit: -1,
       rateLimitTimeout: -1,
       connectionRetries: 3,
+      responseCacheSize: 0,
+      responseCacheTimeout: -1,
       batchStrategy: 'none',
       batchLimit: -1,
       maxConnections: -1,
@@ -467,6 +479,8 @@ export const saveConfigVariables_tc006 = {
       rateLimit: -1,
       rateLimitTimeout: -1,
       connectionRetries: 3,
+      responseCacheSize: 0,
+      responseCacheTimeout: -1,
       batchStrategy: 'none',
       batchLimit: -1,
       maxConnections: -1,
@@ -538,6 +552,8 @@ export const saveConfigVariables_tc007 = {
       rateLimit: -1,
       rateLimitTimeout: -1,
       connectionRetries: 3,
+      responseCacheSize: 0,
+      responseCacheTimeout: -1,
       batchStrategy: 'none',
       batchLimit: -1,
       maxConnections: -1,
@@ -611,6 +627,8 @@ export const saveConfigVariables_tc008 = {
       rateLimit: -1,
       rateLimitTimeout: -1,
       connectionRetries: 3,
+      responseCacheSize: 0,
+      responseCacheTimeout: -1,
       batchStrategy: 'none',
       batchLimit: -1,
       maxConnections: -1,
@@ -678,6 +696,8 @@ export const saveConfigVariables_tc009 = {
       rateLimit: 5,
       rateLimitTimeout: 10,
       connectionRetries: 5,
+      responseCacheSize: 100,
+      responseCacheTimeout: 60,
       batchStrategy: 'none',
       batchLimit: -1,
       maxConnections: 3,
@@ -747,6 +767,8 @@ export const saveConfigVariables_tc013 = {
       rateLimit: -1,
       rateLimitTimeout: -1,
       connectionRetries: 3,
+      responseCacheSize: 0,
+      responseCacheTimeout: -1,
       batchStrategy: 'multipart',
       batchLimit: 100,
       maxConnections: -1,
@@ -821,6 +843,8 @@ export const saveConfigVariables_tc014 = {
       rateLimit: -1,
       rateLimitTimeout: -1,
       connectionRetries: 3,
+      responseCacheSize: 0,
+      responseCacheTimeout: -1,
       batchStrategy: 'multipart',
       batchLimit: -1,
       maxConnections: -1,
@@ -895,6 +919,8 @@ export const saveConfigVariables_tc015 = {
       rateLimit: -1,
       rateLimitTimeout: -1,
       connectionRetries: 3,
+      responseCacheSize: 0,
+      responseCacheTimeout: -1,
       batchStrategy: 'multipart',
       batchLimit: -1,
       maxConnections: -1,
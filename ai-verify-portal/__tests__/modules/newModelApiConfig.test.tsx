@@ -1771,6 +1771,12 @@ describe('New Model API Config', () => {
         const maxConnectionsInput = container.querySelector(
           'input[name="modelAPI.requestConfig.maxConnections"]'
         ) as HTMLInputElement;
+        const responseCacheSizeInput = container.querySelector(
+          'input[name="modelAPI.requestConfig.responseCacheSize"]'
+        ) as HTMLInputElement;
+        const responseCacheTimeoutInput = container.querySelector(
+          'input[name="modelAPI.requestConfig.responseCacheTimeout"]'
+        ) as HTMLInputElement;
         const rateLimitInput = container.querySelector(
           'input[name="modelAPI.requestConfig.rateLimit"]'
         ) as HTMLInputElement;
@@ -1791,6 +1797,15 @@ describe('New Model API Config', () => {
         await userEvent.clear(maxConnectionsInput);
         await userEvent.type(maxConnectionsInput, '3');
         expect(maxConnectionsInput).toHaveValue('3');
+        await userEvent.clear(responseCacheSizeInput);
+        await userEvent.type(responseCacheSizeInput, '100');
+        expect(responseCacheSizeInput).toHaveValue('100');
+        await waitFor(async () => {
+          expect(responseCacheTimeoutInput.getAttribute('disabled')).toBeNull();
+        });
+        await userEvent.clear(responseCacheTimeoutInput);
+        await userEvent.type(responseCacheTimeoutInput, '60');
+        expect(responseCacheTimeoutInput).toHaveValue('60');
         await userEvent.clear(rateLimitInput);
         await userEvent.type(rateLimitInput, '5');
         expect(rateLimitInput).toHaveValue('5');
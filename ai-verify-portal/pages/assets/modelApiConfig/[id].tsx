@@ -73,6 +73,8 @@ export const getServerSideProps: GetServerSideProps<{
           rateLimit,
           rateLimitTimeout,
           connectionRetries,
+          responseCacheSize,
+          responseCacheTimeout,
           maxConnections,
           batchLimit,
           ...rest
@@ -82,6 +84,9 @@ export const getServerSideProps: GetServerSideProps<{
           rateLimit: rateLimit.toString(),
           rateLimitTimeout: rateLimitTimeout.toString(),
           connectionRetries: connectionRetries.toString(),
+          // models saved before the response cache was added do not have these settings
+          responseCacheSize: (responseCacheSize ?? 0).toString(),
+          responseCacheTimeout: (responseCacheTimeout ?? -1).toString(),
           maxConnections: maxConnections.toString(),
           batchLimit: batchLimit.toString(),
           ...rest,
@@ -135,6 +135,8 @@ const GQL_GET_MODELAPI = gql`
           rateLimitTimeout
           batchLimit
           connectionRetries
+          responseCacheSize
+          responseCacheTimeout
           maxConnections
           batchStrategy
         }
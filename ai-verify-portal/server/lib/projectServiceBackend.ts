@@ -183,6 +183,8 @@ export const GET_PROJECT = gql`
               rateLimitTimeout
               batchLimit
               connectionRetries
+              responseCacheSize
+              responseCacheTimeout
               maxConnections
               batchStrategy
             }
@@ -57,6 +57,8 @@ export const defaultFormValues: ModelApiFormModel = {
       sslVerify: false,
       rateLimitTimeout: ConnectionSettingUnlimited,
       connectionRetries: '3',
+      responseCacheSize: '0',
+      responseCacheTimeout: ConnectionSettingUnlimited,
     },
     response: {
       statusCode: '200',
@@ -163,6 +163,84 @@ function TabContentConnection({ disabled = false }: { disabled?: boolean }) {
               }
             />
           </div>
+          <div className={styles.keyValRow} style={{ marginBottom: 8 }}>
+            <TextInput
+              disabled={disabled}
+              label="Response Cache Size"
+              name={`${otherReqConfigFieldName}.responseCacheSize`}
+              onChange={handleChange}
+              value={requestConfig.responseCacheSize}
+              maxLength={128}
+              style={{ marginBottom: 0, width: '100%' }}
+              error={
+                Boolean(
+                  fieldErrors?.responseCacheSize &&
+                    touchedFields?.responseCacheSize
+                )
+                  ? fieldErrors?.responseCacheSize
+                  : undefined
+              }
+              labelSibling={
+                <Tooltip
+                  backgroundColor={ColorPalette.gray}
+                  fontColor={ColorPalette.white}
+                  content={
+                    <div style={{ marginBottom: 5 }}>
+                      The maximum number of rows whose responses are cached, so
+                      that repeated rows are not sent to the server again.
+                      Defaults to 0, which means the responses are not cached.
+                    </div>
+                  }
+                  position={TooltipPosition.right}
+                  offsetLeft={8}>
+                  <InfoIcon
+                    style={{ fontSize: 18, color: ColorPalette.gray2 }}
+                  />
+                </Tooltip>
+              }
+            />
+          </div>
+          <div className={styles.keyValRow} style={{ marginBottom: 8 }}>
+            <TextInput
+              disabled={
+                disabled ||
+                requestConfig.responseCacheSize.trim() === '' ||
+                parseInt(requestConfig.responseCacheSize) <= 0
+              }
+              label="Response Cache Timeout (seconds)"
+              name={`${otherReqConfigFieldName}.responseCacheTimeout`}
+              onChange={handleChange}
+              value={requestConfig.responseCacheTimeout}
+              maxLength={128}
+              style={{ marginBottom: 0, width: '100%' }}
+              error={
+                Boolean(
+                  fieldErrors?.responseCacheTimeout &&
+                    touchedFields?.responseCacheTimeout
+                )
+                  ? fieldErrors?.responseCacheTimeout
+                  : undefined
+              }
+              labelSibling={
+                <Tooltip
+                  backgroundColor={ColorPalette.gray}
+                  fontColor={ColorPalette.white}
+                  content={
+                    <div style={{ marginBottom: 5 }}>
+                      The number of seconds before the cached responses expire.
+                      Defaults to -1, which means the cached responses do not
+                      expire.
+                    </div>
+                  }
+                  position={TooltipPosition.right}
+                  offsetLeft={8}>
+                  <InfoIcon
+                    style={{ fontSize: 18, color: ColorPalette.gray2 }}
+                  />
+                </Tooltip>
+              }
+            />
+          </div>
           <div className={styles.keyValRow} style={{ marginBottom: 8 }}>
             <TextInput
               disabled={disabled}
@@ -115,6 +115,8 @@ export type RequestConfigForm = {
   rateLimit: string;
   rateLimitTimeout: string;
   connectionRetries: string;
+  responseCacheSize: string;
+  responseCacheTimeout: string;
   batchStrategy: BatchStrategy;
   batchLimit: string;
   maxConnections: string;
@@ -126,6 +128,8 @@ export type RequestConfigGQL = {
   rateLimit: number;
   rateLimitTimeout: number;
   connectionRetries: number;
+  responseCacheSize: number;
+  responseCacheTimeout: number;
   batchStrategy: BatchStrategy;
   batchLimit: number;
   maxConnections: number;
@@ -35,6 +35,8 @@ export function transformFormValuesToGraphModel(
         rateLimit: parseFloat(requestConfig.rateLimit),
         rateLimitTimeout: parseInt(requestConfig.rateLimitTimeout),
         connectionRetries: parseInt(requestConfig.connectionRetries),
+        responseCacheSize: parseInt(requestConfig.responseCacheSize),
+        responseCacheTimeout: parseInt(requestConfig.responseCacheTimeout),
         batchStrategy: requestConfig.batchStrategy,
         batchLimit: parseInt(requestConfig.batchLimit),
         maxConnections: parseInt(requestConfig.maxConnections),
@@ -86,6 +86,14 @@ export const ModelAPIFormValidationSchema = object({
         .min(0, 'Must be 0 or greater')
         .max(5, 'Must be less than 6')
         .typeError('Must be a number'),
+      responseCacheSize: number()
+        .min(0, 'Must be 0 or greater')
+        .required('Required')
+        .typeError('Must be a number'),
+      responseCacheTimeout: number()
+        .min(unlimited, 'Invalid. Enter -1 for no expiry')
+        .required('Required')
+        .typeError('Must be a number'),
       maxConnections: number()
         .min(unlimited, 'Invalid. Enter -1 for unlimited')
         .required('Required')
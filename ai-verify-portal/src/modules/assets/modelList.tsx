@@ -132,6 +132,8 @@ export const GET_MODELS = gql`
           rateLimitTimeout
           batchLimit
           connectionRetries
+          responseCacheSize
+          responseCacheTimeout
           maxConnections
           batchStrategy
         }
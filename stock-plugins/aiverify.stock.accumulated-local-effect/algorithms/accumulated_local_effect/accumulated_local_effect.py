@@ -15,7 +15,9 @@ from test_engine_core.plugins.enums.model_type import ModelType
 from test_engine_core.plugins.enums.plugin_type import PluginType
 from test_engine_core.plugins.metadata.plugin_metadata import PluginMetadata
 from test_engine_core.utils.json_utils import load_schema_file, validate_json
+from test_engine_core.utils.prediction_utils import normalize_predictions
 from test_engine_core.utils.simple_progress import SimpleProgress
+from test_engine_core.utils.worker_pool import WorkerPool
 
 
 # =====================================================================================
@@ -135,6 +137,8 @@ class Plugin(IAlgorithm):
         # Other variables
         self._data = None
         self._results = {"results": [0]}
+        self._num_workers_default = 0  # Sequential
+        self._worker_type_default = WorkerPool.WORKER_TYPE_THREAD
 
         # Perform setup for this plug-in
         self.setup()
@@ -154,9 +158,11 @@ class Plugin(IAlgorithm):
         )
 
         # Retrieve the input parameters defined in the input schema and store them
+        # Optional input arguments which are not provided are not stored, and the default values are used
         self._input_arguments = dict()
         for key in self._input_schema.get("properties").keys():
-            self._input_arguments.update({key: kwargs.get(key)})
+            if kwargs.get(key) is not None:
+                self._input_arguments.update({key: kwargs.get(key)})
 
         # Perform validation on input argument schema
         if not validate_json(self._input_arguments, self._input_schema):
@@ -333,8 +339,45 @@ class Plugin(IAlgorithm):
         # Update progress (For 100% completion)
         self._progress_inst.update(1)
 
+    @staticmethod
+    def _compute_ale_feature(
+        data: pd.DataFrame,
+        model_instance: Union[IModel, IPipeline],
+        data_labels: List,
+        feature_name: str,
+        bins: Union[List, None],
+    ) -> pd.DataFrame:
+        """
+        A helper method to compute the ALE for the given feature in a worker
+
+        Args:
+            data (pandas.DataFrame): Data without ground truth column that can be passed to the model for prediction
+            model_instance (Union[IModel, IPipeline]): The model to predict with
+            data_labels (List): List of data labels
+            feature_name (str): Feature name
+            bins (Union[List, None]): List of feature values at the percentile for continuous feature,
+            or None for discrete feature
+
+        Returns:
+            pandas.DataFrame: A pandas dataframe that contains value of the feature, the size of the sample and
+            the accumulated effect around this value
+        """
+        if bins is None:
+            return Plugin._compute_ale_discrete(
+                data, model_instance, data_labels, feature_name
+            )
+        else:
+            return Plugin._compute_ale_continuous(
+                data, model_instance, data_labels, feature_name, bins
+            )
+
+    @staticmethod
     def _compute_ale_continuous(
-        self, data: pd.DataFrame, data_features: List, feature_name: str, bins: List
+        data: pd.DataFrame,
+        model_instance: Union[IModel, IPipeline],
+        data_labels: List,
+        feature_name: str,
+        bins: List,
     ) -> pd.DataFrame:
         """
         A helper method to compute the ALE for continuous values
@@ -349,7 +392,8 @@ class Plugin(IAlgorithm):
 
         Args:
             data (pandas.DataFrame): Data without ground truth column that can be passed ot the model for prediction
-            data_features (List): Data features
+            model_instance (Union[IModel, IPipeline]): The model to predict with
+            data_labels (List): List of data labels
             feature_name (str): Feature name
             bins (List): List of feature values at the percentile that was computed to divide
 
@@ -366,7 +410,6 @@ class Plugin(IAlgorithm):
 
         z_lower = data.copy()
         z_higher = data.copy()
-        dict_items_labels = self._data_instance.read_labels().items()
 
         # ALE computes the difference in the predictions of the lower interval and upper interval
         # left is the lower interval, Right is the upper interval
@@ -375,19 +418,11 @@ class Plugin(IAlgorithm):
 
         # with the data points replaced with the intervals
         # now we can run the predictions for both intervals
-        prediction_lower_bound = self._model_instance.predict(
-            [z_lower], dict_items_labels
-        )
-        prediction_higher_bound = self._model_instance.predict(
-            [z_higher], dict_items_labels
-        )
+        prediction_lower_bound = model_instance.predict([z_lower], data_labels)
+        prediction_higher_bound = model_instance.predict([z_higher], data_labels)
 
-        prediction_lower_bound = np.array(
-            [eval(str(i)) for i in prediction_lower_bound]
-        )
-        prediction_higher_bound = np.array(
-            [eval(str(i)) for i in prediction_higher_bound]
-        )
+        prediction_lower_bound = normalize_predictions(prediction_lower_bound)
+        prediction_higher_bound = normalize_predictions(prediction_higher_bound)
 
         # collect the unique bin values, so we can do a mean prediction later within the intervals
         results[feature_name] = [bins[b + 1] for b in feat_bins.cat.codes]
@@ -455,8 +490,12 @@ class Plugin(IAlgorithm):
 
         return results
 
+    @staticmethod
     def _compute_ale_discrete(
-        self, data: pd.DataFrame, data_features: List, feature_name: str
+        data: pd.DataFrame,
+        model_instance: Union[IModel, IPipeline],
+        data_labels: List,
+        feature_name: str,
     ) -> pd.DataFrame:
         """
         A helper method to compute the ALE for numeric discrete feature
@@ -470,7 +509,8 @@ class Plugin(IAlgorithm):
 
         Args:
             data (pandas.DataFrame): Data without ground truth column that can be passed to the model for prediction
-            data_features (List): Data features
+            model_instance (Union[IModel, IPipeline]): The model to predict with
+            data_labels (List): List of data labels
             feature_name (str): Feature name
 
         Returns:
@@ -506,20 +546,18 @@ class Plugin(IAlgorithm):
             feature_codes[data_remove_first_group] - 1
         ]
 
-        dict_items_labels = self._data_instance.read_labels().items()
-
         # runs prediction on both replaced dataset
-        z_upper_prediction = self._model_instance.predict(
-            [z_upper[data_remove_last_group]], dict_items_labels
+        z_upper_prediction = model_instance.predict(
+            [z_upper[data_remove_last_group]], data_labels
         )
-        z_lower_prediction = self._model_instance.predict(
-            [z_lower[data_remove_first_group]], dict_items_labels
+        z_lower_prediction = model_instance.predict(
+            [z_lower[data_remove_first_group]], data_labels
         )
-        z = self._model_instance.predict([data], dict_items_labels)
+        z = model_instance.predict([data], data_labels)
 
-        z_upper_prediction = np.array([eval(str(i)) for i in z_upper_prediction])
-        z_lower_prediction = np.array([eval(str(i)) for i in z_lower_prediction])
-        z = np.array([eval(str(i)) for i in z])
+        z_upper_prediction = normalize_predictions(z_upper_prediction)
+        z_lower_prediction = normalize_predictions(z_lower_prediction)
+        z = normalize_predictions(z)
         # calculate the mean prediction difference
         upper_diff = z_upper_prediction - z[data_remove_last_group]
         lower_diff = z[data_remove_first_group] - z_lower_prediction
@@ -595,12 +633,15 @@ class Plugin(IAlgorithm):
         https://github.com/DanaJomar/PyALE/blob/3c0a47d7cf58635e7c7a940e90f2fa62e0599c8c/PyALE/_src/ALE_1D.py#L76
         """
         if self._data_instance.get_data_plugin_type() is DataPluginType.PANDAS:
-            # Declarations
-            output_results = list()
-
             # Extract required arguments values
             discrete_threshold = 25
             grid_resolution = 25
+            num_workers = self._input_arguments.get(
+                "num_workers", self._num_workers_default
+            )
+            worker_type = self._input_arguments.get(
+                "worker_type", self._worker_type_default
+            )
 
             # Remove ground_truth target value from the data
             data_no_ground_truth = self._data.copy()
@@ -612,15 +653,14 @@ class Plugin(IAlgorithm):
             # Compute ALE
             # Update the progress total value
             self._progress_inst.add_total(len(data_features))
+            list_of_feature_arguments = list()
             for index in range(len(data_features)):
                 feature = data_features[index]
                 unique_values = np.unique(data_no_ground_truth_np[:, index])
 
                 if len(unique_values) < discrete_threshold:
                     # Perform ALE Discrete computation
-                    results = self._compute_ale_discrete(
-                        data_no_ground_truth, data_features, feature
-                    )
+                    bins = None
                 else:
                     # Perform ALE Continuous computation
                     # Generate the percentile based on the grid_resolution given by user
@@ -634,15 +674,20 @@ class Plugin(IAlgorithm):
                             )
                         )
                     )
-                    results = self._compute_ale_continuous(
-                        data_no_ground_truth, data_features, feature, bins
-                    )
-
-                # Add results to list
-                output_results.append(results)
-
-                # Update the progress
-                self._progress_inst.update(1)
+                list_of_feature_arguments.append((feature, bins))
+
+            # Compute the features with the workers, and add results to list in the order of the features
+            # The data labels are in a list to be sent to the worker processes
+            data_labels = list(self._data_instance.read_labels().items())
+            output_results = WorkerPool.run(
+                Plugin._compute_ale_feature,
+                data_no_ground_truth,
+                (self._model_instance, data_labels),
+                list_of_feature_arguments,
+                num_workers,
+                worker_type,
+                lambda _: self._progress_inst.update(1),
+            )
 
             # Format the output results
             output_results = self._format_result(output_results)
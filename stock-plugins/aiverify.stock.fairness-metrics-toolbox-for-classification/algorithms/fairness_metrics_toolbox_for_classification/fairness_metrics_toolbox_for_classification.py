@@ -4,7 +4,6 @@ from pathlib import Path, PurePath
 from typing import Dict, List, Tuple, Union
 
 import numpy as np
-from sklearn.metrics import confusion_matrix
 from test_engine_core.interfaces.ialgorithm import IAlgorithm
 from test_engine_core.interfaces.idata import IData
 from test_engine_core.interfaces.imodel import IModel
@@ -16,6 +15,7 @@ from test_engine_core.plugins.enums.plugin_type import PluginType
 from test_engine_core.plugins.enums.serializer_plugin_type import SerializerPluginType
 from test_engine_core.plugins.metadata.plugin_metadata import PluginMetadata
 from test_engine_core.utils.json_utils import load_schema_file, validate_json
+from test_engine_core.utils.prediction_utils import normalize_predictions
 from test_engine_core.utils.simple_progress import SimpleProgress
 
 
@@ -482,7 +482,91 @@ class Plugin(IAlgorithm):
         # list of tuple of labels to be passed into predict()
         dict_items_labels = self._data_instance.read_labels().items()
         predicted_data = self._model.predict([self._data], dict_items_labels)
-        return [eval(str(i)) for i in predicted_data]
+        return normalize_predictions(predicted_data)
+
+    def _compute_group_confusion_matrices(
+        self,
+        data_ground_truth_np: np.ndarray,
+        data_predicted: np.ndarray,
+        sensitive_feature_np: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        A helper method to compute the confusion matrices of all the groups with a single count.
+        Each row is encoded with its group id, and its true and predicted class indexes, so that the
+        confusion matrices are counted together instead of filtering the rows of each group and class.
+
+        Args:
+            data_ground_truth_np (np.ndarray): The ground truth data in a numpy array
+            data_predicted (np.ndarray): The predicted data in a numpy array
+            sensitive_feature_np (np.ndarray): The sensitive features in a numpy array
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: The unique groups, the sorted labels of the classes,
+            and the confusion matrices of the groups (group, true class, predicted class)
+        """
+        # Encode each sensitive feature, and then the combinations of the sensitive features into group ids
+        list_of_feature_codes = list()
+        for feature_values in sensitive_feature_np.reshape(
+            len(sensitive_feature_np), -1
+        ).T:
+            try:
+                _, feature_codes = np.unique(feature_values, return_inverse=True)
+            except TypeError:
+                # Values of different types cannot be sorted
+                _, feature_codes = np.unique(
+                    feature_values.astype(str), return_inverse=True
+                )
+            list_of_feature_codes.append(feature_codes)
+        _, group_first_indexes, group_ids = np.unique(
+            np.column_stack(list_of_feature_codes),
+            axis=0,
+            return_index=True,
+            return_inverse=True,
+        )
+        unique_groups = np.vstack(
+            [tuple(e) for e in sensitive_feature_np[group_first_indexes]]
+        )
+
+        # Encode the true and predicted classes with the sorted labels of both
+        labels = np.unique(np.concatenate((data_ground_truth_np, data_predicted)))
+        true_indexes = np.searchsorted(labels, data_ground_truth_np)
+        predicted_indexes = np.searchsorted(labels, data_predicted)
+
+        number_of_groups = len(unique_groups)
+        number_of_labels = len(labels)
+        group_confusion_matrices = np.bincount(
+            (group_ids * number_of_labels + true_indexes) * number_of_labels
+            + predicted_indexes,
+            minlength=number_of_groups * number_of_labels * number_of_labels,
+        ).reshape(number_of_groups, number_of_labels, number_of_labels)
+
+        return unique_groups, labels, group_confusion_matrices
+
+    @staticmethod
+    def _compute_group_counts(
+        group_confusion_matrices: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        A helper method to compute the TP, FP, FN, TN of each group and class from the confusion matrices
+        of the groups, with the rows of group and columns of class
+
+        Args:
+            group_confusion_matrices (np.ndarray): The confusion matrices of the groups
+            (group, true class, predicted class)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: The TP, FP, FN, TN of each group and class
+        """
+        group_tp = np.diagonal(group_confusion_matrices, axis1=1, axis2=2)
+        group_fp = group_confusion_matrices.sum(axis=1) - group_tp
+        group_fn = group_confusion_matrices.sum(axis=2) - group_tp
+        group_tn = (
+            group_confusion_matrices.sum(axis=(1, 2))[:, np.newaxis]
+            - group_tp
+            - group_fp
+            - group_fn
+        )
+        return group_tp, group_fp, group_fn, group_tn
 
     def _compute_between_group(
         self,
@@ -502,13 +586,24 @@ class Plugin(IAlgorithm):
             dict: The computed results in a dict
         """
 
-        cm = confusion_matrix(data_ground_truth_np, data_predicted)
+        # Compute the confusion matrices of all the groups in a single pass
+        (
+            unique_groups,
+            labels,
+            group_confusion_matrices,
+        ) = self._compute_group_confusion_matrices(
+            data_ground_truth_np, data_predicted, sensitive_feature_np
+        )
+        cm = group_confusion_matrices.sum(axis=0)
         FP = cm.sum(axis=0) - np.diag(cm)  # vertical as the TP minus the TP
         FN = cm.sum(axis=1) - np.diag(cm)  # same row as the TP minus the TP
         TP = np.diag(cm)  # diagonals
         TN = cm[:].sum() - (FP + FN + TP)  # all the others
 
-        unique_groups = np.vstack({tuple(e) for e in sensitive_feature_np})
+        group_tp, group_fp, group_fn, group_tn = self._compute_group_counts(
+            group_confusion_matrices
+        )
+
         results = dict()
         # initiate a second dictionary for intermediate results necessary for computation of disparate impact and
         # equal parity
@@ -516,72 +611,33 @@ class Plugin(IAlgorithm):
         # number_of_class = len(np.unique(data_ground_truth_np))
         output_classes = np.unique(data_ground_truth_np)
 
-        number_of_unique_groups = len(unique_groups)
-        number_of_output_classes = len(output_classes)
-        total_number_of_iterations = number_of_unique_groups * number_of_output_classes
-
         # Update the progress total value
-        self._progress_inst.add_total(total_number_of_iterations)
+        self._progress_inst.add_total(len(output_classes))
         for output_class in output_classes:
             self.add_to_log(
                 logging.INFO,
                 f"\nComputing the TP, FP, FN, TN based on the output class {output_class}",
             )
+            class_index = np.searchsorted(labels, output_class)
 
-            num_false_negative_by_class = FN[output_class]
-            num_true_positive_by_class = TP[output_class]
-            num_true_negative_by_class = TN[output_class]
-            num_false_positive_by_class = FP[output_class]
-
-            tp_condition_A = data_ground_truth_np == output_class
-            tp_condition_B = data_predicted == output_class
-            true_positive = np.logical_and(tp_condition_A, tp_condition_B)
-
-            fp_condition_A = data_ground_truth_np != output_class
-            fp_condition_B = data_predicted == output_class
-            false_positive = np.logical_and(fp_condition_A, fp_condition_B)
-
-            fn_condition_A = data_ground_truth_np == output_class
-            fn_condition_B = data_predicted != output_class
-            false_negative = np.logical_and(fn_condition_A, fn_condition_B)
-
-            tn_condition_A = data_ground_truth_np != output_class
-            tn_condition_B = data_predicted != output_class
-            true_negative = np.logical_and(tn_condition_A, tn_condition_B)
+            num_false_negative_by_class = FN[class_index]
+            num_true_positive_by_class = TP[class_index]
+            num_true_negative_by_class = TN[class_index]
+            num_false_positive_by_class = FP[class_index]
 
             # start tracking this for disparate impact
             lowest_group_tp_fp, highest_group_tp_fp = 0, 0
 
-            for unique_group in unique_groups:
+            for group_index, unique_group in enumerate(unique_groups):
                 self.add_to_log(
                     logging.INFO, f"Processing for group with value {unique_group}"
                 )
-                """
-                Identify the datapoints that are relevant in this group [For example, we are finding all the
-                females in the group]
-                Mock an array where the rows satisfied the group condition
-                For example, given this array: [[0 1], [1 0], [1 1], [0 1], [1 2] ,[1 1] ,[1 0] ,[1 2] ,[0 2] ,[1 2]]
-                we are looking for position with [0, 1]. In the above array, index 0 and index 3 are True.
-                Using tmp = (group == [0, 1]) returns us [[True, True], [False, False], [False, True], [True, True]....]
-                np.where(np.all(tmp, axis=1), True, False) returns us [True, False, False, True, ...] that becomes
-                our positional condition for this group
-                """
-                tmp = sensitive_feature_np == unique_group
-                group_with_cond = np.where(
-                    np.all(tmp, axis=1), True, False
-                )  # find the rows that are all true based on tmp
-
-                # This allows us to find the location in the array that is tp, fn, fp, tn respectively
-                num_tp_by_group = np.logical_and(group_with_cond, true_positive)
-                num_fn_by_group = np.logical_and(group_with_cond, false_negative)
-                num_fp_by_group = np.logical_and(group_with_cond, false_positive)
-                num_tn_by_group = np.logical_and(group_with_cond, true_negative)
-
-                # Compute the number of tp, tn, fp, fn for this group
-                tp_by_group = len(np.where(num_tp_by_group)[0])
-                tn_by_group = len(np.where(num_tn_by_group)[0])
-                fp_by_group = len(np.where(num_fp_by_group)[0])
-                fn_by_group = len(np.where(num_fn_by_group)[0])
+
+                # Get the number of tp, tn, fp, fn for this group
+                tp_by_group = int(group_tp[group_index, class_index])
+                tn_by_group = int(group_tn[group_index, class_index])
+                fp_by_group = int(group_fp[group_index, class_index])
+                fn_by_group = int(group_fn[group_index, class_index])
 
                 tp_fp = tp_by_group + fp_by_group
 
@@ -2,6 +2,7 @@ import json
 import logging
 from pathlib import Path
 
+import numpy as np
 import pytest
 from fairness_metrics_toolbox_for_classification import Plugin
 from test_engine_core.interfaces.idata import IData
@@ -499,3 +500,54 @@ def test_valid_run(get_data_instance_and_serializer_without_ground_truth):
     f.close()
 
     assert results == sample_data
+
+
+def test_compute_group_confusion_matrices():
+    test_object = TestObject()
+    test_plugin = Plugin(
+        test_object._data_instance_and_serializer,
+        test_object._model_instance_and_serializer,
+        test_object._ground_truth_instance_and_serializer,
+        test_object._data_instance_and_serializer[0],
+        test_object._model_instance_and_serializer[0],
+        **test_object._input_args,
+    )
+
+    # The group ("M", "A") has no rows for class 2
+    sensitive_feature_np = np.array(
+        [
+            ["F", "A"],
+            ["F", "A"],
+            ["F", "A"],
+            ["M", "A"],
+            ["M", "A"],
+            ["M", "B"],
+            ["M", "B"],
+            ["F", "A"],
+        ]
+    )
+    data_ground_truth_np = np.array([0, 1, 2, 0, 0, 1, 2, 2])
+    data_predicted = np.array([0, 2, 2, 1, 0, 1, 1, 2])
+
+    (
+        unique_groups,
+        labels,
+        group_confusion_matrices,
+    ) = test_plugin._compute_group_confusion_matrices(
+        data_ground_truth_np, data_predicted, sensitive_feature_np
+    )
+    assert unique_groups.tolist() == [["F", "A"], ["M", "A"], ["M", "B"]]
+    assert labels.tolist() == [0, 1, 2]
+    assert group_confusion_matrices.tolist() == [
+        [[1, 0, 0], [0, 0, 1], [0, 0, 2]],
+        [[1, 1, 0], [0, 0, 0], [0, 0, 0]],
+        [[0, 0, 0], [0, 1, 0], [0, 1, 0]],
+    ]
+
+    group_tp, group_fp, group_fn, group_tn = test_plugin._compute_group_counts(
+        group_confusion_matrices
+    )
+    assert group_tp.tolist() == [[1, 0, 2], [1, 0, 0], [0, 1, 0]]
+    assert group_fp.tolist() == [[0, 0, 1], [0, 1, 0], [0, 1, 0]]
+    assert group_fn.tolist() == [[0, 1, 0], [1, 0, 0], [0, 0, 1]]
+    assert group_tn.tolist() == [[3, 3, 1], [0, 1, 2], [2, 0, 1]]
@@ -1,3 +1,4 @@
+import io
 import logging
 import pickle
 import shutil
@@ -19,6 +20,7 @@ from test_engine_core.plugins.enums.plugin_type import PluginType
 from test_engine_core.plugins.metadata.plugin_metadata import PluginMetadata
 from test_engine_core.utils.json_utils import load_schema_file, validate_json
 from test_engine_core.utils.simple_progress import SimpleProgress
+from test_engine_core.utils.worker_pool import WorkerPool
 from utils import blur
 
 
@@ -142,6 +144,9 @@ class Plugin(IAlgorithm):
         self._ordered_ground_truth = None
         self._tmp_path = self._base_path / "temp"
         self._save_path = self._base_path.parents[1] / "widgets" / "blur_images"
+        self._in_memory_default = False
+        self._num_workers_default = 0  # Sequential
+        self._chunk_size = 16  # Number of images in each work unit of the workers
 
         # Algorithm input schema defined in input.schema.json
         # By defining the input schema, it allows the front-end to know what algorithm input params is
@@ -158,9 +163,11 @@ class Plugin(IAlgorithm):
         )
 
         # Retrieve the input parameters defined in the input schema and store them
+        # Optional input arguments which are not provided are not stored, and the default values are used
         self._input_arguments = dict()
         for key in self._input_schema.get("properties").keys():
-            self._input_arguments.update({key: kwargs.get(key)})
+            if kwargs.get(key) is not None:
+                self._input_arguments.update({key: kwargs.get(key)})
 
         # Perform validation on input argument schema
         if not validate_json(self._input_arguments, self._input_schema):
@@ -345,12 +352,12 @@ class Plugin(IAlgorithm):
 
         blur_corruptions = OrderedDict(
             {
-                "Gaussian_Blur": blur.gaussian_blur,
-                "Glass_Blur": blur.glass_blur,
-                "Defocus_Blur": blur.defocus_blur,
-                "Horizontal_Motion_Blur": blur.horizontal_motion_blur,
-                "Vertical_Motion_Blur": blur.vertical_motion_blur,
-                "Zoom_Blur": blur.zoom_blur,
+                "Gaussian_Blur": blur.gaussian_blur_batch,
+                "Glass_Blur": blur.glass_blur_batch,
+                "Defocus_Blur": blur.defocus_blur_batch,
+                "Horizontal_Motion_Blur": blur.horizontal_motion_blur_batch,
+                "Vertical_Motion_Blur": blur.vertical_motion_blur_batch,
+                "Zoom_Blur": blur.zoom_blur_batch,
             }
         )
 
@@ -389,10 +396,13 @@ class Plugin(IAlgorithm):
         seed = self._input_arguments.get("set_seed")
         np.random.seed(seed)
         random_index = np.random.choice(len(image_df))
+        num_workers = self._input_arguments.get(
+            "num_workers", self._num_workers_default
+        )
 
         self._progress_inst.add_total(len(corruption_group))
 
-        for corruption in corruption_group:
+        for corruption_index, corruption in enumerate(corruption_group):
             individual_results = dict()
             accuracies = dict()
             display_info = dict()
@@ -401,22 +411,41 @@ class Plugin(IAlgorithm):
             corruption_fn = corruption_group[corruption]
             individual_results.update({"corruption_function": str(corruption)})
 
+            # generate the corrupted images of all the severities with the workers
+            corrupted_images = dict()
+            if num_workers > 1:
+                corrupted_images = self._generate_corrupted_images(
+                    image_df,
+                    corruption_fn,
+                    corruption_index,
+                    severities,
+                    seed,
+                    num_workers,
+                )
+
             # updating model accuracies using corrupted test dataset
             for i in severities:
                 fn_params = i
                 if i != 0:
                     corrupted_df = self._build_corrupted_dataframe(
-                        image_df, ground_truth, corruption_fn, fn_params, corruption
+                        image_df,
+                        ground_truth,
+                        corruption_fn,
+                        fn_params,
+                        corruption,
+                        corrupted_images.get(i),
                     )
                 else:
                     corrupted_df = self._build_corrupted_dataframe(
                         image_df, ground_truth, None, fn_params, corruption
                     )
-                accuracy = self._get_accuracy(corrupted_df, ground_truth)
+                # the predictions are used for both the accuracy and the display
+                predictions = self._model.predict(corrupted_df)
+                accuracy = self._get_accuracy(predictions, ground_truth)
                 accuracies.update({"severity" + str(i): accuracy})
 
                 random_display = self._get_rand_display(
-                    corrupted_df, ground_truth, corruption, i, random_index
+                    corrupted_df, predictions, ground_truth, corruption, i, random_index
                 )
                 display_info.update({"severity" + str(i): random_display})
 
@@ -452,18 +481,17 @@ class Plugin(IAlgorithm):
         image_df = pd.Series(list(images), name="images")
         return image_df, image_shapes
 
-    def _get_accuracy(self, images: pd.Series, labels: pd.Series) -> np.float64:
+    def _get_accuracy(self, predictions: np.ndarray, labels: pd.Series) -> np.float64:
         """
         A method to return the accuracy of the model with the corrupted set of inputs
 
         Args:
-            images (dataframe): pandas Series containing column with array of all corrupted images
+            predictions (np.ndarray): predictions of the model on all the corrupted images
             labels (dataframe): pandas Series containing column with ground truths
 
         Returns:
             np.float64: accuracy score
         """
-        predictions = self._model.predict(images)
         accuracy = accuracy_score(labels, predictions)
 
         return accuracy
@@ -471,6 +499,7 @@ class Plugin(IAlgorithm):
     def _get_rand_display(
         self,
         images: pd.Series,
+        predictions: np.ndarray,
         labels: pd.Series,
         corruption: str,
         severity: np.int64,
@@ -481,6 +510,7 @@ class Plugin(IAlgorithm):
 
         Args:
             image_df (dataframe): pandas Series containing column with array of all corrupted images
+            predictions (np.ndarray): predictions of the model on all the corrupted images
             labels (dataframe): pandas Series containing column with ground truths
             corruption (str): name of the corurption function
             severtity (np.int64): level of severity of perturbation
@@ -489,7 +519,6 @@ class Plugin(IAlgorithm):
         Returns:
             np.float64: accuracy score
         """
-        predictions = self._model.predict(images)
         labels = np.array(labels[self._ground_truth])
 
         random_pred = predictions[index]
@@ -497,6 +526,13 @@ class Plugin(IAlgorithm):
 
         image_name = str(severity) + ".png"
         image_path = images["image_directory"].iloc[index]
+        if isinstance(image_path, io.BytesIO):
+            # only the in-memory image for display is saved
+            image_path = self._save_memory_image(
+                image_path,
+                Path(corruption).joinpath("severity" + str(severity)),
+                index,
+            )
         image_relative_path = str(
             Path(image_path).relative_to(Path(self._base_path.parents[1]))
         )
@@ -516,6 +552,7 @@ class Plugin(IAlgorithm):
         noise_fn: callable,
         severity: int,
         corruption: str,
+        corrupted_images: Union[List, None] = None,
     ) -> pd.DataFrame:
         """
         Build pandas dataframe of corrupted image (array)
@@ -523,31 +560,165 @@ class Plugin(IAlgorithm):
         Args:
             data (Series): Pandas Series containing all the original images
             labels (str): Image column name from input schema
-            noise_fn (callable): Corruption function to be used
+            noise_fn (callable): Batch corruption function to be used
             severity (int): Severity of corruption function
             corruption (str): Name of corruption function
+            corrupted_images (Union[List, None]): Corrupted images generated by the workers. Defaults to None
 
         Returns:
             pd.DataFrame: Corrupted images in pandas DataFrame in col1 and ground truth labels
         """
         corrupted_list = []
-        data_array = np.array(data)
 
-        for index, img in enumerate(data_array):
-            if noise_fn is not None:
-                corrupted_image = noise_fn(img, severity)
-                corrupted_list.append(corrupted_image)
-            else:
-                corrupted_list.append(img)
-        images_df = self._transform_to_dir_df(
-            corrupted_list, Path(corruption).joinpath("severity" + str(severity))
-        )
+        if corrupted_images is not None:
+            corrupted_list = corrupted_images
+        elif noise_fn is not None:
+            # corrupt the images in chunks to limit the memory of the intermediate arrays
+            images = self._stack_images(data)
+            for start in range(0, len(images), self._chunk_size):
+                corrupted_list.extend(
+                    Plugin._apply_noise_fn(
+                        images[start : start + self._chunk_size], noise_fn, severity
+                    )
+                )
+        else:
+            corrupted_list = list(data)
+        if self._input_arguments.get("in_memory", self._in_memory_default):
+            images_df = self._transform_to_memory_df(corrupted_list)
+        else:
+            images_df = self._transform_to_dir_df(
+                corrupted_list, Path(corruption).joinpath("severity" + str(severity))
+            )
 
         corrupted_df = pd.concat(
             [images_df, labels.reset_index(drop=True, inplace=True)], axis=1
         )
         return corrupted_df
 
+    def _generate_corrupted_images(
+        self,
+        data: pd.Series,
+        noise_fn: callable,
+        corruption_index: int,
+        severities: List,
+        seed: int,
+        num_workers: int,
+    ) -> Dict:
+        """
+        A method to generate the corrupted images of all the severities in a pool of worker processes.
+        The images are split into chunks, and each (corruption, severity, chunk) work unit is seeded with
+        a seed derived from the input seed, so that the corrupted images do not depend on the number of workers.
+        The images are placed in shared memory for the workers if they have the same shape.
+
+        Args:
+            data (Series): Pandas Series containing all the original images
+            noise_fn (callable): Batch corruption function to be used
+            corruption_index (int): Index of the corruption function in the corruption group
+            severities (List): List of severities
+            seed (int): Seed from input schema
+            num_workers (int): Number of worker processes
+
+        Returns:
+            Dict: Corrupted images of each severity
+        """
+        images = self._stack_images(data)
+
+        work_units = []
+        for severity in severities:
+            if severity == 0:
+                continue  # original images
+            for chunk_index, start in enumerate(
+                range(0, len(images), self._chunk_size)
+            ):
+                unit_seed = np.random.SeedSequence(
+                    [seed, corruption_index, severity, chunk_index]
+                ).generate_state(1)[0]
+                work_units.append(
+                    (
+                        noise_fn,
+                        severity,
+                        int(unit_seed),
+                        start,
+                        start + self._chunk_size,
+                    )
+                )
+
+        list_of_chunks = WorkerPool.run(
+            Plugin._corrupt_images,
+            images,
+            tuple(),
+            work_units,
+            num_workers,
+            WorkerPool.WORKER_TYPE_PROCESS,
+        )
+
+        corrupted_images = dict()
+        for work_unit, chunk in zip(work_units, list_of_chunks):
+            corrupted_images.setdefault(work_unit[1], []).extend(chunk)
+        return corrupted_images
+
+    @staticmethod
+    def _corrupt_images(
+        images: Union[np.ndarray, List],
+        noise_fn: callable,
+        severity: int,
+        seed: int,
+        start: int,
+        end: int,
+    ) -> List:
+        """
+        A method to corrupt a chunk of the images in a worker process
+
+        Args:
+            images (Union[np.ndarray, List]): All the original images
+            noise_fn (callable): Batch corruption function to be used
+            severity (int): Severity of corruption function
+            seed (int): Seed of this chunk of images
+            start (int): Index of the first image in the chunk
+            end (int): Index after the last image in the chunk
+
+        Returns:
+            List: Corrupted images of the chunk
+        """
+        np.random.seed(seed)
+        return Plugin._apply_noise_fn(images[start:end], noise_fn, severity)
+
+    @staticmethod
+    def _apply_noise_fn(
+        images: Union[np.ndarray, List], noise_fn: callable, severity: int
+    ) -> List:
+        """
+        A method to corrupt the images with the batch corruption function.
+        Stacked images are corrupted together, otherwise each image is corrupted as a batch of one image.
+
+        Args:
+            images (Union[np.ndarray, List]): Stacked images (N, H, W, C) or list of images of different shapes
+            noise_fn (callable): Batch corruption function to be used
+            severity (int): Severity of corruption function
+
+        Returns:
+            List: Corrupted images
+        """
+        if isinstance(images, np.ndarray):
+            return list(noise_fn(images, severity))
+        return [noise_fn(np.array(img)[np.newaxis], severity)[0] for img in images]
+
+    @staticmethod
+    def _stack_images(data: pd.Series) -> Union[np.ndarray, List]:
+        """
+        A method to stack the images into an array (N, H, W, C) if they have the same shape
+
+        Args:
+            data (Series): Pandas Series containing all the original images
+
+        Returns:
+            Union[np.ndarray, List]: Stacked images, or list of images if they have different shapes
+        """
+        images = list(data)
+        if len(images) > 0 and all(img.shape == images[0].shape for img in images):
+            images = np.stack(images)
+        return images
+
     def _transform_to_dir_df(
         self, data_np: np.ndarray, subfolder_name: str
     ) -> pd.DataFrame:
@@ -575,3 +746,45 @@ class Plugin(IAlgorithm):
             pred_dirs.append(str(i))
         pred_dirs_df = pd.DataFrame(pred_dirs, columns=["image_directory"])
         return pred_dirs_df
+
+    def _transform_to_memory_df(self, data_np: np.ndarray) -> pd.DataFrame:
+        """
+        A method to convert images in np.array form into in-memory PNG images for the model pipeline.
+        The in-memory images are in the image directory column, and can be opened by the model pipeline
+        with PIL Image.open in the same way as the image files.
+
+        Args:
+            data_np (np.ndarray): array containing all the images in np.ndarray format
+
+        Returns:
+            pd.DataFrame: In-memory images in pandas dataframe
+        """
+        memory_images = []
+        for img_array in data_np:
+            memory_image = io.BytesIO()
+            Image.fromarray(np.uint8(img_array * 255.0)).save(
+                memory_image, format="PNG", compress_level=1
+            )
+            memory_image.seek(0)
+            memory_images.append(memory_image)
+        return pd.DataFrame({"image_directory": memory_images})
+
+    def _save_memory_image(
+        self, memory_image: io.BytesIO, subfolder_name: str, index: int
+    ) -> str:
+        """
+        A method to save an in-memory image in the same directory as the image files
+
+        Args:
+            memory_image (io.BytesIO): in-memory PNG image
+            subfolder_name (str): name of the subfolder to save the image in
+            index (int): index of the image
+
+        Returns:
+            str: directory of the saved image
+        """
+        Path(str(self._tmp_path / subfolder_name)).mkdir(parents=True, exist_ok=True)
+        image_path = str(self._tmp_path / subfolder_name / (str(index) + ".png"))
+        with open(image_path, "wb") as image_file:
+            image_file.write(memory_image.getvalue())
+        return image_path
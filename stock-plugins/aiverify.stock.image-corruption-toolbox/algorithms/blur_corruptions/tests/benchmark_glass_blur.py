@@ -0,0 +1,88 @@
+import argparse
+import time
+
+import numpy as np
+from skimage.filters import gaussian
+from utils import blur
+
+
+# =====================================================================================
+# Benchmark of glass blur against the reference implementation, which shuffles the pixels
+# in a python loop over every pixel.
+# Run from the blur_corruptions folder: python -m tests.benchmark_glass_blur
+# =====================================================================================
+def reference_glass_blur(img: np.ndarray, severity: int = 1) -> np.ndarray:
+    """
+    Reference glass blur implementation
+    Modified from : https://github.com/hendrycks/robustness/blob/master/ImageNet-C/create_c/make_imagenet_c.py
+    (Apache 2.0)
+
+    Parameters:
+        img (np.ndarray) : Numpy ndarray of original image to be corrupted
+        severity (int) : Level of severity of noise addedd
+
+    Returns:
+        np.ndarray: Numpy ndarray of image with glassblur corruption
+    """
+    severity_constant = [
+        (1.5, 4, 1),
+        (1.8, 4, 3),
+        (2.0, 5, 4),
+        (2.2, 7, 5),
+        (3.0, 8, 6),
+    ][severity - 1]
+    img = np.uint8(gaussian(img, sigma=severity_constant[0], channel_axis=2) * 255)
+    sigma = severity_constant[0]
+    max_delta = severity_constant[1]
+    iterations = severity_constant[2]
+    for i in range(iterations):
+        for h in range(img.shape[0] - max_delta, max_delta, -1):
+            for w in range(img.shape[1] - max_delta, max_delta, -1):
+                dx, dy = np.random.randint(-max_delta, max_delta, size=(2,))
+                h_prime, w_prime = h + dy, w + dx
+                img[h, w], img[h_prime, w_prime] = img[h_prime, w_prime], img[h, w]
+    return np.clip(gaussian(img / 255.0, sigma, channel_axis=2), 0, 1)
+
+
+def run_benchmark(size: int, num_images: int, seed: int) -> None:
+    """
+    A function to time both implementations at each severity and check that their outputs are identical
+
+    Args:
+        size (int): The height and width of the images
+        num_images (int): The number of images for each severity
+        seed (int): The random seed
+    """
+    images = np.random.default_rng(seed).random((num_images, size, size, 3))
+    print(f"Glass blur on {num_images} image(s) of {size}x{size}x3")
+    print(
+        f"{'severity':>8} {'reference (s)':>14} {'glass_blur (s)':>15} {'speedup':>8} {'identical':>10}"
+    )
+    for severity in range(1, 6):
+        np.random.seed(seed)
+        start_time = time.perf_counter()
+        reference_outputs = [reference_glass_blur(img, severity) for img in images]
+        reference_time = time.perf_counter() - start_time
+
+        np.random.seed(seed)
+        start_time = time.perf_counter()
+        outputs = [blur.glass_blur(img, severity) for img in images]
+        new_time = time.perf_counter() - start_time
+
+        identical = all(
+            np.array_equal(reference_output, output)
+            for reference_output, output in zip(reference_outputs, outputs)
+        )
+        print(
+            f"{severity:>8} {reference_time:>14.3f} {new_time:>15.3f} "
+            f"{reference_time / new_time:>7.1f}x {str(identical):>10}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark glass blur")
+    parser.add_argument("--size", type=int, default=224)
+    parser.add_argument("--num_images", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=10)
+    args = parser.parse_args()
+    run_benchmark(args.size, args.num_images, args.seed)
@@ -9,6 +9,7 @@ from test_engine_core.plugins.enums.model_type import ModelType
 from test_engine_core.plugins.enums.plugin_type import PluginType
 from test_engine_core.plugins.metadata.plugin_metadata import PluginMetadata
 from test_engine_core.plugins.plugins_manager import PluginManager
+from test_engine_core.utils.import_modules import LazyModule
 from test_engine_core.utils.json_utils import (
     load_schema_file,
     remove_numpy_formats,
@@ -509,3 +510,37 @@ def test_valid_run(get_data_instance_and_serializer_without_ground_truth):
     )
 
     assert validate_status == True
+
+
+@pytest.mark.parametrize(
+    "get_data_instance_and_serializer_without_ground_truth",
+    [(valid_data_path)],
+    indirect=["get_data_instance_and_serializer_without_ground_truth"],
+)
+def test_valid_run_with_lazy_module_in_worker_processes(
+    get_data_instance_and_serializer_without_ground_truth,
+):
+    # The plugin is imported from its file path as when it is loaded by the test engine
+    lazy_module = LazyModule("blur_corruptions", "blur_corruptions.py")
+    test_object = TestObject()
+    test_object._ground_truth_instance_and_serializer[0].keep_ground_truth(
+        test_object._ground_truth
+    )
+    test_plugin = lazy_module.Plugin(
+        get_data_instance_and_serializer_without_ground_truth,
+        test_object._model_instance_and_serializer,
+        test_object._ground_truth_instance_and_serializer,
+        test_object._data_instance_and_serializer[0],
+        test_object._model_instance_and_serializer[0],
+        num_workers=2,
+        **test_object._input_args,
+    )
+    test_plugin.generate()
+    results = remove_numpy_formats(test_plugin.get_results())
+
+    validate_status = validate_json(
+        results,
+        load_schema_file(str(Path().absolute() / "output.schema.json")),
+    )
+
+    assert validate_status == True
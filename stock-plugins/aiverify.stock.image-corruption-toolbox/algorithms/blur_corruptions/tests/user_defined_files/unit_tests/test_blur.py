@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+from utils import blur
+
+grayscale_shape = (28, 28)
+rgb_shape = (32, 32, 3)
+rgba_shape = (32, 32, 4)
+
+# The image shapes supported by each corruption function
+corruption_shapes = {
+    "gaussian_blur": [grayscale_shape, rgb_shape, rgba_shape],
+    "glass_blur": [grayscale_shape, rgb_shape, rgba_shape],
+    "defocus_blur": [rgb_shape, rgba_shape],
+    "horizontal_motion_blur": [grayscale_shape, rgb_shape, rgba_shape],
+    "vertical_motion_blur": [grayscale_shape, rgb_shape, rgba_shape],
+    "zoom_blur": [rgb_shape, rgba_shape],
+}
+
+
+@pytest.mark.parametrize("severity", [1, 2, 3, 4, 5])
+@pytest.mark.parametrize(
+    "corruption_name, image_shape",
+    [
+        (corruption_name, image_shape)
+        for corruption_name, image_shapes in corruption_shapes.items()
+        for image_shape in image_shapes
+    ],
+)
+def test_batch_same_as_single_image(corruption_name, image_shape, severity):
+    images = np.random.default_rng(0).random((3,) + image_shape)
+    corruption_fn = getattr(blur, corruption_name)
+    corruption_batch_fn = getattr(blur, corruption_name + "_batch")
+
+    np.random.seed(0)
+    expected_images = np.stack([corruption_fn(image, severity) for image in images])
+    np.random.seed(0)
+    corrupted_images = corruption_batch_fn(images, severity)
+
+    assert np.array_equal(corrupted_images, expected_images)
@@ -55,9 +55,25 @@ def gaussian_blur(img: np.ndarray, severity: int = 1) -> np.ndarray:
     Returns:
         np.ndarray: Numpy ndarray of image with Gaussian blur corruption
     """
+    return gaussian_blur_batch(img[np.newaxis], severity)[0]
+
+
+def gaussian_blur_batch(imgs: np.ndarray, severity: int = 1) -> np.ndarray:
+    """
+    Adding gaussian blur to a batch of images of the same shape
+
+    Parameters:
+        imgs (np.ndarray) : Numpy ndarray of original images (N, H, W, C) to be corrupted
+        severity (int) : Level of severity of noise added
+
+    Returns:
+        np.ndarray: Numpy ndarray of images with Gaussian blur corruption
+    """
     severity_constant = [8, 15, 23, 35, 65][severity - 1]
-    img = gaussian(img, sigma=severity_constant, channel_axis=2)
-    return np.clip(img, 0, 1)
+    imgs = gaussian(
+        imgs, sigma=(0, severity_constant, severity_constant), channel_axis=3
+    )
+    return np.clip(imgs, 0, 1)
 
 
 def glass_blur(img: np.ndarray, severity=1) -> np.ndarray:
@@ -73,6 +89,21 @@ def glass_blur(img: np.ndarray, severity=1) -> np.ndarray:
     Returns:
         np.ndarray: Numpy ndarray of image with glassblur corruption
     """
+    return glass_blur_batch(img[np.newaxis], severity)[0]
+
+
+def glass_blur_batch(imgs: np.ndarray, severity=1) -> np.ndarray:
+    """
+    Adding glass blur to a batch of images of the same shape.
+    The pixels of each image are shuffled in the order of the images.
+
+    Parameters:
+        imgs (np.ndarray) : Numpy ndarray of original images (N, H, W, C) to be corrupted
+        severity (int) : Level of severity of noise addedd
+
+    Returns:
+        np.ndarray: Numpy ndarray of images with glassblur corruption
+    """
     # severity_constant = [sigma, max_delta, iterations]
     severity_constant = [
         (1.5, 4, 1),
@@ -81,20 +112,56 @@ def glass_blur(img: np.ndarray, severity=1) -> np.ndarray:
         (2.2, 7, 5),
         (3.0, 8, 6),
     ][severity - 1]
-    img = np.uint8(gaussian(img, sigma=severity_constant[0], channel_axis=2) * 255)
     sigma = severity_constant[0]
     max_delta = severity_constant[1]
     iterations = severity_constant[2]
+    imgs = np.uint8(gaussian(imgs, sigma=(0, sigma, sigma), channel_axis=3) * 255)
     # locally shuffle pixels, iterations depends on the severity level and
+    imgs = np.stack([shuffle_pixels(img, max_delta, iterations) for img in imgs])
+    return np.clip(gaussian(imgs / 255.0, (0, sigma, sigma), channel_axis=3), 0, 1)
+
+
+def shuffle_pixels(img: np.ndarray, max_delta: int, iterations: int) -> np.ndarray:
+    """
+    Locally shuffle the pixels of images for glass blur.
+    The pixels are visited from the bottom right, and each pixel takes the value of a pixel at a random
+    displacement within max_delta, in the same order and with the same random values as the reference
+    implementation. As in the reference implementation, the pixel values are copied and not swapped.
+    The random displacements of each iteration are drawn together, and the source pixel of each pixel is
+    tracked with integer indexes, so that the image is only indexed once at the end.
+
+    Parameters:
+        img (np.ndarray) : Numpy ndarray of image (height, width, channels) to be shuffled
+        max_delta (int) : Maximum displacement of the pixels
+        iterations (int) : Number of times to shuffle the pixels
+
+    Returns:
+        np.ndarray: Numpy ndarray of image with shuffled pixels
+    """
+    height, width = img.shape[0], img.shape[1]
+    rows = np.arange(height - max_delta, max_delta, -1)
+    columns = np.arange(width - max_delta, max_delta, -1)
+    pixel_indexes = (rows[:, np.newaxis] * width + columns[np.newaxis, :]).ravel()
+    if len(pixel_indexes) == 0:
+        return img
+
+    source_indexes = list(range(height * width))
     for i in range(iterations):
-        # height, width = img.shape
-        for h in range(img.shape[0] - max_delta, max_delta, -1):
-            for w in range(img.shape[1] - max_delta, max_delta, -1):
-                dx, dy = np.random.randint(-max_delta, max_delta, size=(2,))
-                h_prime, w_prime = h + dy, w + dx
-                # swap
-                img[h, w], img[h_prime, w_prime] = img[h_prime, w_prime], img[h, w]
-    return np.clip(gaussian(img / 255.0, sigma, channel_axis=2), 0, 1)
+        # dx, dy of each pixel in the order of the pixels
+        displacements = np.random.randint(
+            -max_delta, max_delta, size=(len(pixel_indexes), 2)
+        )
+        displaced_indexes = (
+            pixel_indexes + displacements[:, 1] * width + displacements[:, 0]
+        )
+        for pixel_index, displaced_index in zip(
+            pixel_indexes.tolist(), displaced_indexes.tolist()
+        ):
+            source_indexes[pixel_index] = source_indexes[displaced_index]
+
+    return img.reshape(height * width, *img.shape[2:])[source_indexes].reshape(
+        img.shape
+    )
 
 
 def defocus_blur(img: np.ndarray, severity: int = 1) -> np.ndarray:
@@ -110,19 +177,33 @@ def defocus_blur(img: np.ndarray, severity: int = 1) -> np.ndarray:
     Returns:
         np.ndarray: Numpy ndarray of image with defocus blur corruption
     """
+    return defocus_blur_batch(img[np.newaxis], severity)[0]
+
+
+def defocus_blur_batch(imgs: np.ndarray, severity: int = 1) -> np.ndarray:
+    """
+    Adding defocus to a batch of images of the same shape.
+    The defocus kernel is created once for all the images.
+
+    Parameters:
+        imgs (np.ndarray) : Numpy ndarray of original images (N, H, W, C) to be corrupted
+        severity (int) : Level of severity of noise addedd
+
+    Returns:
+        np.ndarray: Numpy ndarray of images with defocus blur corruption
+    """
     severity_constant = [(9, 0.6), (13, 0.4), (18, 0.3), (25, 0.3), (35, 0.3)][
         severity - 1
     ]
     radius = severity_constant[0]
     alias_blur = severity_constant[1]
     kernel = disk(radius, alias_blur)
-    channels = []
-    two_dim = False
-    for d in range(3):
-        channels.append(cv2.filter2D(img[:, :, d], -1, kernel))
-    channels = np.array(channels).transpose((1, 2, 0))
-    if two_dim:
-        channels = cv2.cvtColor(channels, cv2.COLOR_RGB2GRAY)
+    channels = np.stack(
+        [
+            np.stack([cv2.filter2D(img[:, :, d], -1, kernel) for d in range(3)], axis=2)
+            for img in imgs
+        ]
+    )
     return np.clip(channels, 0, 1)
 
 
@@ -138,25 +219,26 @@ def horizontal_motion_blur(img: np.ndarray, severity: int = 1) -> np.ndarray:
     Returns:
         np.ndarray: Numpy ndarray of the image perturbed by the blur
     """
+    return horizontal_motion_blur_batch(img[np.newaxis], severity)[0]
+
+
+def horizontal_motion_blur_batch(imgs: np.ndarray, severity: int = 1) -> np.ndarray:
+    """
+    Perform the horizontal motion blur effect on a batch of images of the same shape.
+
+    Args:
+        imgs (np.ndarray) : Numpy ndarray of original images (N, H, W, C) to be corrupted
+        severity (int) : Level of severity of noise addedd
+
+    Returns:
+        np.ndarray: Numpy ndarray of the images perturbed by the blur
+    """
     severity_constant = [25, 40, 60, 95, 200][severity - 1]
-    img = img * 255.0
-    two = False
-    if img.ndim == 2:
-        two = True
-        img = np.expand_dims(img, axis=2)
-    img = img[:, :, ::-1].copy()
     # generating the kernel
     kernel_motion_blur = np.zeros((severity_constant, severity_constant))
     kernel_motion_blur[int((severity_constant - 1) / 2), :] = np.ones(severity_constant)
     kernel_motion_blur = kernel_motion_blur / severity_constant
-
-    # applying the kernel to the input image
-    output = cv2.filter2D(img, -1, kernel_motion_blur)
-    output = cv2.cvtColor(output.astype(np.uint8), cv2.COLOR_BGR2RGB)
-    if two:
-        test = np.squeeze(output, axis=2)
-
-    return output / 255.0
+    return motion_blur_batch(imgs, kernel_motion_blur)
 
 
 def vertical_motion_blur(img: np.ndarray, severity: int = 1) -> np.ndarray:
@@ -171,18 +253,47 @@ def vertical_motion_blur(img: np.ndarray, severity: int = 1) -> np.ndarray:
     Returns:
         np.ndarray: Numpy ndarray of the image perturbed by the blur
     """
+    return vertical_motion_blur_batch(img[np.newaxis], severity)[0]
+
+
+def vertical_motion_blur_batch(imgs: np.ndarray, severity: int = 1) -> np.ndarray:
+    """
+    Perform the vertical motion blur effect on a batch of images of the same shape.
+
+    Args:
+        imgs (np.ndarray) : Numpy ndarray of original images (N, H, W, C) to be corrupted
+        severity (int) : Level of severity of noise addedd
+
+    Returns:
+        np.ndarray: Numpy ndarray of the images perturbed by the blur
+    """
     severity_constant = [25, 40, 55, 85, 145][severity - 1]
-    img = img * 255.0
-    img = img[:, :, ::-1].copy()
     # generating the kernel
     kernel_motion_blur = np.zeros((severity_constant, severity_constant))
     kernel_motion_blur[:, int((severity_constant - 1) / 2)] = np.ones(severity_constant)
     kernel_motion_blur = kernel_motion_blur / severity_constant
+    return motion_blur_batch(imgs, kernel_motion_blur)
+
+
+def motion_blur_batch(imgs: np.ndarray, kernel: np.ndarray) -> np.ndarray:
+    """
+    Apply the motion blur kernel to a batch of images of the same shape
 
-    # applying the kernel to the input image
-    output = cv2.filter2D(img, -1, kernel_motion_blur)
-    output = cv2.cvtColor(output.astype(np.uint8), cv2.COLOR_BGR2RGB)
-    return output / 255.0
+    Args:
+        imgs (np.ndarray) : Numpy ndarray of original images (N, H, W, C) to be corrupted
+        kernel (np.ndarray) : Motion blur kernel
+
+    Returns:
+        np.ndarray: Numpy ndarray of the images perturbed by the blur
+    """
+    imgs = imgs * 255.0
+    imgs = imgs[..., ::-1]
+    outputs = []
+    for img in imgs:
+        # applying the kernel to the input image
+        output = cv2.filter2D(img.copy(), -1, kernel)
+        outputs.append(cv2.cvtColor(output.astype(np.uint8), cv2.COLOR_BGR2RGB))
+    return np.stack(outputs) / 255.0
 
 
 def zoom_blur(img: np.ndarray, severity: int = 1) -> np.ndarray:
@@ -198,6 +309,20 @@ def zoom_blur(img: np.ndarray, severity: int = 1) -> np.ndarray:
     Returns:
         np.ndarray: Numpy ndarray of the image with zoom blur corruption
     """
+    return zoom_blur_batch(img[np.newaxis], severity)[0]
+
+
+def zoom_blur_batch(imgs: np.ndarray, severity: int = 1) -> np.ndarray:
+    """
+    Adding blur caused by zooming to a batch of images of the same shape
+
+    Parameters:
+        imgs (np.ndarray) : Numpy ndarray of original images (N, H, W, C) to be corrupted
+        severity (int) : Level of severity of noise addedd
+
+    Returns:
+        np.ndarray: Numpy ndarray of the images with zoom blur corruption
+    """
     severity_constant = [
         np.arange(1, 1.16, 0.01),
         np.arange(1, 1.26, 0.01),
@@ -205,8 +330,12 @@ def zoom_blur(img: np.ndarray, severity: int = 1) -> np.ndarray:
         np.arange(1, 1.66, 0.02),
         np.arange(1, 2.4, 0.03),
     ][severity - 1]
-    out = np.zeros_like(img)
+    # stack the images along the channels to zoom all the images together
+    num_images, height, width, channels = imgs.shape
+    imgs = imgs.transpose((1, 2, 0, 3)).reshape(height, width, num_images * channels)
+    out = np.zeros_like(imgs)
     for zoom_factor in severity_constant:
-        out += clipped_zoom(img, zoom_factor)
-    img = (img + out) / (len(severity_constant) + 1)
-    return np.clip(img, 0, 1)
+        out += clipped_zoom(imgs, zoom_factor)
+    imgs = (imgs + out) / (len(severity_constant) + 1)
+    imgs = imgs.reshape(height, width, num_images, channels).transpose((2, 0, 1, 3))
+    return np.clip(imgs, 0, 1)
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+from utils import digital
+
+grayscale_shape = (28, 28)
+rgb_shape = (32, 32, 3)
+rgba_shape = (32, 32, 4)
+
+# The image shapes supported by each corruption function
+corruption_shapes = {
+    "brightness_down_mapping": [grayscale_shape, rgb_shape, rgba_shape],
+    "brightness_up_mapping": [grayscale_shape, rgb_shape, rgba_shape],
+    "contrast_down_mapping": [grayscale_shape, rgb_shape, rgba_shape],
+    "contrast_up_mapping": [grayscale_shape, rgb_shape, rgba_shape],
+    "saturate": [rgb_shape],
+    "tilt_mapping": [grayscale_shape, rgb_shape, rgba_shape],
+    "jpeg_compression": [grayscale_shape, rgb_shape],
+}
+
+
+@pytest.mark.parametrize("severity", [1, 2, 3, 4, 5])
+@pytest.mark.parametrize(
+    "corruption_name, image_shape",
+    [
+        (corruption_name, image_shape)
+        for corruption_name, image_shapes in corruption_shapes.items()
+        for image_shape in image_shapes
+    ],
+)
+def test_batch_same_as_single_image(corruption_name, image_shape, severity):
+    images = np.random.default_rng(0).random((3,) + image_shape)
+    corruption_fn = getattr(digital, corruption_name)
+    corruption_batch_fn = getattr(digital, corruption_name + "_batch")
+
+    np.random.seed(0)
+    expected_images = np.stack([corruption_fn(image, severity) for image in images])
+    np.random.seed(0)
+    corrupted_images = corruption_batch_fn(images, severity)
+
+    assert np.array_equal(corrupted_images, expected_images)
@@ -3,7 +3,7 @@ from io import BytesIO
 import numpy as np
 import PIL
 import skimage as sk
-from PIL import Image, ImageEnhance
+from PIL import Image
 
 
 def brightness_down_mapping(img, severity):
@@ -18,11 +18,24 @@ def brightness_down_mapping(img, severity):
     Returns:
         ndarry: the Image perturbed by brightness down
     """
+    return brightness_down_mapping_batch(img[np.newaxis], severity)[0]
+
+
+def brightness_down_mapping_batch(imgs, severity):
+    """
+    Perform the brightness down effect on a batch of images of the same shape.
+
+    Args:
+        imgs (ndarray): Batch of images (N, H, W, C) to perturb
+        severity (int): severity level of corruption
+
+    Returns:
+        ndarry: the batch of images perturbed by brightness down
+    """
     severity_constant = [1.8, 2.6, 3, 4.5, 5.5][severity - 1]
     noisy_factor = 1 / severity_constant
-    img = PIL.Image.fromarray(np.uint8(img * 255.0))
-    img_b = ImageEnhance.Brightness(img).enhance(noisy_factor)
-    return np.array(img_b) / 255.0
+    imgs = np.uint8(imgs * 255.0)
+    return enhance_batch(imgs, np.float32(0), noisy_factor) / 255.0
 
 
 def brightness_up_mapping(img, severity):
@@ -37,11 +50,24 @@ def brightness_up_mapping(img, severity):
     Returns:
         ndarry: the Image perturbed by brightness up
     """
+    return brightness_up_mapping_batch(img[np.newaxis], severity)[0]
+
+
+def brightness_up_mapping_batch(imgs, severity):
+    """
+    Perform the brightness up effect on a batch of images of the same shape.
+
+    Args:
+        imgs (ndarray): Batch of images (N, H, W, C) to perturb
+        severity (int): severity level of corruption
+
+    Returns:
+        ndarry: the batch of images perturbed by brightness up
+    """
     severity_constant = [1.6, 2.0, 2.5, 3, 4.5][severity - 1]
     noisy_factor = severity_constant
-    img = PIL.Image.fromarray(np.uint8(img * 255.0))
-    img_bright = ImageEnhance.Brightness(img).enhance(noisy_factor)
-    return np.array(img_bright) / 255.0
+    imgs = np.uint8(imgs * 255.0)
+    return enhance_batch(imgs, np.float32(0), noisy_factor) / 255.0
 
 
 def contrast_down_mapping(img, severity):
@@ -56,11 +82,24 @@ def contrast_down_mapping(img, severity):
     Returns:
         ndarry: the Image perturbed by contrast down
     """
+    return contrast_down_mapping_batch(img[np.newaxis], severity)[0]
+
+
+def contrast_down_mapping_batch(imgs, severity):
+    """
+    Perform the contrast down effect on a batch of images of the same shape.
+
+    Args:
+        imgs (ndarray): Batch of images (N, H, W, C) to perturb
+        severity (int): severity level of corruption
+
+    Returns:
+        ndarry: the batch of images perturbed by contrast down
+    """
     severity_constant = [2.2, 2.8, 3.6, 4.6, 7.0][severity - 1]
     noisy_factor = 1 / severity_constant
-    img = PIL.Image.fromarray(np.uint8(img * 255.0))
-    img_contrast = ImageEnhance.Contrast(img).enhance(noisy_factor)
-    return np.array(img_contrast) / 255.0
+    imgs = np.uint8(imgs * 255.0)
+    return enhance_batch(imgs, grayscale_mean_batch(imgs), noisy_factor) / 255.0
 
 
 def contrast_up_mapping(img, severity):
@@ -75,11 +114,75 @@ def contrast_up_mapping(img, severity):
     Returns:
         ndarry: the Image perturbed by the contrast up
     """
+    return contrast_up_mapping_batch(img[np.newaxis], severity)[0]
+
+
+def contrast_up_mapping_batch(imgs, severity):
+    """
+    Perform the contrast up effect on a batch of images of the same shape.
+
+    Args:
+        imgs (ndarray): Batch of images (N, H, W, C) to perturb
+        severity (int): severity level of corruption
+
+    Returns:
+        ndarry: the batch of images perturbed by the contrast up
+    """
     severity_constant = [2.2, 2.8, 4.0, 8.5, 30][severity - 1]
     noisy_factor = severity_constant
-    img = PIL.Image.fromarray(np.uint8(img * 255.0))
-    img_contrast = ImageEnhance.Contrast(img).enhance(noisy_factor)
-    return np.array(img_contrast) / 255.0
+    imgs = np.uint8(imgs * 255.0)
+    return enhance_batch(imgs, grayscale_mean_batch(imgs), noisy_factor) / 255.0
+
+
+def enhance_batch(imgs, degenerate, factor):
+    """
+    Blend a batch of images with their degenerate images by the enhancement factor,
+    with the same arithmetic as PIL.ImageEnhance (single precision, truncated to uint8).
+    The alpha channel of LA and RGBA images is not enhanced.
+
+    Args:
+        imgs (ndarray): Batch of uint8 images (N, H, W) or (N, H, W, C)
+        degenerate (ndarray): Degenerate values broadcastable to the images
+        factor (float): Enhancement factor
+
+    Returns:
+        ndarray: the batch of enhanced uint8 images
+    """
+    enhanced = imgs.astype(np.float32)
+    enhanced -= degenerate
+    enhanced *= np.float32(factor)
+    enhanced += degenerate
+    enhanced = np.clip(enhanced, 0, 255, out=enhanced).astype(np.uint8)
+    if imgs.ndim == 4 and imgs.shape[3] in (2, 4):
+        enhanced[..., -1] = imgs[..., -1]
+    return enhanced
+
+
+def grayscale_mean_batch(imgs):
+    """
+    Calculate the rounded mean of the grayscale of each image in a batch,
+    with the same grayscale conversion as PIL (ITU-R 601-2 luma in fixed point).
+
+    Args:
+        imgs (ndarray): Batch of uint8 images (N, H, W) or (N, H, W, C)
+
+    Returns:
+        ndarray: the means with shape broadcastable to the images
+    """
+    if imgs.ndim == 4 and imgs.shape[3] >= 3:
+        gray = imgs[..., 0].astype(np.uint32) * 19595
+        gray += imgs[..., 1].astype(np.uint32) * 38470
+        gray += imgs[..., 2].astype(np.uint32) * 7471
+        gray += 0x8000
+        gray >>= 16
+    elif imgs.ndim == 4:
+        gray = imgs[..., 0]
+    else:
+        gray = imgs
+    mean = np.floor(
+        gray.sum(axis=(1, 2), dtype=np.int64) / (gray.shape[1] * gray.shape[2]) + 0.5
+    )
+    return mean.astype(np.float32).reshape((len(imgs),) + (1,) * (imgs.ndim - 1))
 
 
 def saturate(img, severity=1):
@@ -95,17 +198,31 @@ def saturate(img, severity=1):
     Returns:
         ndarry: the Image perturbed with saturation
     """
+    return saturate_batch(np.array(img)[np.newaxis], severity)[0]
+
+
+def saturate_batch(imgs, severity=1):
+    """
+    Perform the saturation effect on a batch of images of the same shape.
+
+    Args:
+        imgs (ndarray): Batch of images (N, H, W, C) to perturb
+        severity (int): severity level of corruption
+
+    Returns:
+        ndarry: the batch of images perturbed with saturation
+    """
     severity_constant = [(2.2, 0), (3, 0), (3.5, 0.1), (5, 0.1), (30, 0.2)][
         severity - 1
     ]
 
-    img = np.array(img) * 255.0
-    img = sk.color.rgb2hsv(img)
-    img[:, :, 1] = np.clip(
-        img[:, :, 1] * severity_constant[0] + severity_constant[1], a_min=0, a_max=255
+    imgs = np.array(imgs) * 255.0
+    imgs = sk.color.rgb2hsv(imgs)
+    imgs[..., 1] = np.clip(
+        imgs[..., 1] * severity_constant[0] + severity_constant[1], a_min=0, a_max=255
     )
-    img = sk.color.hsv2rgb(img)
-    return np.clip(img, 0, 255) / 255.0
+    imgs = sk.color.hsv2rgb(imgs)
+    return np.clip(imgs, 0, 255) / 255.0
 
 
 """Implement 3-D tilt perturbation on a set of images."""
@@ -181,6 +298,21 @@ def tilt_mapping(img, severity):
     return np.array(img) / 255.0
 
 
+def tilt_mapping_batch(imgs, severity):
+    """
+    Perform a 3-D tilt transformation on a batch of images of the same shape.
+    Each image is tilted by its own random perspective, in the order of the images.
+
+    Args:
+        imgs (ndarray): Batch of images (N, H, W, C) to perturb
+        severity (int): severity level of corruption
+
+    Returns:
+        ndarray: the batch of images perturbed by the tilt
+    """
+    return np.stack([tilt_mapping(img, severity) for img in imgs])
+
+
 def jpeg_compression(img, severity=1):
     """
     Perform the jpeg compression effect.
@@ -200,3 +332,17 @@ def jpeg_compression(img, severity=1):
     img.save(output, "JPEG", quality=severity_constant)
     img = Image.open(output)
     return np.array(img) / 255.0
+
+
+def jpeg_compression_batch(imgs, severity=1):
+    """
+    Perform the jpeg compression effect on a batch of images of the same shape.
+
+    Args:
+        imgs (ndarray): Batch of images (N, H, W, C) to perturb
+        severity (int): severity level of corruption
+
+    Returns:
+        ndarry: the batch of images perturbed by the jpeg compression
+    """
+    return np.stack([jpeg_compression(img, severity) for img in imgs])
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+from utils import environment
+
+rgb_shape = (128, 128, 3)
+rgba_shape = (128, 128, 4)
+
+# The image shapes supported by each corruption function
+corruption_shapes = {
+    "snow": [rgb_shape, rgba_shape],
+    "fog": [rgb_shape, rgba_shape],
+    "add_rain": [rgb_shape],
+}
+
+
+@pytest.mark.parametrize("severity", [1, 2, 3, 4, 5])
+@pytest.mark.parametrize(
+    "corruption_name, image_shape",
+    [
+        (corruption_name, image_shape)
+        for corruption_name, image_shapes in corruption_shapes.items()
+        for image_shape in image_shapes
+    ],
+)
+def test_batch_same_as_single_image(corruption_name, image_shape, severity):
+    images = np.random.default_rng(0).random((3,) + image_shape)
+    corruption_fn = getattr(environment, corruption_name)
+    corruption_batch_fn = getattr(environment, corruption_name + "_batch")
+
+    np.random.seed(0)
+    expected_images = np.stack([corruption_fn(image, severity) for image in images])
+    np.random.seed(0)
+    corrupted_images = corruption_batch_fn(images, severity)
+
+    assert np.array_equal(corrupted_images, expected_images)
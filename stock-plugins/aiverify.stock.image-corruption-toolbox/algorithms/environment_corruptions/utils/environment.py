@@ -101,6 +101,21 @@ def snow(img: np.ndarray, severity: int = 1) -> np.float32:
     Returns:
         nd.float32: Numpy float of image with snow environment corruption
     """
+    return snow_batch(img[np.newaxis], severity)[0]
+
+
+def snow_batch(imgs: np.ndarray, severity: int = 1) -> np.ndarray:
+    """
+    Adding snow to a batch of images of the same shape.
+    The snow layer of each image is generated in the order of the images.
+
+    Parameters:
+        imgs (ndarray) : original images (N, H, W, C) to be corrupted
+        severity (int) : Level of severity of noise addedd
+
+    Returns:
+        ndarray: Numpy float32 array of images with snow environment corruption
+    """
     severity_constant = [
         (0.1, 0.3, 3, 0.5, 10, 4, 0.8),
         (0.2, 0.3, 2, 0.5, 12, 4, 0.7),
@@ -108,49 +123,64 @@ def snow(img: np.ndarray, severity: int = 1) -> np.float32:
         (0.6, 0.3, 6.5, 0.9, 16, 16, 0.3),
         (0.6, 0.35, 7.5, 0.9, 18, 18, 0.2),
     ][severity - 1]
+    add_const = severity_constant[6]
+
+    images = np.array(imgs, dtype=np.float32)
+    num_images, height, width, channel = images.shape
+    snow_layers = np.stack(
+        [snow_layer((height, width), severity_constant) for _ in range(num_images)]
+    )
+
+    # the images are stacked along the rows to convert them to grayscale together
+    grays = cv2.cvtColor(
+        images.reshape(num_images * height, width, channel), cv2.COLOR_RGB2GRAY
+    ).reshape(num_images, height, width, 1)
+    images = add_const * images + (1 - add_const) * np.maximum(
+        images, grays * 1.5 + 0.5
+    )
+    return (
+        np.clip(images + snow_layers + np.rot90(snow_layers, k=2, axes=(1, 2)), 0, 1)
+    ).astype(np.float32)
+
 
+def snow_layer(shape: Tuple[int, int], severity_constant: Tuple) -> np.ndarray:
+    """
+    Generate the snow layer of an image
+    Modified from : https://github.com/hendrycks/robustness/blob/master/ImageNet-C/create_c/make_imagenet_c.py
+    (Apache 2.0)
+
+    Parameters:
+        shape (Tuple[int, int]) : Height and width of the image
+        severity_constant (Tuple) : Snow parameters of the level of severity
+
+    Returns:
+        ndarray: Numpy array of the snow layer (H, W, 1)
+    """
     loc = severity_constant[0]
     scale = severity_constant[1]
     zoom_factor = severity_constant[2]
     radius = severity_constant[4]
     sigma = severity_constant[5]
-    add_const = severity_constant[6]
-
-    image = img.copy()
-    image = np.array(image, dtype=np.float32)
 
-    width, height, channel = img.shape
-    snow_layer = np.random.normal(
-        size=image.shape[:2], loc=loc, scale=scale
-    )  # [:2] for monochrome
+    layer = np.random.normal(size=shape, loc=loc, scale=scale)  # monochrome
 
-    snow_layer = clipped_zoom(snow_layer[..., np.newaxis], zoom_factor)
-    snow_layer[snow_layer < severity_constant[3]] = 0
+    layer = clipped_zoom(layer[..., np.newaxis], zoom_factor)
+    layer[layer < severity_constant[3]] = 0
 
-    snow_layer = Image.fromarray(
-        (np.clip(snow_layer.squeeze(), 0, 1) * 255).astype(np.uint8), mode="L"
+    layer = Image.fromarray(
+        (np.clip(layer.squeeze(), 0, 1) * 255).astype(np.uint8), mode="L"
     )
     output = BytesIO()
-    snow_layer.save(output, format="PNG")
-    snow_layer = MotionImage(blob=output.getvalue())
+    layer.save(output, format="PNG")
+    layer = MotionImage(blob=output.getvalue())
 
-    snow_layer.motion_blur(radius, sigma, angle=np.random.uniform(-135, -45))
+    layer.motion_blur(radius, sigma, angle=np.random.uniform(-135, -45))
 
-    snow_layer = (
-        cv2.imdecode(
-            np.fromstring(snow_layer.make_blob(), np.uint8), cv2.IMREAD_UNCHANGED
-        )
+    layer = (
+        cv2.imdecode(np.fromstring(layer.make_blob(), np.uint8), cv2.IMREAD_UNCHANGED)
         / 255.0
     )
-    snow_layer = snow_layer[..., np.newaxis]
-
-    image = add_const * image + (1 - add_const) * np.maximum(
-        image,
-        cv2.cvtColor(image, cv2.COLOR_RGB2GRAY).reshape(width, height, 1) * 1.5 + 0.5,
-    )
-    return (np.clip(image + snow_layer + np.rot90(snow_layer, k=2), 0, 1)).astype(
-        np.float32
-    )
+    return layer[..., np.newaxis]
 
 
 def fog(img: np.ndarray, severity: int = 1) -> np.ndarray:
@@ -165,22 +195,39 @@ def fog(img: np.ndarray, severity: int = 1) -> np.ndarray:
     Returns:
         ndarray: Numpy array of image with fog environment corruption
     """
+    return fog_batch(img[np.newaxis], severity)[0]
+
+
+def fog_batch(imgs: np.ndarray, severity: int = 1) -> np.ndarray:
+    """
+    Adding fog to a batch of images of the same shape.
+    The fog of each image is generated in the order of the images.
+
+    Parameters:
+        imgs (ndarray) : Numpy array of original images (N, H, W, C) to be corrupted
+        severity (int) : Level of severity of noise addedd
+    Returns:
+        ndarray: Numpy array of images with fog environment corruption
+    """
     severity_constant = [(0.8, 3), (1.2, 2.5), (1.6, 2), (2.5, 1.75), (2.8, 1.6)][
         severity - 1
     ]
     wibbledecay = severity_constant[1]
     add_const = severity_constant[0]
 
-    image = img.copy()
-    max_val = image.max()
-    shape = img.shape
-    image += (
-        add_const
-        * plasma_fractal(wibbledecay=wibbledecay)[: shape[0], : shape[1]][
-            ..., np.newaxis
+    images = imgs.copy()
+    max_vals = images.max(axis=(1, 2, 3), keepdims=True)
+    shape = imgs.shape
+    fogs = np.stack(
+        [
+            plasma_fractal(wibbledecay=wibbledecay)[: shape[1], : shape[2]]
+            for _ in range(shape[0])
         ]
     )
-    return (np.clip(image * max_val / (max_val + add_const), 0, 1)).astype(np.float32)
+    images += add_const * fogs[..., np.newaxis]
+    return (np.clip(images * max_vals / (max_vals + add_const), 0, 1)).astype(
+        np.float32
+    )
 
 
 def generate_random_lines(
@@ -287,3 +334,23 @@ def add_rain(
     )
     output = np.array(output) / 255.0
     return output
+
+
+def add_rain_batch(
+    images: np.ndarray,
+    severity: int,
+    drop_color: Tuple[int, int, int] = (200, 200, 200),
+) -> np.ndarray:
+    """
+    Adding rain to a batch of images of the same shape.
+    The rain drops of each image are drawn in the order of the images.
+
+    Parameters:
+        images (ndarray) : numpy ndarray of original images (N, H, W, C) to be corrupted
+        severity (int) : level of severity of noise addedd
+        drop_color (Tuple): (200,200,200) a shade of gray
+
+    Returns:
+        ndarray: Images with rain environment corruption
+    """
+    return np.stack([add_rain(image, severity, drop_color) for image in images])
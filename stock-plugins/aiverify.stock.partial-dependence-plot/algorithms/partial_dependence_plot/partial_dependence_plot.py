@@ -1,6 +1,6 @@
 import logging
 from pathlib import Path, PurePath
-from typing import Dict, List, Tuple, Union
+from typing import Callable, Dict, List, Tuple, Union
 
 import numpy as np
 from scipy.stats.mstats import mquantiles
@@ -19,6 +19,7 @@ from test_engine_core.utils.json_utils import (
     validate_json,
 )
 from test_engine_core.utils.simple_progress import SimpleProgress
+from test_engine_core.utils.worker_pool import WorkerPool
 
 
 # =====================================================================================
@@ -141,6 +142,11 @@ class Plugin(IAlgorithm):
         # Other variables
         self._data = None
         self._results = {"results": [0]}
+        self._prediction_memory_limit_default = 256  # MB
+        self._max_samples_default = 0  # All rows
+        self._num_workers_default = 0  # Sequential
+        self._worker_type_default = WorkerPool.WORKER_TYPE_THREAD
+        self._sampling_seed = 10
 
         # Perform setup for this plug-in
         self.setup()
@@ -160,9 +166,11 @@ class Plugin(IAlgorithm):
         )
 
         # Retrieve the input parameters defined in the input schema and store them
+        # Optional input arguments which are not provided are not stored, and the default values are used
         self._input_arguments = dict()
         for key in self._input_schema.get("properties").keys():
-            self._input_arguments.update({key: kwargs.get(key)})
+            if kwargs.get(key) is not None:
+                self._input_arguments.update({key: kwargs.get(key)})
 
         # Perform validation on input argument schema
         if not validate_json(self._input_arguments, self._input_schema):
@@ -352,6 +360,18 @@ class Plugin(IAlgorithm):
             # target = self._input_arguments["target_feature_name"]
             percentiles = [0.01, 0.99]
             grid_resolution = 25
+            prediction_memory_limit = self._input_arguments.get(
+                "prediction_memory_limit", self._prediction_memory_limit_default
+            )
+            max_samples = self._input_arguments.get(
+                "max_samples", self._max_samples_default
+            )
+            num_workers = self._input_arguments.get(
+                "num_workers", self._num_workers_default
+            )
+            worker_type = self._input_arguments.get(
+                "worker_type", self._worker_type_default
+            )
 
             # Remove ground_truth target value from the data
             data_no_ground_truth = self._data.drop(
@@ -373,13 +393,44 @@ class Plugin(IAlgorithm):
                 data_no_ground_truth_np, data_features, percentiles, grid_resolution
             )
 
-            dict_items_labels = self._data_instance.read_labels().items()
+            # Compute the pdp with a subsample of the rows if required
+            data_samples_np = self._get_data_samples(
+                data_no_ground_truth_np, max_samples
+            )
+
+            # The data labels are in a list to be sent to the worker processes
+            data_labels = list(self._data_instance.read_labels().items())
             # Update the progress total value
             self._progress_inst.add_total(len(grid_values))
-            for index, value in grid_values.items():
-                mean_pdp = self._compute_pdp(
-                    data_no_ground_truth_np, index, dict_items_labels, value
+            if num_workers <= 1 and prediction_memory_limit > 0:
+                # Stack the grid values of all the features into chunked predictions within the memory limit
+                mean_pdp_values = Plugin._compute_pdp_batched(
+                    data_samples_np,
+                    self._model_instance,
+                    data_labels,
+                    grid_values,
+                    prediction_memory_limit,
+                    lambda _: self._progress_inst.update(1),
+                )
+            else:
+                # Compute the features concurrently, where the workers share the memory limit
+                if prediction_memory_limit > 0:
+                    prediction_memory_limit = max(
+                        1, prediction_memory_limit // num_workers
+                    )
+                list_of_mean_pdp = WorkerPool.run(
+                    Plugin._compute_pdp_feature,
+                    data_samples_np,
+                    (self._model_instance, data_labels, prediction_memory_limit),
+                    list(grid_values.items()),
+                    num_workers,
+                    worker_type,
+                    lambda _: self._progress_inst.update(1),
                 )
+                mean_pdp_values = dict(zip(grid_values.keys(), list_of_mean_pdp))
+
+            for index, value in grid_values.items():
+                mean_pdp = mean_pdp_values[index]
                 feature = data_features[index]
                 # Convert results based on target classes.
                 output_results[feature] = dict()
@@ -397,9 +448,6 @@ class Plugin(IAlgorithm):
                     )
                     target_index += 1
 
-                # Update the progress
-                self._progress_inst.update(1)
-
             # Format the output results
             output_results = self._format_result(output_results)
 
@@ -415,9 +463,43 @@ class Plugin(IAlgorithm):
                 f"Invalid data plugin type - {self._data_instance.get_data_plugin_type()}"
             )
 
+    @staticmethod
+    def _compute_pdp_feature(
+        data: np.ndarray,
+        model_instance: Union[IModel, IPipeline],
+        data_labels: List,
+        memory_limit: int,
+        idx: int,
+        grid_values: Union[np.ndarray, List],
+    ) -> np.ndarray:
+        """
+        A helper method to compute the pdp for the given column in a worker
+
+        Args:
+            data (np.ndarray): Input data
+            model_instance (Union[IModel, IPipeline]): The model to predict with
+            data_labels (List): List of data labels
+            memory_limit (int): The memory limit (MB) of the data to be predicted in each chunk.
+            0 indicates each grid value is predicted separately
+            idx (int): Index value
+            grid_values (Union[np.ndarray, List]): Grid values
+
+        Returns:
+            np.ndarray: The computed result of pdp
+        """
+        if memory_limit > 0:
+            return Plugin._compute_pdp_batched(
+                data, model_instance, data_labels, {idx: grid_values}, memory_limit
+            )[idx]
+        else:
+            return Plugin._compute_pdp(
+                data, model_instance, idx, data_labels, grid_values
+            )
+
+    @staticmethod
     def _compute_pdp(
-        self,
         data: np.ndarray,
+        model_instance: Union[IModel, IPipeline],
         idx: int,
         data_labels: List,
         grid_values: Union[np.ndarray, List],
@@ -427,6 +509,7 @@ class Plugin(IAlgorithm):
 
         Args:
             data (np.ndarray): Input data
+            model_instance (Union[IModel, IPipeline]): The model to predict with
             idx (int): Index value
             data_labels (List): List of data labels
             grid_values (Union[np.ndarray, List]): Grid values
@@ -439,13 +522,99 @@ class Plugin(IAlgorithm):
 
         for i, y in enumerate(grid_values):
             data_copy[:, idx] = y
-            baselines.append(self._model_instance.predict([data_copy], data_labels))
+            baselines.append(model_instance.predict([data_copy], data_labels))
 
         baselines = np.swapaxes(np.array(baselines), 0, 1)
         mean_value = np.mean(baselines, axis=0)
 
         return mean_value
 
+    @staticmethod
+    def _compute_pdp_batched(
+        data: np.ndarray,
+        model_instance: Union[IModel, IPipeline],
+        data_labels: List,
+        grid_values: Dict,
+        memory_limit: int,
+        callback: Union[Callable, None] = None,
+    ) -> Dict:
+        """
+        A helper method to compute the pdp for all the columns with batched predictions.
+        The data copies with the grid values of the columns are stacked, and predicted in chunks
+        where each chunk is within the memory limit.
+
+        Args:
+            data (np.ndarray): Input data
+            model_instance (Union[IModel, IPipeline]): The model to predict with
+            data_labels (List): List of data labels
+            grid_values (Dict): Grid values of each column index
+            memory_limit (int): The memory limit (MB) of the data to be predicted in each chunk
+            callback (Union[Callable, None]): The function to call with the column index when all the grid
+            values of the column are computed. Defaults to None
+
+        Returns:
+            Dict: The computed result of pdp of each column index
+        """
+        number_of_rows = data.shape[0]
+        copy_size = max(data.nbytes, 1)
+        copies_per_chunk = max(1, int(memory_limit * 1024 * 1024 // copy_size))
+
+        # Each data copy replaces a column with one of its grid values
+        data_copies = [
+            (index, grid_index, grid_value)
+            for index, value in grid_values.items()
+            for grid_index, grid_value in enumerate(value)
+        ]
+        remaining_copies = {index: len(value) for index, value in grid_values.items()}
+        mean_values = {
+            index: [None] * len(value) for index, value in grid_values.items()
+        }
+
+        for chunk_start in range(0, len(data_copies), copies_per_chunk):
+            chunk_copies = data_copies[chunk_start : chunk_start + copies_per_chunk]
+            chunk_data = np.tile(data, (len(chunk_copies), 1))
+            for copy_index, (index, _, grid_value) in enumerate(chunk_copies):
+                chunk_data[
+                    copy_index * number_of_rows : (copy_index + 1) * number_of_rows,
+                    index,
+                ] = grid_value
+
+            predictions = np.array(model_instance.predict([chunk_data], data_labels))
+            for copy_index, (index, grid_index, _) in enumerate(chunk_copies):
+                mean_values[index][grid_index] = np.mean(
+                    predictions[
+                        copy_index * number_of_rows : (copy_index + 1) * number_of_rows
+                    ],
+                    axis=0,
+                )
+
+                # Notify when all the grid values of the column are computed
+                remaining_copies[index] -= 1
+                if remaining_copies[index] == 0 and callback is not None:
+                    callback(index)
+
+        return {index: np.array(value) for index, value in mean_values.items()}
+
+    def _get_data_samples(self, data: np.ndarray, max_samples: int) -> np.ndarray:
+        """
+        A helper method to return a random subsample of the rows for computing the pdp
+
+        Args:
+            data (np.ndarray): Input data
+            max_samples (int): The maximum number of rows. 0 indicates all the rows
+
+        Returns:
+            np.ndarray: The subsample of the input data
+        """
+        if max_samples <= 0 or max_samples >= data.shape[0]:
+            return data
+
+        random_generator = np.random.default_rng(self._sampling_seed)
+        sample_indexes = np.sort(
+            random_generator.choice(data.shape[0], size=max_samples, replace=False)
+        )
+        return data[sample_indexes]
+
     def _compute_pdp_grid(
         self, data: np.ndarray, features: List, percentiles: List, grid_resolution: int
     ) -> Dict:
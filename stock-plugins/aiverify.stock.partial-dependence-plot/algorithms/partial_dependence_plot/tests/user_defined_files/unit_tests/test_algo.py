@@ -1,6 +1,7 @@
 import logging
 from pathlib import Path
 
+import numpy as np
 import pytest
 from partial_dependence_plot import Plugin
 from test_engine_core.interfaces.idata import IData
@@ -9,6 +10,7 @@ from test_engine_core.plugins.enums.model_type import ModelType
 from test_engine_core.plugins.enums.plugin_type import PluginType
 from test_engine_core.plugins.metadata.plugin_metadata import PluginMetadata
 from test_engine_core.plugins.plugins_manager import PluginManager
+from test_engine_core.utils.import_modules import LazyModule
 from test_engine_core.utils.json_utils import (
     load_schema_file,
     remove_numpy_formats,
@@ -499,3 +501,120 @@ def test_valid_run(get_data_instance_and_serializer_without_ground_truth):
     )
 
     assert validate_status == True
+
+
+def get_pdp_results(plugin_class, **input_arguments):
+    test_object = TestObject()
+    test_object._data_instance_and_serializer[0].remove_ground_truth("Interest_Rate")
+    test_object._ground_truth_instance_and_serializer[0].keep_ground_truth(
+        test_object._ground_truth
+    )
+    test_plugin = plugin_class(
+        test_object._data_instance_and_serializer,
+        test_object._model_instance_and_serializer,
+        test_object._ground_truth_instance_and_serializer,
+        test_object._data_instance_and_serializer[0],
+        test_object._model_instance_and_serializer[0],
+        **test_object._input_args,
+        **input_arguments,
+    )
+    test_plugin.generate()
+    return remove_numpy_formats(test_plugin.get_results())
+
+
+def get_pdp_values(results, key):
+    return [
+        item[key]
+        for feature_results in results["results"]
+        for target_results in feature_results
+        for item in target_results
+    ]
+
+
+@pytest.mark.parametrize(
+    "input_arguments",
+    [
+        # Multiple chunks of predictions
+        {"prediction_memory_limit": 1},
+        # One chunk of predictions
+        {"prediction_memory_limit": 256},
+        {"prediction_memory_limit": 256, "num_workers": 2, "worker_type": "thread"},
+    ],
+)
+def test_valid_run_with_batched_predictions(input_arguments):
+    expected_results = get_pdp_results(Plugin, prediction_memory_limit=0)
+    results = get_pdp_results(Plugin, **input_arguments)
+
+    assert results["feature_names"] == expected_results["feature_names"]
+    assert results["output_classes"] == expected_results["output_classes"]
+    assert get_pdp_values(results, "feature_value") == get_pdp_values(
+        expected_results, "feature_value"
+    )
+    np.testing.assert_allclose(
+        get_pdp_values(results, "pdp_value"),
+        get_pdp_values(expected_results, "pdp_value"),
+    )
+
+
+def test_valid_run_with_lazy_module_in_worker_processes():
+    # The plugin is imported from its file path as when it is loaded by the test engine
+    lazy_module = LazyModule("partial_dependence_plot", "partial_dependence_plot.py")
+    expected_results = get_pdp_results(Plugin)
+    results = get_pdp_results(lazy_module.Plugin, num_workers=2, worker_type="process")
+
+    assert get_pdp_values(results, "feature_value") == get_pdp_values(
+        expected_results, "feature_value"
+    )
+    np.testing.assert_allclose(
+        get_pdp_values(results, "pdp_value"),
+        get_pdp_values(expected_results, "pdp_value"),
+    )
+
+
+@pytest.mark.parametrize(
+    "max_samples, expected_number_of_rows",
+    [
+        (0, 2500),
+        (100, 100),
+        (2500, 2500),
+        (5000, 2500),
+    ],
+)
+def test_get_data_samples(max_samples, expected_number_of_rows):
+    test_object = TestObject()
+    test_plugin = Plugin(
+        test_object._data_instance_and_serializer,
+        test_object._model_instance_and_serializer,
+        test_object._ground_truth_instance_and_serializer,
+        test_object._data_instance_and_serializer[0],
+        test_object._model_instance_and_serializer[0],
+        **test_object._input_args,
+    )
+    data = np.arange(2500 * 3).reshape(2500, 3)
+    data_samples = test_plugin._get_data_samples(data, max_samples)
+
+    assert data_samples.shape == (expected_number_of_rows, 3)
+    # The rows are sampled without replacement in their original order
+    assert np.all(np.diff(data_samples[:, 0]) > 0)
+    assert np.all(np.isin(data_samples, data))
+    # The same rows are sampled in every run
+    assert np.array_equal(
+        data_samples, test_plugin._get_data_samples(data, max_samples)
+    )
+
+
+def test_valid_run_with_max_samples():
+    expected_results = get_pdp_results(Plugin)
+    results = get_pdp_results(Plugin, max_samples=100)
+
+    validate_status = validate_json(
+        results,
+        load_schema_file(str(Path().absolute() / "output.schema.json")),
+    )
+    assert validate_status == True
+    # The grid values are computed with all the rows, and the pdp values with the sampled rows
+    assert get_pdp_values(results, "feature_value") == get_pdp_values(
+        expected_results, "feature_value"
+    )
+    assert results == get_pdp_results(Plugin, max_samples=100)
+    assert results != expected_results
@@ -1,4 +1,5 @@
 import copy
+import io
 import logging
 import pickle
 import shutil
@@ -153,6 +154,7 @@ class Plugin(IAlgorithm):
         self._results = {"results": [0]}
         self._tmp_path = self._base_path / "temp"
         self._save_path = self._base_path.parents[1] / "widgets" / "images"
+        self._in_memory_default = False
 
         # Algorithm input schema defined in input.schema.json
         # By defining the input schema, it allows the front-end to know what algorithm input params is
@@ -169,9 +171,11 @@ class Plugin(IAlgorithm):
         )
 
         # Retrieve the input parameters defined in the input schema and store them
+        # Optional input arguments which are not provided are not stored, and the default values are used
         self._input_arguments = dict()
         for key in self._input_schema.get("properties").keys():
-            self._input_arguments.update({key: kwargs.get(key)})
+            if kwargs.get(key) is not None:
+                self._input_arguments.update({key: kwargs.get(key)})
 
         # Perform validation on input argument schema
         if not validate_json(self._input_arguments, self._input_schema):
@@ -502,12 +506,23 @@ class Plugin(IAlgorithm):
             images.append(np.float64(image_array))
         return images, image_shapes
 
-    def _transform_to_df(self, data_np: np.ndarray, img_shape, subfolder_name: str):
+    def _transform_to_df(
+        self,
+        data_np: np.ndarray,
+        img_shape,
+        subfolder_name: str,
+        for_display: bool = False,
+    ):
         """
+        A method to convert the images to the image directory dataframe for the model pipeline.
+        If in_memory is set, the images are passed as in-memory PNG images, except for the images for display
+        which are always written to files.
+
         Args:
             data_np (np.ndarray):
             img_shape ():
             subfolder_name (str): the name of the subfolder
+            for_display (bool): whether the images are shown in the report. Defaults to False.
 
         Returns:
             Tuple[int, np.float64, np.float64, int, list, list, list, np.ndarray, np.ndarray]
@@ -518,22 +533,44 @@ class Plugin(IAlgorithm):
             is not SerializerPluginType.IMAGE
         ):
             return data_np
+        if not for_display and self._input_arguments.get(
+            "in_memory", self._in_memory_default
+        ):
+            return self._transform_to_memory_df(data_np, img_shape)
         pred_dirs = []
         tmp_path = self._tmp_path
         Path(str(tmp_path / subfolder_name)).mkdir(parents=True, exist_ok=True)
         for index, img_array in enumerate(data_np):
             img_reshaped = img_array.reshape(img_shape[index])
-            Image.fromarray(np.uint8(img_reshaped)).save(
-                str(tmp_path / subfolder_name / (str(index) + ".png"))
-            )
-        for i in sorted(
-            Path.iterdir(Path(str(tmp_path / subfolder_name))),
-            key=lambda i: int(i.stem),
-        ):
-            pred_dirs.append(str(i))
+            pred_dir = str(tmp_path / subfolder_name / (str(index) + ".png"))
+            Image.fromarray(np.uint8(img_reshaped)).save(pred_dir)
+            pred_dirs.append(pred_dir)
         pred_dirs_df = pd.DataFrame(pred_dirs, columns=["image_directory"])
         return pred_dirs_df
 
+    def _transform_to_memory_df(self, data_np: np.ndarray, img_shape) -> pd.DataFrame:
+        """
+        A method to convert images in np.array form into in-memory PNG images for the model pipeline.
+        The in-memory images are in the image directory column, and can be opened by the model pipeline
+        with PIL Image.open in the same way as the image files.
+
+        Args:
+            data_np (np.ndarray): array containing all the flattened images
+            img_shape (list): the shape of each image
+
+        Returns:
+            pd.DataFrame: In-memory images in pandas dataframe
+        """
+        memory_images = []
+        for index, img_array in enumerate(data_np):
+            memory_image = io.BytesIO()
+            Image.fromarray(np.uint8(img_array.reshape(img_shape[index]))).save(
+                memory_image, format="PNG", compress_level=1
+            )
+            memory_image.seek(0)
+            memory_images.append(memory_image)
+        return pd.DataFrame({"image_directory": memory_images})
+
     def _get_initial_adversarial_samples(
         self,
         data_in_numpy: np.ndarray,
@@ -644,6 +681,7 @@ class Plugin(IAlgorithm):
     ]:
         """
         This method generates final adversarial samples for the given data.
+        The samples with initial adversarial samples are attacked together in batches of the same shape.
 
         Args:
             data_in_numpy (np.ndarray): data used to generate adversarial examples without ground truth
@@ -657,142 +695,36 @@ class Plugin(IAlgorithm):
         Returns:
             Tuple[int, np.float64, np.float64, int, list, list, list, np.ndarray, np.ndarray]
         """
-        delta_ratio_min_threshold = 0.2
-        delta_ratio_max_threshold = 0.5
-        delta_ratio_zero_threshold = 0.0
-        epsilon_ratio_min_threshold = 0.2
-        epsilon_ratio_max_threshold = 0.5
-        epsilon_ratio_zero_threshold = 0.0
-
+        final_adversarial_samples = [None] * len(data_in_numpy)
         try:
-            final_adversarial_samples = [None] * len(data_in_numpy)
-            for count, original in enumerate(data_in_numpy):
-                current_delta = 0.01
-                current_epsilon = 0.01
-
-                x_adversarial = initial_adversarial_samples[count]
+            # Group the samples with initial adversarial samples by their shape to attack them together
+            attack_groups = dict()
+            for count, x_adversarial in enumerate(initial_adversarial_samples):
                 if type(x_adversarial) is not np.ndarray:
                     # Cannot find initial adversarial samples
-                    pass
-
+                    self._progress_inst.update(1)
                 else:
-                    for iteration in range(self._max_iteration):
-                        x_adversarial_array = np.array([])
-
-                        for count_test in range(self._max_test):
-                            adversarial_list = list()
-
-                            for count_sample in range(self._max_sample):
-                                # Create max_sample number of adversarial sample using orthogonal steps
-                                # [supposed to get closer to the boundary line]
-                                adversarial_value = (
-                                    x_adversarial
-                                    + self._orthogonal_step(
-                                        current_delta, x_adversarial, original
-                                    )
-                                )
-                                adversarial_value = np.clip(
-                                    adversarial_value,
-                                    min_feature_value,
-                                    max_feature_value,
-                                )
-                                adversarial_list.append(adversarial_value)
-
-                            adversarial_list_to_predict = self._transform_to_df(
-                                np.array(adversarial_list),
-                                image_shapes,
-                                subfolder_name="adv_pred"
-                                + str(iteration)
-                                + str(count_test),
-                            )
-
-                            if self._check_for_xgb_model_type():
-                                if (
-                                    self._model_instance._model_algorithm
-                                    == "xgboost.core.Booster"
-                                ):
-                                    adversarial_list_to_predict = pd.DataFrame(
-                                        adversarial_list, columns=self._data_labels
-                                    )
-
-                            # Check predictions for adversarial
-                            potential_adversarials_prediction = self._model.predict(
-                                [adversarial_list_to_predict], self._data_labels_items
-                            )
-                            satisfied = (
-                                potential_adversarials_prediction
-                                != ground_truth_in_numpy
-                            )
-                            delta_ratio = np.mean(satisfied)
-                            if delta_ratio < delta_ratio_min_threshold:
-                                current_delta *= self._adapt_value
-                            elif delta_ratio > delta_ratio_max_threshold:
-                                current_delta /= self._adapt_value
-
-                            if delta_ratio > delta_ratio_zero_threshold:
-                                x_adversarial_array = np.array(adversarial_list)
-                                break
-                        for count_test in range(self._max_test):
-                            perturb = (
-                                np.repeat(
-                                    np.array([original]),
-                                    len(x_adversarial_array),
-                                    axis=0,
-                                )
-                                - x_adversarial_array
-                            )
-                            perturb *= current_epsilon
-                            potential_adversarials = x_adversarial_array + perturb
-                            potential_adversarials = np.clip(
-                                potential_adversarials,
-                                min_feature_value,
-                                max_feature_value,
-                            )
-
-                            if self._check_for_xgb_model_type():
-                                if (
-                                    self._model_instance._model_algorithm
-                                    == "xgboost.core.Booster"
-                                ):
-                                    df = pd.DataFrame(
-                                        potential_adversarials,
-                                        columns=self._data_labels,
-                                    )
-                                    potential_adversarials_prediction = (
-                                        self._model.predict(df, self._data_labels_items)
-                                    )
-                            else:
-                                potential_adv_pred_transformed = self._transform_to_df(
-                                    np.array(potential_adversarials),
-                                    image_shapes,
-                                    subfolder_name="potential_adv_pred"
-                                    + str(iteration)
-                                    + str(count_test),
-                                )
-                                potential_adversarials_prediction = self._model.predict(
-                                    [potential_adv_pred_transformed],
-                                    self._data_labels_items,
-                                )
-                            satisfied = (
-                                potential_adversarials_prediction
-                                != ground_truth_in_numpy
-                            )
-                            epsilon_ratio = np.mean(satisfied)
-                            if epsilon_ratio < epsilon_ratio_min_threshold:
-                                current_epsilon *= self._adapt_value
-                            elif epsilon_ratio > epsilon_ratio_max_threshold:
-                                current_epsilon /= self._adapt_value
-
-                            if epsilon_ratio > epsilon_ratio_zero_threshold:
-                                x_adversarial = self._best_adversarial(
-                                    original, x_adversarial_array
-                                )
-                                final_adversarial_samples[count] = x_adversarial
-                                break
-
-                    final_adversarial_samples[count] = x_adversarial
+                    attack_groups.setdefault(x_adversarial.shape, []).append(count)
+
+            for indexes in attack_groups.values():
+                adversarial_samples = self._boundary_attack(
+                    np.array([data_in_numpy[index] for index in indexes], dtype=float),
+                    ground_truth_in_numpy[indexes, 0],
+                    np.array(
+                        [initial_adversarial_samples[index] for index in indexes],
+                        dtype=float,
+                    ),
+                    min_feature_value,
+                    max_feature_value,
+                    None
+                    if image_shapes is None
+                    else [image_shapes[index] for index in indexes],
+                )
+                for index, adversarial_sample in zip(indexes, adversarial_samples):
+                    final_adversarial_samples[index] = adversarial_sample
+
                 # Update the progress
-                self._progress_inst.update(1)
+                self._progress_inst.update(len(indexes))
         except Exception:
             import traceback
 
@@ -823,11 +755,11 @@ class Plugin(IAlgorithm):
 
         # Save in the temporary folder
         adv_samples_df = self._transform_to_df(
-            adv_samples, image_shapes, subfolder_name="adv_samples"
+            adv_samples, image_shapes, subfolder_name="adv_samples", for_display=True
         )
 
         org_samples_df = self._transform_to_df(
-            org_samples, image_shapes, subfolder_name="org_samples"
+            org_samples, image_shapes, subfolder_name="org_samples", for_display=True
         )
 
         if (
@@ -907,6 +839,190 @@ class Plugin(IAlgorithm):
             sample_org_predictions,
         )
 
+    def _boundary_attack(
+        self,
+        originals: np.ndarray,
+        ground_truths: np.ndarray,
+        adversarials: np.ndarray,
+        min_feature_value: float,
+        max_feature_value: float,
+        image_shapes: Union[List, None],
+    ) -> np.ndarray:
+        """
+        This method performs the boundary attack on a batch of samples of the same shape.
+        In each step, the candidates of all the samples still in the step are predicted together,
+        and the step size (delta) and the perturbation size (epsilon) are adapted for each sample.
+
+        Args:
+            originals (np.ndarray): the original samples (N, D)
+            ground_truths (np.ndarray): the ground truth of the samples (N,)
+            adversarials (np.ndarray): the initial adversarial samples (N, D)
+            min_feature_value (float): the min feature value in float
+            max_feature_value (float): the max feature value in float
+            image_shapes (Union[List, None]): the image shapes of the samples, or None for tabular data
+
+        Returns:
+            np.ndarray: the final adversarial samples (N, D)
+        """
+        delta_ratio_min_threshold = 0.2
+        delta_ratio_max_threshold = 0.5
+        delta_ratio_zero_threshold = 0.0
+        epsilon_ratio_min_threshold = 0.2
+        epsilon_ratio_max_threshold = 0.5
+        epsilon_ratio_zero_threshold = 0.0
+
+        num_samples = len(originals)
+        current_deltas = np.full(num_samples, 0.01)
+        current_epsilons = np.full(num_samples, 0.01)
+        x_adversarials = adversarials.copy()
+
+        for iteration in range(self._max_iteration):
+            # Create max_sample number of adversarial samples for each sample using orthogonal steps
+            # [supposed to get closer to the boundary line], until some of them are adversarial
+            x_adversarial_arrays = np.empty(
+                (num_samples, self._max_sample) + originals.shape[1:]
+            )
+            has_adversarial_array = np.zeros(num_samples, dtype=bool)
+            remaining = np.arange(num_samples)
+            for count_test in range(self._max_test):
+                if len(remaining) == 0:
+                    break
+
+                adversarial_values = x_adversarials[remaining][
+                    :, np.newaxis
+                ] + self._orthogonal_step(
+                    current_deltas[remaining],
+                    x_adversarials[remaining],
+                    originals[remaining],
+                )
+                adversarial_values = np.clip(
+                    adversarial_values, min_feature_value, max_feature_value
+                )
+
+                # Check predictions for adversarial
+                delta_ratios = self._get_adversarial_ratios(
+                    adversarial_values,
+                    ground_truths[remaining],
+                    None
+                    if image_shapes is None
+                    else [image_shapes[index] for index in remaining],
+                    "adv_pred" + str(iteration) + str(count_test),
+                )
+                current_deltas[remaining] = np.where(
+                    delta_ratios < delta_ratio_min_threshold,
+                    current_deltas[remaining] * self._adapt_value,
+                    np.where(
+                        delta_ratios > delta_ratio_max_threshold,
+                        current_deltas[remaining] / self._adapt_value,
+                        current_deltas[remaining],
+                    ),
+                )
+
+                satisfied = delta_ratios > delta_ratio_zero_threshold
+                x_adversarial_arrays[remaining[satisfied]] = adversarial_values[
+                    satisfied
+                ]
+                has_adversarial_array[remaining[satisfied]] = True
+                remaining = remaining[~satisfied]
+
+            # Move the adversarial samples towards the original samples, until some of them are adversarial
+            remaining = np.flatnonzero(has_adversarial_array)
+            for count_test in range(self._max_test):
+                if len(remaining) == 0:
+                    break
+
+                perturb = (
+                    originals[remaining][:, np.newaxis]
+                    - x_adversarial_arrays[remaining]
+                )
+                perturb *= current_epsilons[remaining][:, np.newaxis, np.newaxis]
+                potential_adversarials = np.clip(
+                    x_adversarial_arrays[remaining] + perturb,
+                    min_feature_value,
+                    max_feature_value,
+                )
+
+                epsilon_ratios = self._get_adversarial_ratios(
+                    potential_adversarials,
+                    ground_truths[remaining],
+                    None
+                    if image_shapes is None
+                    else [image_shapes[index] for index in remaining],
+                    "potential_adv_pred" + str(iteration) + str(count_test),
+                )
+                current_epsilons[remaining] = np.where(
+                    epsilon_ratios < epsilon_ratio_min_threshold,
+                    current_epsilons[remaining] * self._adapt_value,
+                    np.where(
+                        epsilon_ratios > epsilon_ratio_max_threshold,
+                        current_epsilons[remaining] / self._adapt_value,
+                        current_epsilons[remaining],
+                    ),
+                )
+
+                satisfied = epsilon_ratios > epsilon_ratio_zero_threshold
+                if np.any(satisfied):
+                    x_adversarials[remaining[satisfied]] = self._best_adversarial(
+                        originals[remaining[satisfied]],
+                        x_adversarial_arrays[remaining[satisfied]],
+                    )
+                remaining = remaining[~satisfied]
+
+        return x_adversarials
+
+    def _get_adversarial_ratios(
+        self,
+        potential_adversarials: np.ndarray,
+        ground_truths: np.ndarray,
+        image_shapes: Union[List, None],
+        subfolder_name: str,
+    ) -> np.ndarray:
+        """
+        This method predicts the potential adversarial examples of all the samples in one call,
+        and computes the ratio of the potential adversarial examples of each sample that are adversarial.
+
+        Args:
+            potential_adversarials (np.ndarray): the potential adversarial examples of each sample
+            (N, max_sample, D)
+            ground_truths (np.ndarray): the ground truth of the samples (N,)
+            image_shapes (Union[List, None]): the image shapes of the samples, or None for tabular data
+            subfolder_name (str): the name of the subfolder to save the images in
+
+        Returns:
+            np.ndarray: the ratio of adversarial examples of each sample (N,)
+        """
+        num_samples, num_potential_adversarials = potential_adversarials.shape[:2]
+        potential_adversarials = potential_adversarials.reshape(
+            (num_samples * num_potential_adversarials,)
+            + potential_adversarials.shape[2:]
+        )
+
+        if (
+            self._check_for_xgb_model_type()
+            and self._model_instance._model_algorithm == "xgboost.core.Booster"
+        ):
+            potential_adversarials_to_predict = pd.DataFrame(
+                potential_adversarials, columns=self._data_labels
+            )
+        else:
+            if image_shapes is not None:
+                image_shapes = [
+                    image_shape
+                    for image_shape in image_shapes
+                    for _ in range(num_potential_adversarials)
+                ]
+            potential_adversarials_to_predict = self._transform_to_df(
+                potential_adversarials, image_shapes, subfolder_name=subfolder_name
+            )
+
+        potential_adversarials_prediction = np.asarray(
+            self._model.predict(
+                [potential_adversarials_to_predict], self._data_labels_items
+            )
+        ).reshape(num_samples, num_potential_adversarials)
+        satisfied = potential_adversarials_prediction != ground_truths[:, np.newaxis]
+        return np.mean(satisfied, axis=1)
+
     def _salt_and_pepper(self, image: np.ndarray, severity: int = 1) -> np.ndarray:
         """
         Adding salt and pepper noise to images
@@ -940,77 +1056,82 @@ class Plugin(IAlgorithm):
         return out.astype(np.float32)
 
     def _best_adversarial(
-        self, original_sample: np.ndarray, potential_advs: np.ndarray
+        self, original_samples: np.ndarray, potential_advs: np.ndarray
     ) -> np.ndarray:
         """
-        From the potential adversarial examples, find the one that has the minimum L2 distance from the original sample
+        From the potential adversarial examples of each sample, find the one that has the minimum L2 distance
+        from the original sample
 
         Reference:
         https://github.com/Trusted-AI/adversarial-robustness-toolbox/blob/main/art/attacks/evasion/boundary.py::_best_adv
 
         Args:
-            original_sample (np.ndarray): The original input.
-            potential_advs (np.ndarray): Array containing the potential adversarial examples
+            original_samples (np.ndarray): The original inputs (N, D)
+            potential_advs (np.ndarray): Array containing the potential adversarial examples of each input
+            (N, max_sample, D)
 
         Returns:
-            np.ndarray: The adversarial example that has the minimum L2 distance from the original input
+            np.ndarray: The adversarial examples that have the minimum L2 distance from the original inputs (N, D)
         """
         shape = potential_advs.shape
         min_idx = np.linalg.norm(
-            original_sample.flatten() - potential_advs.reshape(shape[0], -1), axis=1
-        ).argmin()
-        return potential_advs[min_idx]
+            original_samples.reshape(shape[0], 1, -1)
+            - potential_advs.reshape(shape[0], shape[1], -1),
+            axis=2,
+        ).argmin(axis=1)
+        return potential_advs[np.arange(shape[0]), min_idx]
 
     def _orthogonal_step(
-        self, delta: float, current: np.ndarray, original: np.ndarray
+        self, delta: np.ndarray, current: np.ndarray, original: np.ndarray
     ) -> np.ndarray:
         """
-        This method takes orthogonal step to close up the distance between current and original input.
+        This method takes orthogonal steps to close up the distance between current and original inputs.
         Find the least perturbation to cause the change in prediction.
+        max_sample number of steps are taken for each input.
 
         Args:
-            delta (float): the step size for this orthogonal step
-            current (np.ndarray): the current adversarial sample used to compute
-            original (np.ndarray): the original input
+            delta (np.ndarray): the step size for the orthogonal steps of each input (N,)
+            current (np.ndarray): the current adversarial samples used to compute (N, D)
+            original (np.ndarray): the original inputs (N, D)
 
         Returns:
-            ndarray: the possible perturbed input
+            ndarray: the possible perturbations of each input (N, max_sample, D)
 
         Reference:
         https://github.com/Trusted-AI/adversarial-robustness-toolbox/blob/main/art/attacks/evasion/boundary.py::_orthogonal_perturb
         https://github.com/bethgelab/foolbox/blob/12abe74e2f1ec79edb759454458ad8dd9ce84939/foolbox/attacks/boundary_attack.py#L107
         """
-        # Generate a perturbation randomly
-        random_perturb = np.random.randn(original.shape[0])
+        # Generate the perturbations randomly
+        random_perturb = np.random.randn(
+            original.shape[0], self._max_sample, original.shape[1]
+        )
 
-        random_perturb /= np.linalg.norm(random_perturb)
+        random_perturb /= np.linalg.norm(random_perturb, axis=2, keepdims=True)
 
         # if the current distance is same as the original intput
         # we need to stop perturbation -> this happens for tabular dataset
         current_delta = original - current
-        if current_delta.all() != 0:
-            random_perturb *= delta * np.linalg.norm(original - current)
-
-            # Spherical/compute the difference between the original and current adversarial sample
-            direction = original - current
+        can_perturb = np.all(current_delta != 0, axis=1)
 
-            flatten_direction = direction.flatten()
-            flatten_perturb = random_perturb.flatten()
+        distance = np.linalg.norm(current_delta, axis=1)
+        random_perturb *= (delta * distance)[:, np.newaxis, np.newaxis]
 
-            flatten_direction /= np.linalg.norm(flatten_direction)
-            flatten_perturb -= (
-                np.dot(flatten_perturb, flatten_direction.T) * flatten_direction
-            )
-            perturb = flatten_perturb.reshape(original.shape[0])
+        # Spherical/compute the difference between the original and current adversarial sample
+        direction = current_delta / np.where(can_perturb, distance, 1.0)[:, np.newaxis]
+        random_perturb -= (
+            np.einsum("nsd,nd->ns", random_perturb, direction)[:, :, np.newaxis]
+            * direction[:, np.newaxis, :]
+        )
 
-            # Compute the perturbation for this orthogonal move
-            hypotenuse = np.sqrt(1 + delta**2)
-            perturb = ((1 - hypotenuse) * (current - original) + perturb) / hypotenuse
+        # Compute the perturbation for this orthogonal move
+        hypotenuse = np.sqrt(1 + delta**2)[:, np.newaxis, np.newaxis]
+        perturb = (
+            (1 - hypotenuse) * (current - original)[:, np.newaxis, :] + random_perturb
+        ) / hypotenuse
 
-        else:
-            perturb = current
-
-        return perturb
+        return np.where(
+            can_perturb[:, np.newaxis, np.newaxis], perturb, current[:, np.newaxis, :]
+        )
 
     def _format_result(
         self,
@@ -1055,4 +1176,4 @@ class Plugin(IAlgorithm):
             and self._model_instance.get_model_plugin_type() is ModelPluginType.XGBOOST
         ):
             return True
-        return False
\ No newline at end of file
+        return False
@@ -1,12 +1,14 @@
 import logging
 from pathlib import Path
 
+import numpy as np
 import pytest
 from robustness_toolbox import Plugin
 from test_engine_core.interfaces.idata import IData
 from test_engine_core.interfaces.ipipeline import IPipeline
 from test_engine_core.plugins.enums.model_type import ModelType
 from test_engine_core.plugins.enums.plugin_type import PluginType
+from test_engine_core.plugins.enums.serializer_plugin_type import SerializerPluginType
 from test_engine_core.plugins.metadata.plugin_metadata import PluginMetadata
 from test_engine_core.plugins.plugins_manager import PluginManager
 from test_engine_core.utils.json_utils import (
@@ -509,3 +511,107 @@ def test_valid_run(get_data_instance_and_serializer_without_ground_truth):
     )
 
     assert validate_status == True
+
+
+class ThresholdModel:
+    """
+    A model predicting 1 if the first feature is above 0.5, else 0, which counts the predict calls
+    """
+
+    def __init__(self):
+        self.predict_calls = 0
+
+    def predict(self, data, *args):
+        self.predict_calls += 1
+        return (np.asarray(data[0])[:, 0] > 0.5).astype(int)
+
+
+class TabularSerializer:
+    def get_serializer_plugin_type(self):
+        return SerializerPluginType.PICKLE
+
+
+def get_tabular_attack_plugin(model):
+    test_object = TestObject()
+    test_plugin = Plugin(
+        test_object._data_instance_and_serializer,
+        test_object._model_instance_and_serializer,
+        test_object._ground_truth_instance_and_serializer,
+        test_object._data_instance_and_serializer[0],
+        test_object._model_instance_and_serializer[0],
+        **test_object._input_args,
+    )
+    # Attack tabular samples with the threshold model
+    test_plugin._serializer_instance = TabularSerializer()
+    test_plugin._model = model
+    test_plugin._data_labels_items = None
+    return test_plugin
+
+
+@pytest.mark.parametrize("num_samples", [1, 4, 20])
+def test_boundary_attack_predict_calls(num_samples):
+    np.random.seed(0)
+    model = ThresholdModel()
+    test_plugin = get_tabular_attack_plugin(model)
+
+    originals = np.tile([0.2, 0.3, 0.4], (num_samples, 1))
+    adversarials = np.tile([0.9, 0.8, 0.7], (num_samples, 1))
+    test_plugin._boundary_attack(
+        originals, np.zeros(num_samples, dtype=int), adversarials, 0.0, 1.0, None
+    )
+
+    # The candidates of all the samples are predicted together in each step
+    assert (
+        0
+        < model.predict_calls
+        <= 2 * test_plugin._max_test * (test_plugin._max_iteration)
+    )
+
+
+def test_get_adversarial_ratios_with_ground_truth_per_sample():
+    model = ThresholdModel()
+    test_plugin = get_tabular_attack_plugin(model)
+
+    # All the candidates are predicted as 1, which is only adversarial for the first sample
+    potential_adversarials = np.full((2, test_plugin._max_sample, 3), 0.9)
+    ratios = test_plugin._get_adversarial_ratios(
+        potential_adversarials, np.array([0, 1]), None, "adv_pred"
+    )
+    assert ratios.tolist() == [1.0, 0.0]
+    assert model.predict_calls == 1
+
+
+def test_boundary_attack_with_ground_truth_per_sample():
+    np.random.seed(0)
+    model = ThresholdModel()
+    test_plugin = get_tabular_attack_plugin(model)
+
+    originals = np.array([[0.2, 0.3, 0.4], [0.8, 0.7, 0.6]])
+    ground_truths = np.array([0, 1])
+    adversarials = np.array([[0.9, 0.8, 0.7], [0.1, 0.2, 0.3]])
+    final_adversarials = test_plugin._boundary_attack(
+        originals, ground_truths, adversarials, 0.0, 1.0, None
+    )
+
+    # Each sample stays adversarial to its own ground truth, and moves towards its original sample
+    assert model.predict([final_adversarials]).tolist() == [1, 0]
+    assert np.all(
+        np.linalg.norm(final_adversarials - originals, axis=1)
+        < np.linalg.norm(adversarials - originals, axis=1)
+    )
+
+
+def test_boundary_attack_keeps_adversarial_without_candidates():
+    np.random.seed(0)
+    model = ThresholdModel()
+    test_plugin = get_tabular_attack_plugin(model)
+
+    # The second sample has no adversarial candidates near its current adversarial sample
+    originals = np.array([[0.2, 0.3, 0.4], [0.1, 0.2, 0.3]])
+    adversarials = np.array([[0.9, 0.8, 0.7], [0.3, 0.4, 0.5]])
+    final_adversarials = test_plugin._boundary_attack(
+        originals, np.array([0, 0]), adversarials, 0.0, 1.0, None
+    )
+
+    assert not np.array_equal(final_adversarials[0], adversarials[0])
+    assert np.array_equal(final_adversarials[1], adversarials[1])
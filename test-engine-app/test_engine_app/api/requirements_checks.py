@@ -1,8 +1,8 @@
-import json
+import importlib
 import logging
-import subprocess
-import sys
+from importlib import metadata
 from pathlib import Path
+from threading import Lock
 from typing import Dict, List, Tuple, Union
 
 import semantic_version
@@ -16,6 +16,9 @@ class RequirementsChecks:
     _logger: Union[AppLogger, None] = None
     _validation_schema_folder: str = ""
     _validation_schema_file: str = ""
+    _installed_packages: Union[Dict[str, str], None] = None
+    _is_installed_packages_cached: bool = False
+    _installed_packages_lock: Lock = Lock()
 
     def __init__(self, query: MultiDictProxy):
         self._query: MultiDictProxy = query
@@ -46,6 +49,57 @@ class RequirementsChecks:
             / "test_engine_requirements_check_response_schema.json"
         )
 
+    @staticmethod
+    def set_installed_packages_cache(is_cached: bool) -> None:
+        """
+        A method to enable or disable the cached index of installed packages.
+        The cache should only be enabled when the index is reset on algorithm install and update.
+        If the cache is enabled, the index is built immediately for the first requirements check
+
+        Args:
+            is_cached (bool): Whether the index of installed packages is cached
+        """
+        with RequirementsChecks._installed_packages_lock:
+            RequirementsChecks._is_installed_packages_cached = is_cached
+            if is_cached:
+                RequirementsChecks._installed_packages = (
+                    RequirementsChecks.load_installed_packages()
+                )
+            else:
+                RequirementsChecks._installed_packages = None
+
+    @staticmethod
+    def reset_installed_packages(message: Dict) -> None:
+        """
+        A callback method to reset the cached index of installed packages when an algorithm
+        is installed or updated. The index is rebuilt on the next requirements check
+
+        Args:
+            message (Dict): A pubsub message indicating the algorithm id
+        """
+        with RequirementsChecks._installed_packages_lock:
+            RequirementsChecks._installed_packages = None
+
+    @staticmethod
+    def load_installed_packages() -> Dict[str, str]:
+        """
+        A method to build the index of installed packages on the host environment from the package metadata
+
+        Returns:
+            Dict[str, str]: The installed package versions, keyed by the lowercase package names
+        """
+        # Clear the finder caches so that newly installed packages are found
+        importlib.invalidate_caches()
+        installed_packages = dict()
+        for distribution in metadata.distributions():
+            package_name = distribution.metadata["Name"]
+            if package_name:
+                # Keep the first package found on the path, which is the package that will be imported
+                installed_packages.setdefault(
+                    package_name.lower(), distribution.version
+                )
+        return installed_packages
+
     def is_packages_supported(self) -> List:
         """
         A method to check if the input schema is correct and packages version requirement can
@@ -79,7 +133,7 @@ class RequirementsChecks:
             )
             return results
 
-        # Getting the installed packages using pip list
+        # Getting the installed packages from the package metadata
         is_success, installed_packages, error_message = self._get_installed_packages()
         if not is_success:
             AppLogger.add_to_log(
@@ -207,7 +261,7 @@ class RequirementsChecks:
             return False, "The inputs do not meet the validation rules"
 
     def _is_package_supported(
-        self, requirement: str, installed_packages: List
+        self, requirement: str, installed_packages: Dict[str, str]
     ) -> Tuple[bool, str]:
         """
         A helper method to check if the package version requirement can be supported in
@@ -215,7 +269,7 @@ class RequirementsChecks:
 
         Args:
             requirement (str): specifying package and the version requirement e.g.:'numpy>=1.2.3, <2.0.0'
-            installed_packages (List): the installed packages using pip list on the system.
+            installed_packages (Dict[str, str]): the installed package versions on the system.
 
         Returns:
             Tuple[bool, str]: Returns bool indicating whether the package is supported and the error message if
@@ -296,42 +350,48 @@ class RequirementsChecks:
             )
 
     def _get_installed_package_version(
-        self, package_name: str, installed_packages: List
+        self, package_name: str, installed_packages: Dict[str, str]
     ) -> Tuple[bool, Union[None, str], str]:
         """
-        A helper method to find the installed package in the pip list and retrieve the version
+        A helper method to find the installed package in the index of installed packages and retrieve the version
 
         Args:
             package_name (str): The package name
-            installed_packages (List): The installed packages obtained through pip list
+            installed_packages (Dict[str, str]): The installed package versions, keyed by the lowercase package names
 
         Returns:
             Tuple[bool, Union[None, str], str]: Returns a tuple containing bool indicating whether call is successful.
              If the call is successful, the installed package version and empty string.
              If the call is unsuccessful, it will be None with an error message.
         """
-        for package_info in installed_packages:
-            if package_name == package_info["name"].lower():
-                return True, package_info["version"], ""
+        package_version = installed_packages.get(package_name)
+        if package_version is not None:
+            return True, package_version, ""
         return False, None, "Unable to get package version"
 
-    def _get_installed_packages(self) -> Tuple[bool, Union[None, List], str]:
+    def _get_installed_packages(self) -> Tuple[bool, Union[None, Dict[str, str]], str]:
         """
-        A helper method to get the installed packages on the host environment
+        A helper method to get the installed packages on the host environment.
+        If the cache is enabled, the index of installed packages is only built once until it is reset
 
         Returns:
-            Tuple[bool, Union[None, List], str]: Returns a tuple containing bool
+            Tuple[bool, Union[None, Dict[str, str]], str]: Returns a tuple containing bool
             indicating whether the call is successful.
-            If the call is successful, it will return a list of packages obtained through pip list.
+            If the call is successful, it will return the installed package versions keyed by the package names.
             If the call is unsuccessful, it will return None with an error message
         """
         try:
-            result = subprocess.check_output(
-                [sys.executable, "-m", "pip", "list", "--format", "json"]
-            )
-            return True, json.loads(result), ""
+            with RequirementsChecks._installed_packages_lock:
+                if not RequirementsChecks._is_installed_packages_cached:
+                    return True, RequirementsChecks.load_installed_packages(), ""
+
+                if RequirementsChecks._installed_packages is None:
+                    RequirementsChecks._installed_packages = (
+                        RequirementsChecks.load_installed_packages()
+                    )
+                return True, RequirementsChecks._installed_packages, ""
 
-        except json.JSONDecodeError as error:
+        except Exception as error:
             error_msg = str(error)
             return False, None, error_msg
 
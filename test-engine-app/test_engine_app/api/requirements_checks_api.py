@@ -11,6 +11,7 @@ from test_engine_app.api.requirements_checks import RequirementsChecks
 from test_engine_app.app_logger import AppLogger
 from test_engine_app.config.environment_variables import EnvironmentVariables
 from test_engine_app.enums.worker_type import WorkerType
+from test_engine_app.network.redis import Redis
 
 
 class RequirementsChecksApi:
@@ -147,6 +148,9 @@ class RequirementsChecksApi:
                 kwargs.get("validation_schema_folder")
             )
 
+            # Cache the index of installed packages, and reset it on algorithm install and update
+            RequirementsChecksApi._setup_installed_packages_cache(kwargs.get("logger"))
+
             # Create API server
             app = web.Application()
             app.add_routes(RequirementsChecksApi._routes)
@@ -170,6 +174,42 @@ class RequirementsChecksApi:
                 "requirements_check_api.py",
             )
 
+    @staticmethod
+    def _setup_installed_packages_cache(logger: AppLogger) -> None:
+        """
+        A helper method to subscribe to the algorithm install and update pub/sub channels, and enable
+        the cached index of installed packages in RequirementsChecks.
+        If the channels cannot be subscribed, the index is rebuilt for every requirements check instead.
+
+        Args:
+            logger (AppLogger): The logger instance
+        """
+        Redis.set_logger(logger)
+        Redis.setup(
+            EnvironmentVariables.get_redis_server_hostname(),
+            EnvironmentVariables.get_redis_server_port(),
+        )
+        is_success = Redis.connect_to_algorithm_pubsub(
+            **{
+                "ALGO_INSTALL": RequirementsChecks.reset_installed_packages,
+                "ALGO_UPDATE": RequirementsChecks.reset_installed_packages,
+            }
+        )
+        RequirementsChecks.set_installed_packages_cache(is_success)
+        if is_success:
+            AppLogger.add_to_log(
+                RequirementsChecksApi._logger,
+                logging.INFO,
+                "The system worker has cached the installed packages",
+            )
+        else:
+            AppLogger.add_to_log(
+                RequirementsChecksApi._logger,
+                logging.WARNING,
+                "The system worker is unable to subscribe to the algorithm channels. "
+                "The installed packages will be read for every requirements check",
+            )
+
     @staticmethod
     def trigger_signal_handler(signum, frame) -> None:
         """
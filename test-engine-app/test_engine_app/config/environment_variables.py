@@ -17,6 +17,14 @@ class EnvironmentVariables:
     _redis_server_hostname: str = "localhost"
     _redis_server_port: int = 6379
     _api_server_port: int = 8080
+    _task_executor_max_tasks: int = 0
+    _task_executor_max_memory: int = 0
+    _worker_prefetch_items: int = 1
+    _worker_concurrent_items: int = 1
+    _shared_data_max_memory: int = 0
+    _shared_data_namespace: str = ""
+    _instance_cache_max_items: int = 8
+    _instance_cache_max_size: int = 4096
 
     def __init__(self):
         try:
@@ -35,6 +43,14 @@ class EnvironmentVariables:
             hostname = os.getenv("REDIS_SERVER_HOSTNAME", "localhost")
             server_port = int(os.getenv("REDIS_SERVER_PORT", 6379))
             api_server_port = int(os.getenv("API_SERVER_PORT", 8080))
+            task_executor_max_tasks = int(os.getenv("TASK_EXECUTOR_MAX_TASKS", 0))
+            task_executor_max_memory = int(os.getenv("TASK_EXECUTOR_MAX_MEMORY", 0))
+            worker_prefetch_items = int(os.getenv("WORKER_PREFETCH_ITEMS", 1))
+            worker_concurrent_items = int(os.getenv("WORKER_CONCURRENT_ITEMS", 1))
+            shared_data_max_memory = int(os.getenv("SHARED_DATA_MAX_MEMORY", 0))
+            shared_data_namespace = os.getenv("SHARED_DATA_NAMESPACE", "")
+            instance_cache_max_items = int(os.getenv("INSTANCE_CACHE_MAX_ITEMS", 8))
+            instance_cache_max_size = int(os.getenv("INSTANCE_CACHE_MAX_SIZE", 4096))
 
             error_count, _ = EnvironmentVariables._validate_data(
                 core_modules_folder,
@@ -43,6 +59,13 @@ class EnvironmentVariables:
                 hostname,
                 server_port,
                 api_server_port,
+                task_executor_max_tasks,
+                task_executor_max_memory,
+                worker_prefetch_items,
+                worker_concurrent_items,
+                shared_data_max_memory,
+                instance_cache_max_items,
+                instance_cache_max_size,
             )
 
             if error_count == 0:
@@ -54,6 +77,18 @@ class EnvironmentVariables:
                 EnvironmentVariables._redis_server_hostname = hostname
                 EnvironmentVariables._redis_server_port = server_port
                 EnvironmentVariables._api_server_port = api_server_port
+                EnvironmentVariables._task_executor_max_tasks = task_executor_max_tasks
+                EnvironmentVariables._task_executor_max_memory = (
+                    task_executor_max_memory
+                )
+                EnvironmentVariables._worker_prefetch_items = worker_prefetch_items
+                EnvironmentVariables._worker_concurrent_items = worker_concurrent_items
+                EnvironmentVariables._shared_data_max_memory = shared_data_max_memory
+                EnvironmentVariables._shared_data_namespace = shared_data_namespace
+                EnvironmentVariables._instance_cache_max_items = (
+                    instance_cache_max_items
+                )
+                EnvironmentVariables._instance_cache_max_size = instance_cache_max_size
             else:
                 # Validation failed. Use defaults.
                 pass
@@ -70,6 +105,13 @@ class EnvironmentVariables:
         hostname: str,
         server_port: int,
         api_server_port: int,
+        task_executor_max_tasks: int,
+        task_executor_max_memory: int,
+        worker_prefetch_items: int,
+        worker_concurrent_items: int,
+        shared_data_max_memory: int,
+        instance_cache_max_items: int,
+        instance_cache_max_size: int,
     ) -> Tuple[int, str]:
         """
         A helper method to perform data validation on the different arguments.
@@ -81,6 +123,13 @@ class EnvironmentVariables:
             hostname (str): The redis hostname
             server_port (int): The redis server port
             api_server_port (int): The api server port to host on
+            task_executor_max_tasks (int): The number of tasks before the task process is recycled
+            task_executor_max_memory (int): The memory usage (MB) before the task process is recycled
+            worker_prefetch_items (int): The number of stream messages the worker reads ahead
+            worker_concurrent_items (int): The number of stream messages the worker processes concurrently
+            shared_data_max_memory (int): The total size (MB) of data the task process places in shared memory
+            instance_cache_max_items (int): The number of loaded instances the task process keeps
+            instance_cache_max_size (int): The total file size (MB) of loaded instances the task process keeps
 
         Returns:
             Tuple[int, str]: Returns the error count and the error messages.
@@ -132,6 +181,38 @@ class EnvironmentVariables:
             error_count += 1
             error_message += "The API server port is outside expected range;"
 
+        # Task Executor
+        if task_executor_max_tasks < 0:
+            error_count += 1
+            error_message += "The task executor max tasks is outside expected range;"
+
+        if task_executor_max_memory < 0:
+            error_count += 1
+            error_message += "The task executor max memory is outside expected range;"
+
+        # Worker
+        if worker_prefetch_items < 1:
+            error_count += 1
+            error_message += "The worker prefetch items is outside expected range;"
+
+        if worker_concurrent_items < 1:
+            error_count += 1
+            error_message += "The worker concurrent items is outside expected range;"
+
+        # Shared Data
+        if shared_data_max_memory < 0:
+            error_count += 1
+            error_message += "The shared data max memory is outside expected range;"
+
+        # Instance Cache
+        if instance_cache_max_items < 0:
+            error_count += 1
+            error_message += "The instance cache max items is outside expected range;"
+
+        if instance_cache_max_size < 0:
+            error_count += 1
+            error_message += "The instance cache max size is outside expected range;"
+
         return error_count, error_message
 
     @staticmethod
@@ -154,7 +235,20 @@ class EnvironmentVariables:
             f"REDIS_SERVER_HOSTNAME: {EnvironmentVariables._redis_server_hostname}\n"
         )
         return_str += f"REDIS_SERVER_PORT: {EnvironmentVariables._redis_server_port}\n"
-        return_str += f"API_SERVER_PORT: {EnvironmentVariables._api_server_port}"
+        return_str += f"API_SERVER_PORT: {EnvironmentVariables._api_server_port}\n"
+        return_str += f"TASK_EXECUTOR_MAX_TASKS: {EnvironmentVariables._task_executor_max_tasks}\n"
+        return_str += f"TASK_EXECUTOR_MAX_MEMORY: {EnvironmentVariables._task_executor_max_memory}\n"
+        return_str += (
+            f"WORKER_PREFETCH_ITEMS: {EnvironmentVariables._worker_prefetch_items}\n"
+        )
+        return_str += f"WORKER_CONCURRENT_ITEMS: {EnvironmentVariables._worker_concurrent_items}\n"
+        return_str += (
+            f"SHARED_DATA_MAX_MEMORY: {EnvironmentVariables._shared_data_max_memory}\n"
+        )
+        return_str += f"INSTANCE_CACHE_MAX_ITEMS: {EnvironmentVariables._instance_cache_max_items}\n"
+        return_str += (
+            f"INSTANCE_CACHE_MAX_SIZE: {EnvironmentVariables._instance_cache_max_size}"
+        )
 
         return return_str
 
@@ -217,3 +311,92 @@ class EnvironmentVariables:
             int: api server port number
         """
         return int(EnvironmentVariables._api_server_port)
+
+    @staticmethod
+    def get_task_executor_max_tasks() -> int:
+        """
+        A method to return the number of tasks the resident task process runs before it is recycled.
+        0 indicates that a new task process is started for every task.
+
+        Returns:
+            int: task executor max tasks
+        """
+        return int(EnvironmentVariables._task_executor_max_tasks)
+
+    @staticmethod
+    def get_task_executor_max_memory() -> int:
+        """
+        A method to return the memory usage (MB) of the resident task process before it is recycled.
+        0 indicates that there is no memory limit.
+
+        Returns:
+            int: task executor max memory in MB
+        """
+        return int(EnvironmentVariables._task_executor_max_memory)
+
+    @staticmethod
+    def get_worker_prefetch_items() -> int:
+        """
+        A method to return the number of stream messages the worker reads from the stream at one time.
+        The worker holds up to this number of messages or the concurrent items, whichever is larger.
+
+        Returns:
+            int: worker prefetch items
+        """
+        return int(EnvironmentVariables._worker_prefetch_items)
+
+    @staticmethod
+    def get_worker_concurrent_items() -> int:
+        """
+        A method to return the number of stream messages the worker processes concurrently
+
+        Returns:
+            int: worker concurrent items
+        """
+        return int(EnvironmentVariables._worker_concurrent_items)
+
+    @staticmethod
+    def get_shared_data_max_memory() -> int:
+        """
+        A method to return the total size (MB) of data the task process places in shared memory,
+        so that the task processes on the same node can map the data instead of reading it again.
+        0 disables the shared data.
+
+        Returns:
+            int: shared data max memory
+        """
+        return int(EnvironmentVariables._shared_data_max_memory)
+
+    @staticmethod
+    def get_shared_data_namespace() -> str:
+        """
+        A method to return the secret namespace of the shared data. The workers on the same node given the
+        same namespace share the data between their task processes. It is not printed as it is a secret.
+        An empty string indicates that each worker generates a random namespace for its task processes.
+
+        Returns:
+            str: shared data namespace
+        """
+        return str(EnvironmentVariables._shared_data_namespace)
+
+    @staticmethod
+    def get_instance_cache_max_items() -> int:
+        """
+        A method to return the number of loaded data, model and pipeline instances the task process keeps,
+        so that the tasks working on the same files do not need to load them again.
+        0 disables the instance cache.
+
+        Returns:
+            int: instance cache max items
+        """
+        return int(EnvironmentVariables._instance_cache_max_items)
+
+    @staticmethod
+    def get_instance_cache_max_size() -> int:
+        """
+        A method to return the total file size (MB) of the loaded instances the task process keeps
+
+        Returns:
+            int: instance cache max size
+        """
+        return int(EnvironmentVariables._instance_cache_max_size)
@@ -192,6 +192,26 @@ class Redis:
         else:
             return False
 
+    @staticmethod
+    def connect_to_algorithm_pubsub(**kwargs) -> bool:
+        """
+        A method to set up Redis Pubsub for processes which only need the algo install/update channels
+
+        Returns:
+            bool: Returns a bool to indicate if the call is successful.
+        """
+        Redis._algo_install_pubsub, _ = Redis._subscribe_channel(
+            REDIS_PUBSUB_ALGO_INSTALL_NAME, kwargs.get("ALGO_INSTALL", None)
+        )
+        Redis._algo_update_pubsub, _ = Redis._subscribe_channel(
+            REDIS_PUBSUB_ALGO_UPDATE_NAME, kwargs.get("ALGO_UPDATE", None)
+        )
+
+        if Redis._algo_install_pubsub and Redis._algo_update_pubsub:
+            return True
+        else:
+            return False
+
     @staticmethod
     def get_algorithm_info(algorithm_id: str) -> Dict:
         """
@@ -0,0 +1,196 @@
+import copy
+import glob
+from collections import OrderedDict
+from multiprocessing import Lock
+from pathlib import Path
+from typing import Any, Tuple, Union
+
+from test_engine_core.plugins.enums.plugin_type import PluginType
+from test_engine_core.utils.validate_checks import is_empty_string
+
+
+class InstanceCache:
+    """
+    InstanceCache class keeps the recently loaded data, ground truth, model and pipeline instances
+    so that tasks working on the same files do not need to deserialize them again.
+    The entries are keyed by the plugin type, the file path, the arguments the instances were loaded with,
+    and the modification time and size of every file, and are evicted in least recently used order when
+    the number of entries or total file size exceeds the limits.
+    """
+
+    _max_items: int = 8
+    _max_size: int = 4096 * 1024 * 1024  # bytes
+    _current_size: int = 0
+    _entries: OrderedDict = OrderedDict()
+    lock: Lock = Lock()
+
+    @staticmethod
+    def setup(max_items: int, max_size: int) -> None:
+        """
+        A method to set up the limits of the instance cache. The entries exceeding the new limits are evicted
+
+        Args:
+            max_items (int): The number of entries kept in the cache. 0 disables it
+            max_size (int): The total file size (MB) of the entries kept in the cache
+        """
+        with InstanceCache.lock:
+            if isinstance(max_items, int) and max_items >= 0:
+                InstanceCache._max_items = max_items
+            if isinstance(max_size, int) and max_size >= 0:
+                InstanceCache._max_size = max_size * 1024 * 1024
+
+            # Evict the least recently used entries until it is within the limits
+            while InstanceCache._entries and (
+                len(InstanceCache._entries) > InstanceCache._max_items
+                or InstanceCache._current_size > InstanceCache._max_size
+            ):
+                InstanceCache._remove_entry(next(iter(InstanceCache._entries)))
+
+    @staticmethod
+    def get(
+        plugin_type: PluginType, path: str, arguments: Tuple = tuple()
+    ) -> Union[Any, None]:
+        """
+        A method to retrieve a copy of the cached instances for this plugin type, path and arguments
+
+        Args:
+            plugin_type (PluginType): The plugin type of the cached instances
+            path (str): The file/folder path the instances were loaded from
+            arguments (Tuple): The arguments the instances were loaded with (i.e. the columns). Defaults to ()
+
+        Returns:
+            Union[Any, None]: A copy of the cached instances, or None if they are not cached or outdated
+        """
+        signature = InstanceCache._get_path_signature(plugin_type, path, arguments)
+        if signature is None:
+            return None
+
+        key, _ = signature
+        with InstanceCache.lock:
+            if key not in InstanceCache._entries:
+                return None
+
+            # Mark this entry as the most recently used
+            InstanceCache._entries.move_to_end(key)
+            cached_instances, _ = InstanceCache._entries[key]
+
+        # Return a copy as the instances are modified while the task is running
+        return copy.deepcopy(cached_instances)
+
+    @staticmethod
+    def put(
+        plugin_type: PluginType, path: str, instances: Any, arguments: Tuple = tuple()
+    ) -> bool:
+        """
+        A method to store a copy of the loaded instances for this plugin type, path and arguments
+
+        Args:
+            plugin_type (PluginType): The plugin type of the instances
+            path (str): The file/folder path the instances were loaded from
+            instances (Any): The loaded instances
+            arguments (Tuple): The arguments the instances were loaded with (i.e. the columns). Defaults to ()
+
+        Returns:
+            bool: True if the instances are cached, else False
+        """
+        signature = InstanceCache._get_path_signature(plugin_type, path, arguments)
+        if signature is None:
+            return False
+
+        key, size = signature
+        if size > InstanceCache._max_size or InstanceCache._max_items < 1:
+            return False
+
+        try:
+            # Store a copy before the task starts modifying the instances
+            cached_instances = copy.deepcopy(instances)
+        except Exception:
+            return False  # Instances cannot be copied and will not be cached
+
+        with InstanceCache.lock:
+            # Remove outdated entries of the same plugin type, path and arguments
+            for existing_key in list(InstanceCache._entries.keys()):
+                if existing_key[:3] == key[:3]:
+                    InstanceCache._remove_entry(existing_key)
+
+            InstanceCache._entries[key] = (cached_instances, size)
+            InstanceCache._current_size += size
+
+            # Evict the least recently used entries until it is within the limits
+            while (
+                len(InstanceCache._entries) > InstanceCache._max_items
+                or InstanceCache._current_size > InstanceCache._max_size
+            ):
+                InstanceCache._remove_entry(next(iter(InstanceCache._entries)))
+
+        return True
+
+    @staticmethod
+    def clear() -> None:
+        """
+        A method to remove all the cached instances
+        """
+        with InstanceCache.lock:
+            InstanceCache._entries.clear()
+            InstanceCache._current_size = 0
+
+    @staticmethod
+    def _remove_entry(key: Tuple) -> None:
+        """
+        A helper method to remove the cached entry and update the total size.
+        The caller is expected to hold the lock.
+
+        Args:
+            key (Tuple): The key of the entry to be removed
+        """
+        _, size = InstanceCache._entries.pop(key)
+        InstanceCache._current_size -= size
+
+    @staticmethod
+    def _get_path_signature(
+        plugin_type: PluginType, path: str, arguments: Tuple = tuple()
+    ) -> Union[Tuple[Tuple, int], None]:
+        """
+        A helper method to generate the cache key and total file size of the file/folder path
+
+        Args:
+            plugin_type (PluginType): The plugin type of the instances
+            path (str): The file/folder path
+            arguments (Tuple): The arguments the instances were loaded with. Defaults to ()
+
+        Returns:
+            Union[Tuple[Tuple, int], None]: The cache key and total file size, or None if the path is invalid
+        """
+        if (
+            not isinstance(plugin_type, PluginType)
+            or path is None
+            or not isinstance(path, str)
+            or is_empty_string(path)
+            or not isinstance(arguments, tuple)
+        ):
+            return None
+
+        resolved_path = Path(path).resolve()
+        if resolved_path.is_file():
+            file_paths = [resolved_path]
+        elif resolved_path.is_dir():
+            file_paths = sorted(
+                Path(file)
+                for file in glob.glob(f"{resolved_path}/**/*", recursive=True)
+                if Path(file).is_file()
+            )
+        else:
+            return None
+
+        try:
+            file_stats = tuple(
+                (str(file_path), stat_result.st_mtime_ns, stat_result.st_size)
+                for file_path, stat_result in (
+                    (file_path, file_path.stat()) for file_path in file_paths
+                )
+            )
+        except OSError:
+            return None  # Files changed while generating the signature
+
+        total_size = sum(file_stat[2] for file_stat in file_stats)
+        return (plugin_type.name, str(resolved_path), arguments, file_stats), total_size
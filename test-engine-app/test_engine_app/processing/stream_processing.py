@@ -1,5 +1,5 @@
 import logging
-from typing import Callable, Dict, Tuple, Union
+from typing import Any, Callable, Dict, Tuple, Union
 
 from test_engine_core.interfaces.ialgorithm import IAlgorithm
 from test_engine_core.interfaces.idata import IData
@@ -9,8 +9,11 @@ from test_engine_core.interfaces.iserializer import ISerializer
 from test_engine_core.plugins.enums.model_mode_type import ModelModeType
 from test_engine_core.plugins.enums.model_type import ModelType
 from test_engine_core.plugins.enums.plugin_type import PluginType
+from test_engine_core.utils.shared_data import SharedData
+from test_engine_core.utils.validate_checks import is_empty_string
 
 from test_engine_app.app_logger import AppLogger
+from test_engine_app.processing.instance_cache import InstanceCache
 from test_engine_app.processing.plugin_controller import PluginController
 
 
@@ -36,8 +39,10 @@ class StreamProcessing:
             pipeline_instance,
             _,
             _,
-        ) = PluginController.get_plugin_instance(
+        ) = StreamProcessing._get_plugin_instance(
+            logger,
             PluginType.PIPELINE,
+            pipeline_path,
             **{"pipeline_path": pipeline_path},
         )
         # Return true if it is a pipeline model and false if not
@@ -67,8 +72,8 @@ class StreamProcessing:
             data_instance,
             data_serializer_instance,
             error_messages,
-        ) = PluginController.get_plugin_instance(
-            PluginType.DATA, **{"filename": data_path}
+        ) = StreamProcessing._get_plugin_instance(
+            logger, PluginType.DATA, data_path, **{"filename": data_path}
         )
         # log the instance and deserializer
         if data_serializer_instance:
@@ -123,8 +128,10 @@ class StreamProcessing:
             pipeline_instance,
             pipeline_serializer_instance,
             error_messages,
-        ) = PluginController.get_plugin_instance(
+        ) = StreamProcessing._get_plugin_instance(
+            logger,
             PluginType.PIPELINE,
+            pipeline_path,
             **{"pipeline_path": pipeline_path},
         )
         # log the instance and deserializer
@@ -183,19 +190,29 @@ class StreamProcessing:
             If the call is successful, it will include the model and serializer instance and no error messages
             If the call is unsuccessful, it will include error messages
         """
-        (
-            model_instance,
-            model_serializer_instance,
-            error_messages,
-        ) = PluginController.get_plugin_instance(
-            PluginType.MODEL,
-            **{
-                "mode": model_mode,
-                "filename": model_path,
-                "api_schema": api_schema,
-                "api_config": api_config,
-            },
-        )
+        model_arguments = {
+            "mode": model_mode,
+            "filename": model_path,
+            "api_schema": api_schema,
+            "api_config": api_config,
+        }
+        # Only uploaded model files are cached. API models do not have files to deserialize.
+        if model_mode is ModelModeType.UPLOAD:
+            (
+                model_instance,
+                model_serializer_instance,
+                error_messages,
+            ) = StreamProcessing._get_plugin_instance(
+                logger, PluginType.MODEL, model_path, **model_arguments
+            )
+        else:
+            (
+                model_instance,
+                model_serializer_instance,
+                error_messages,
+            ) = PluginController.get_plugin_instance(
+                PluginType.MODEL, **model_arguments
+            )
         # log the instance and deserializer
         if model_serializer_instance:
             AppLogger.add_to_log(
@@ -230,14 +247,17 @@ class StreamProcessing:
 
     @staticmethod
     def load_ground_truth(
-        logger: AppLogger, ground_truth_path: str
+        logger: AppLogger, ground_truth_path: str, ground_truth: Union[str, None] = None
     ) -> Tuple[bool, Tuple[Union[IData, None], Union[ISerializer, None]], str]:
         """
-        A method to load ground truth information
+        A method to load ground truth information.
+        Only the ground truth feature is read from columnar data files, as the other features are not used.
 
         Args:
             logger (AppLogger): The logger for adding logs
             ground_truth_path (str): The path to the ground truth
+            ground_truth (Union[str, None], optional): The ground truth feature. Defaults to None, which reads
+            all the features
 
         Returns:
             Tuple[bool, Tuple[Union[IData, None], Union[ISerializer, None]], str]:
@@ -246,13 +266,18 @@ class StreamProcessing:
             If the call is unsuccessful, it will include error messages
         """
         # Require Ground Truth
+        ground_truth_arguments = {"filename": ground_truth_path}
+        if not is_empty_string(ground_truth):
+            ground_truth_arguments["columns"] = [ground_truth]
         (
             ground_truth_instance,
             ground_truth_serializer_instance,
             error_messages,
-        ) = PluginController.get_plugin_instance(
+        ) = StreamProcessing._get_plugin_instance(
+            logger,
             PluginType.DATA,
-            **{"filename": ground_truth_path},
+            ground_truth_path,
+            **ground_truth_arguments,
         )
         # log the instance and deserializer
         if ground_truth_serializer_instance:
@@ -364,3 +389,56 @@ class StreamProcessing:
                 (algorithm_instance, algorithm_serializer_instance),
                 f"Unable to get algorithm instance: {error_messages}",
             )
+
+    @staticmethod
+    def _get_plugin_instance(
+        logger: AppLogger, plugin_type: PluginType, path: str, **kwargs
+    ) -> Tuple[Any, Union[ISerializer, None], str]:
+        """
+        A helper method to retrieve the plugin and serializer instance from the instance cache.
+        If it is not cached, it will be retrieved from the PluginController and added to the instance cache.
+        The data is not cached when it is mapped from shared memory, as the cache keeps a private copy.
+
+        Args:
+            logger (AppLogger): The logger for adding logs
+            plugin_type (PluginType): The plugin type to be identified
+            path (str): The file/folder path to be loaded
+
+        Returns:
+            Tuple[Any, Union[ISerializer, None], str]: Returns the plugin instance, serializer instance
+            and error messages
+        """
+        # The instances loaded with different columns are cached separately
+        cache_arguments = (
+            (tuple(kwargs["columns"]),)
+            if kwargs.get("columns") is not None
+            else tuple()
+        )
+        is_cacheable = not (plugin_type is PluginType.DATA and SharedData.is_enabled())
+        cached_instances = (
+            InstanceCache.get(plugin_type, path, cache_arguments)
+            if is_cacheable
+            else None
+        )
+        if cached_instances:
+            AppLogger.add_to_log(
+                logger,
+                logging.INFO,
+                f"Reusing the cached {plugin_type.name.lower()} instance: {path}",
+            )
+            plugin_instance, plugin_serializer_instance = cached_instances
+            return plugin_instance, plugin_serializer_instance, ""
+
+        (
+            plugin_instance,
+            plugin_serializer_instance,
+            error_messages,
+        ) = PluginController.get_plugin_instance(plugin_type, **kwargs)
+        if plugin_instance and is_cacheable:
+            InstanceCache.put(
+                plugin_type,
+                path,
+                (plugin_instance, plugin_serializer_instance),
+                cache_arguments,
+            )
+        return plugin_instance, plugin_serializer_instance, error_messages
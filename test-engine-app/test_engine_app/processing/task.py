@@ -11,6 +11,7 @@ from test_engine_app.interfaces.iworkerfunction import IWorkerFunction
 from test_engine_app.processing.plugin_controller import PluginController
 from test_engine_app.processing.stream_formatter import StreamFormatter
 from test_engine_app.processing.task_argument import TaskArgument
+from test_engine_app.processing.task_executor import TaskExecutor
 from test_engine_app.processing.task_processing import TaskProcessing
 from test_engine_app.processing.task_result import TaskResult
 from test_engine_core.utils.validate_checks import is_empty_string
@@ -55,6 +56,7 @@ class Task(IWorkerFunction):
 
         # Task
         self._to_stop: bool = False
+        self._task_process: Union[pathos.helpers.mp.Process, None] = None
         self._logger: AppLogger = AppLogger()
         self._task_arguments: TaskArgument = TaskArgument(validation_schemas_folder)
         self._task_results = TaskResult(self._logger)
@@ -72,19 +74,29 @@ class Task(IWorkerFunction):
         # Check and terminate the process if running
         running_process = self._get_task_process()
         if running_process:
-            # Process is running.
-            # Terminate it if unable to join
-            AppLogger.add_to_log(
-                self._logger, logging.INFO, "Attempting to join running process"
-            )
-            running_process.join(timeout=self._mp_join_timeout)
-            if running_process.is_alive():
+            if TaskExecutor.is_enabled():
+                # The resident task process does not exit after the task.
+                # Terminate it and a new task process will be started for the next task.
                 AppLogger.add_to_log(
                     self._logger,
                     logging.INFO,
-                    "Attempt to join process failed. Terminating process.",
+                    "Terminating the resident task process",
+                )
+                TaskExecutor.terminate()
+            else:
+                # Process is running.
+                # Terminate it if unable to join
+                AppLogger.add_to_log(
+                    self._logger, logging.INFO, "Attempting to join running process"
                 )
-                running_process.terminate()
+                running_process.join(timeout=self._mp_join_timeout)
+                if running_process.is_alive():
+                    AppLogger.add_to_log(
+                        self._logger,
+                        logging.INFO,
+                        "Attempt to join process failed. Terminating process.",
+                    )
+                    running_process.terminate()
 
             # Set flag to stop
             self._to_stop = True
@@ -159,49 +171,50 @@ class Task(IWorkerFunction):
         if is_success:
             self._logger.generate_stream_logger(self._task_arguments.id)
 
-            # Run the task processing instance in a Process and will return results when completed.
-            # If there is a process termination required, will terminate the process.
-            # Create a new queue for the process to place the results
-            with pathos.helpers.mp.Manager() as manager:
-                results_queue = manager.Queue()
-
-                # Create the Process
-                new_process = pathos.helpers.mp.Process(
-                    target=TaskProcessing.run_task_processing_in_process,
-                    args=(
-                        self._logger,
-                        self._task_arguments,
-                        self._message_id,
-                        self._message_arguments,
-                        self._task_type,
-                        results_queue,
-                    ),
+            if TaskExecutor.is_enabled():
+                # Run the task processing instance in the resident task process and will return results
+                # when completed. If there is a process termination required, will terminate the process.
+                new_process, results_queue = TaskExecutor.submit(
+                    self._task_arguments,
+                    self._message_id,
+                    self._message_arguments,
+                    self._task_type,
                 )
-
-                # Set the process before starting
                 self._set_task_process(new_process)
-                new_process.start()
-
-                # Get updates while process is running
-                while self._to_stop is False:
-                    try:
-                        process_status, payload = results_queue.get(
-                            timeout=self._mp_queue_timeout
-                        )
-                        if process_status is ProcessStatus.UPDATE:
-                            # Handle update task results
-                            self._task_results = payload
-                            self._send_task_update()
-                        else:
-                            # Handle process complete
-                            is_success, self._task_results, error_messages = payload
-                            break
-
-                    except queue.Empty:
-                        continue
-
-                # Join the process
-                new_process.join()
+                is_success, error_messages = self._wait_for_task_results(
+                    new_process, results_queue
+                )
+            else:
+                # Run the task processing instance in a Process and will return results when completed.
+                # If there is a process termination required, will terminate the process.
+                # Create a new queue for the process to place the results
+                with pathos.helpers.mp.Manager() as manager:
+                    results_queue = manager.Queue()
+
+                    # Create the Process
+                    new_process = pathos.helpers.mp.Process(
+                        target=TaskProcessing.run_task_processing_in_process,
+                        args=(
+                            self._logger,
+                            self._task_arguments,
+                            self._message_id,
+                            self._message_arguments,
+                            self._task_type,
+                            results_queue,
+                        ),
+                    )
+
+                    # Set the process before starting
+                    self._set_task_process(new_process)
+                    new_process.start()
+
+                    # Get updates while process is running
+                    is_success, error_messages = self._wait_for_task_results(
+                        new_process, results_queue
+                    )
+
+                    # Join the process
+                    new_process.join()
         else:
             # Check if id is not None, we can set HSET with error messages
             if not is_empty_string(self._task_arguments.id):
@@ -284,3 +297,50 @@ class Task(IWorkerFunction):
             self._task_update_callback(
                 self._task_arguments.id, self.get_formatted_results(), self._logger
             )
+
+    def _wait_for_task_results(
+        self,
+        task_process: pathos.helpers.mp.Process,
+        results_queue: pathos.helpers.mp.Queue,
+    ) -> Tuple[bool, str]:
+        """
+        A helper method to get the task updates and results from the task process until the task is completed,
+        cancelled or the task process has exited
+
+        Args:
+            task_process (pathos.helpers.mp.Process): The task process
+            results_queue (pathos.helpers.mp.Queue): The queue which the task updates and results are placed in
+
+        Returns:
+            Tuple[bool, str]: Returns True if processing complete and indicate the error messages if failure
+        """
+        is_success = True
+        error_messages = ""
+        while self._to_stop is False:
+            try:
+                process_status, payload = results_queue.get(
+                    timeout=self._mp_queue_timeout
+                )
+                if process_status is ProcessStatus.UPDATE:
+                    # Handle update task results
+                    self._task_results = payload
+                    self._send_task_update()
+                else:
+                    # Handle process complete
+                    is_success, self._task_results, error_messages = payload
+                    break
+
+            except queue.Empty:
+                if not task_process.is_alive() and results_queue.empty():
+                    # Task process exited without sending the results
+                    is_success = False
+                    error_messages = "The task process has exited unexpectedly"
+                    AppLogger.add_to_log(self._logger, logging.ERROR, error_messages)
+                    self._task_results.set_failure()
+                    break
+
+            except (EOFError, OSError):
+                # Task process was terminated while sending the results
+                break
+
+        return is_success, error_messages
@@ -0,0 +1,264 @@
+import queue
+import resource
+from multiprocessing import Lock
+from typing import Set, Tuple, Union
+
+import pathos
+from test_engine_app.app_logger import AppLogger
+from test_engine_app.enums.task_type import TaskType
+from test_engine_app.processing.task_argument import TaskArgument
+from test_engine_app.processing.task_processing import TaskProcessing
+from test_engine_core.utils.shared_data import SharedData
+
+
+class TaskExecutor:
+    """
+    TaskExecutor class keeps a task process resident between tasks, so that every task does not need to
+    start a new process and import the plugin dependencies again.
+    The resident task process is recycled after it has processed the maximum number of tasks,
+    when its memory usage exceeds the memory limit, or when it is requested to be recycled.
+    The task process reports the data it places in shared memory, which is removed if it is terminated.
+    """
+
+    _max_tasks: int = 0
+    _max_memory: int = 0  # MB
+    _process: Union[pathos.helpers.mp.Process, None] = None
+    _task_queue: Union[pathos.helpers.mp.Queue, None] = None
+    _result_queue: Union[pathos.helpers.mp.Queue, None] = None
+    _shared_data_queue: Union[pathos.helpers.mp.Queue, None] = None
+    _shared_data_names: Set[str] = set()
+    _to_recycle: bool = False
+    _join_timeout: float = 5.0  # 5 seconds
+    lock: Lock = Lock()
+
+    @staticmethod
+    def setup(max_tasks: int, max_memory: int) -> None:
+        """
+        A method to set up the task executor
+
+        Args:
+            max_tasks (int): The number of tasks before the task process is recycled. 0 disables the task executor
+            max_memory (int): The memory usage (MB) before the task process is recycled. 0 indicates no limit
+        """
+        if isinstance(max_tasks, int) and max_tasks >= 0:
+            TaskExecutor._max_tasks = max_tasks
+        if isinstance(max_memory, int) and max_memory >= 0:
+            TaskExecutor._max_memory = max_memory
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """
+        A method to return whether tasks are processed in the resident task process
+
+        Returns:
+            bool: True if the task executor is enabled, else False
+        """
+        return TaskExecutor._max_tasks > 0
+
+    @staticmethod
+    def submit(
+        task_argument: TaskArgument,
+        message_id: str,
+        message_arguments: str,
+        task_type: TaskType,
+    ) -> Tuple[pathos.helpers.mp.Process, pathos.helpers.mp.Queue]:
+        """
+        A method to submit a task to the resident task process.
+        A new task process is started if there is no running task process or it is to be recycled.
+
+        Args:
+            task_argument (TaskArgument): The task arguments
+            message_id (str): The redis message id
+            message_arguments (str): The redis message arguments
+            task_type (TaskType): The task type
+
+        Returns:
+            Tuple[pathos.helpers.mp.Process, pathos.helpers.mp.Queue]: The task process and the queue
+            which the task updates and results will be placed in
+        """
+        with TaskExecutor.lock:
+            TaskExecutor._collect_shared_data_names()
+            if (
+                TaskExecutor._to_recycle
+                or TaskExecutor._process is None
+                or not TaskExecutor._process.is_alive()
+            ):
+                TaskExecutor._stop_process()
+                TaskExecutor._start_process()
+
+            TaskExecutor._task_queue.put(
+                (task_argument, message_id, message_arguments, task_type)
+            )
+            return TaskExecutor._process, TaskExecutor._result_queue
+
+    @staticmethod
+    def recycle() -> None:
+        """
+        A method to request the resident task process to be replaced before the next task.
+        This is required when the plugins have changed after the task process has started.
+        """
+        with TaskExecutor.lock:
+            TaskExecutor._to_recycle = True
+
+    @staticmethod
+    def terminate() -> None:
+        """
+        A method to terminate the resident task process immediately
+        """
+        with TaskExecutor.lock:
+            if TaskExecutor._process is not None:
+                TaskExecutor._process.terminate()
+                TaskExecutor._process.join(timeout=TaskExecutor._join_timeout)
+            TaskExecutor._remove_shared_data()
+            TaskExecutor._process = None
+            TaskExecutor._task_queue = None
+            TaskExecutor._result_queue = None
+
+    @staticmethod
+    def run_executor_in_process(
+        task_queue: pathos.helpers.mp.Queue,
+        result_queue: pathos.helpers.mp.Queue,
+        max_tasks: int,
+        max_memory: int,
+        shared_data_queue: Union[pathos.helpers.mp.Queue, None] = None,
+    ) -> None:
+        """
+        A method that runs in the resident task process to process the tasks from the task queue.
+        The updates and results will be placed in the result queue.
+        The process exits when it receives None, or has reached the maximum number of tasks or memory usage.
+        The data it has placed in shared memory is removed when it exits.
+
+        Args:
+            task_queue (pathos.helpers.mp.Queue): The multiprocessing queue to receive tasks
+            result_queue (pathos.helpers.mp.Queue): The multiprocessing queue to store results and
+            return to the caller
+            max_tasks (int): The number of tasks before the task process exits
+            max_memory (int): The memory usage (MB) before the task process exits. 0 indicates no limit
+            shared_data_queue (Union[pathos.helpers.mp.Queue, None]): The multiprocessing queue to report the
+            shared memory names placed and removed by this process. Defaults to None
+        """
+        if shared_data_queue is not None:
+            SharedData.set_callback(
+                lambda name, is_published: shared_data_queue.put((name, is_published))
+            )
+
+        number_of_processed_tasks = 0
+        while number_of_processed_tasks < max_tasks:
+            try:
+                task = task_queue.get()
+            except (EOFError, OSError, queue.Empty):
+                break  # Task queue is closed
+
+            if task is None:
+                break  # Requested to stop
+
+            task_argument, message_id, message_arguments, task_type = task
+
+            # Create the task logger in this process as it writes to the task log file
+            logger = AppLogger()
+            logger.generate_stream_logger(task_argument.id)
+            TaskProcessing.run_task_processing_in_process(
+                logger,
+                task_argument,
+                message_id,
+                message_arguments,
+                task_type,
+                result_queue,
+            )
+            if logger.logger_instance:
+                logger.logger_instance.stop()
+                logger.logger_instance = None
+
+            number_of_processed_tasks += 1
+            if 0 < max_memory <= TaskExecutor._get_memory_usage():
+                break  # Exceeded the memory limit
+
+        # Remove the data this process has placed in shared memory
+        SharedData.release_all()
+
+    @staticmethod
+    def _get_memory_usage() -> int:
+        """
+        A helper method to return the peak memory usage of the current process
+
+        Returns:
+            int: The peak memory usage in MB
+        """
+        # ru_maxrss is in kilobytes on Linux
+        return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024)
+
+    @staticmethod
+    def _start_process() -> None:
+        """
+        A helper method to start a new resident task process.
+        The caller is expected to hold the lock.
+        """
+        TaskExecutor._task_queue = pathos.helpers.mp.Queue()
+        TaskExecutor._result_queue = pathos.helpers.mp.Queue()
+        TaskExecutor._shared_data_queue = pathos.helpers.mp.Queue()
+        TaskExecutor._shared_data_names = set()
+        TaskExecutor._process = pathos.helpers.mp.Process(
+            target=TaskExecutor.run_executor_in_process,
+            args=(
+                TaskExecutor._task_queue,
+                TaskExecutor._result_queue,
+                TaskExecutor._max_tasks,
+                TaskExecutor._max_memory,
+                TaskExecutor._shared_data_queue,
+            ),
+        )
+        TaskExecutor._process.start()
+        TaskExecutor._to_recycle = False
+
+    @staticmethod
+    def _stop_process() -> None:
+        """
+        A helper method to stop the resident task process after its current task.
+        The caller is expected to hold the lock.
+        """
+        if TaskExecutor._process is not None:
+            if TaskExecutor._process.is_alive():
+                TaskExecutor._task_queue.put(None)
+                TaskExecutor._process.join(timeout=TaskExecutor._join_timeout)
+                if TaskExecutor._process.is_alive():
+                    TaskExecutor._process.terminate()
+                    TaskExecutor._process.join(timeout=TaskExecutor._join_timeout)
+            else:
+                TaskExecutor._process.join(timeout=TaskExecutor._join_timeout)
+
+        TaskExecutor._remove_shared_data()
+        TaskExecutor._process = None
+        TaskExecutor._task_queue = None
+        TaskExecutor._result_queue = None
+
+    @staticmethod
+    def _collect_shared_data_names() -> None:
+        """
+        A helper method to update the shared memory names reported by the task process.
+        The caller is expected to hold the lock.
+        """
+        if TaskExecutor._shared_data_queue is None:
+            return
+
+        while True:
+            try:
+                name, is_published = TaskExecutor._shared_data_queue.get_nowait()
+            except (EOFError, OSError, queue.Empty):
+                break
+
+            if is_published:
+                TaskExecutor._shared_data_names.add(name)
+            else:
+                TaskExecutor._shared_data_names.discard(name)
+
+    @staticmethod
+    def _remove_shared_data() -> None:
+        """
+        A helper method to remove the data the task process has placed in shared memory and not removed,
+        after the task process has stopped (i.e. it was terminated during a task).
+        The caller is expected to hold the lock.
+        """
+        TaskExecutor._collect_shared_data_names()
+        SharedData.remove(list(TaskExecutor._shared_data_names))
+        TaskExecutor._shared_data_names = set()
+        TaskExecutor._shared_data_queue = None
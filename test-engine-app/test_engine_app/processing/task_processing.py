@@ -371,7 +371,9 @@ class TaskProcessing:
                     ground_truth_serializer_instance,
                     load_ground_truth_error_message,
                 ) = StreamProcessing.load_ground_truth(
-                    TaskProcessing._logger, task_argument.ground_truth_dataset
+                    TaskProcessing._logger,
+                    task_argument.ground_truth_dataset,
+                    task_argument.ground_truth,
                 )
                 if not is_load_ground_truth_success:
                     is_success = is_load_ground_truth_success
@@ -514,7 +516,9 @@ class TaskProcessing:
                     ground_truth_serializer_instance,
                     load_ground_truth_error_message,
                 ) = StreamProcessing.load_ground_truth(
-                    TaskProcessing._logger, task_argument.ground_truth_dataset
+                    TaskProcessing._logger,
+                    task_argument.ground_truth_dataset,
+                    task_argument.ground_truth,
                 )
                 if not is_load_ground_truth_success:
                     is_success = is_load_ground_truth_success
@@ -1,10 +1,13 @@
 import logging
+import secrets
 import signal
 import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from multiprocessing import Lock
 from time import sleep
-from typing import Dict, List, Tuple, Union
+from typing import Dict, List, Set, Tuple, Union
 
+from test_engine_core.utils.shared_data import SharedData
 from test_engine_core.utils.validate_checks import is_empty_string
 
 from test_engine_app.app_logger import AppLogger
@@ -18,9 +21,11 @@ from test_engine_app.network.redis_constants import (
     REDIS_STREAM_SERVICE_NAME,
     REDIS_STREAM_TASK_NAME,
 )
+from test_engine_app.processing.instance_cache import InstanceCache
 from test_engine_app.processing.plugin_controller import PluginController
 from test_engine_app.processing.service import Service
 from test_engine_app.processing.task import Task
+from test_engine_app.processing.task_executor import TaskExecutor
 
 
 class Worker:
@@ -35,7 +40,7 @@ class Worker:
     to perform queries on model, data, compatibility issues.
     """
 
-    _running_item: Union[IWorkerFunction, None] = None
+    _running_items: Dict[str, IWorkerFunction] = dict()
     _logger: AppLogger = AppLogger()
     _to_stop: bool = False
     _worker_name: str = ""
@@ -77,6 +82,37 @@ class Worker:
             PluginController.set_logger(Worker._logger)
             PluginController.setup(EnvironmentVariables.get_core_modules_folder())
 
+            # Setup TaskExecutor
+            TaskExecutor.setup(
+                EnvironmentVariables.get_task_executor_max_tasks(),
+                EnvironmentVariables.get_task_executor_max_memory(),
+            )
+
+            # Setup InstanceCache, which keeps the loaded instances in each task process
+            InstanceCache.setup(
+                EnvironmentVariables.get_instance_cache_max_items(),
+                EnvironmentVariables.get_instance_cache_max_size(),
+            )
+
+            # Setup SharedData for the resident task process, which keeps the data it places in shared memory
+            # between tasks. The shared memory names are derived from the secret namespace, so that they cannot
+            # be created in advance by other users
+            if Worker._worker_type is WorkerType.PROCESS and TaskExecutor.is_enabled():
+                SharedData.setup(
+                    EnvironmentVariables.get_shared_data_max_memory(),
+                    EnvironmentVariables.get_shared_data_namespace()
+                    or secrets.token_hex(16),
+                )
+            elif (
+                Worker._worker_type is WorkerType.PROCESS
+                and EnvironmentVariables.get_shared_data_max_memory() > 0
+            ):
+                AppLogger.add_to_log(
+                    Worker._logger,
+                    logging.WARNING,
+                    "The shared data is disabled as it requires the task executor",
+                )
+
             # Check if this thread is process worker or service worker
             if Worker._worker_type is WorkerType.SERVICE:
                 stream_name = REDIS_STREAM_SERVICE_NAME
@@ -193,8 +229,8 @@ class Worker:
                     Worker._discover_new_items()
 
             except Exception as exception:
-                # Set the running item
-                Worker._set_running_item(None)
+                # Clear the running items
+                Worker._clear_running_items()
 
                 # Base try-except to catch all possible leaked exception and log them.
                 error_message = "The system worker encountered an error. " + str(
@@ -243,6 +279,9 @@ class Worker:
         # Cleanup Redis
         Redis.cleanup()
 
+        # Terminate the resident task process
+        TaskExecutor.terminate()
+
         if Worker._worker_name and Worker._worker_type:
             # Terminate logger instance
             AppLogger.add_to_log(
@@ -362,120 +401,168 @@ class Worker:
     def _discover_new_items() -> None:
         """
         A helper method to discover new redis stream items
-        In this method, we will get a new item, run the item and send the message ack to clear the entry.
+        In this method, we will read new items in batches, run the items concurrently
+        and send the message ack to clear each entry when the item completes.
         """
-        # Indicate number of items to get from redis stream at one time
+        # Indicate number of items to read ahead from redis stream
+        # Indicate number of items to process concurrently
         # Indicate number of milliseconds to block each time when reading streams
-        get_num_of_items = 1
+        prefetch_items = EnvironmentVariables.get_worker_prefetch_items()
+        concurrent_items = EnvironmentVariables.get_worker_concurrent_items()
         blocking_duration = 2000
 
-        # Continuously get new items and generate results
-        while not Worker._to_stop:
-            # Request for new items to process
-            new_items_list = Redis.get_new_items(
-                Worker._process_redis_message,
-                get_num_of_items,
-                blocking_duration,
+        if (
+            Worker._worker_type is WorkerType.PROCESS
+            and TaskExecutor.is_enabled()
+            and concurrent_items > 1
+        ):
+            # The resident task process runs one task at a time
+            AppLogger.add_to_log(
+                Worker._logger,
+                logging.WARNING,
+                "The system worker processes one task at a time when the task executor is enabled",
             )
+            concurrent_items = 1
 
-            # Loop through the message information
-            # Create a new item and process the item
-            # Send the response through redis
-            # Clean up the generated item
-            for count in range(len(new_items_list)):
-                # Store current running item
-                Worker._set_running_item(None)
-
-                # Read the new pending item from the list
-                # Get the pending item instance for processing
-                if Worker._worker_type is WorkerType.SERVICE:
-                    # Service WorkerType
-                    message_id, message_arguments = new_items_list[count]
-                    AppLogger.add_to_log(
-                        Worker._logger,
-                        logging.INFO,
-                        f"Working on new service message: "
-                        f"message_id - {message_id}, "
-                        f"message_args - {message_arguments}",
-                    )
-                    new_item = Service(
-                        message_id,
-                        message_arguments,
-                        EnvironmentVariables.get_validation_schemas_folder(),
-                        ServiceType.NEW,
-                        Worker._send_update,
-                    )
-                else:
-                    # Process WorkerType
-                    message_id, message_arguments = new_items_list[count]
-                    AppLogger.add_to_log(
-                        Worker._logger,
-                        logging.INFO,
-                        f"Working on new task message: "
-                        f"message_id - {message_id}, "
-                        f"message_args - {message_arguments}",
-                    )
-                    new_item = Task(
-                        message_id,
-                        message_arguments,
-                        EnvironmentVariables.get_validation_schemas_folder(),
-                        TaskType.NEW,
-                        Worker._send_update,
+        # Indicate the maximum number of items held by this worker.
+        # Items that are read but not running yet remain pending in the redis stream
+        max_held_items = max(prefetch_items, concurrent_items)
+        held_items: Set[Future] = set()
+
+        # Continuously get new items and generate results
+        with ThreadPoolExecutor(max_workers=concurrent_items) as executor:
+            while not Worker._to_stop:
+                # Remove the completed items and raise the exceptions encountered
+                completed_items = {item for item in held_items if item.done()}
+                held_items -= completed_items
+                for completed_item in completed_items:
+                    completed_item.result()
+
+                # Wait for an item to complete if the worker is holding the maximum number of items
+                get_num_of_items = min(prefetch_items, max_held_items - len(held_items))
+                if get_num_of_items < 1:
+                    wait(
+                        held_items,
+                        timeout=blocking_duration / 1000,
+                        return_when=FIRST_COMPLETED,
                     )
+                    continue
 
-                # Store current running item
-                Worker._set_running_item(new_item)
+                # Request for new items to process
+                new_items_list = Redis.get_new_items(
+                    Worker._process_redis_message,
+                    get_num_of_items,
+                    blocking_duration,
+                )
 
-                # Process the new item
-                is_success, error_messages = new_item.process()
-                if is_success:
-                    # Task completed processing
-                    AppLogger.add_to_log(
-                        Worker._logger,
-                        logging.INFO,
-                        f"The new stream message processed successfully: "
-                        f"message_id - {message_id}, "
-                        f"message_args - {message_arguments}",
-                    )
-                else:
-                    # Task failed processing
-                    AppLogger.add_to_log(
-                        Worker._logger,
-                        logging.ERROR,
-                        f"The new stream message processed failed: "
-                        f"message_id - {message_id}, "
-                        f"message_args - {message_arguments}, "
-                        f"error_messages - {error_messages}",
+                # Run the new items in the available slots
+                for message_id, message_arguments in new_items_list:
+                    held_items.add(
+                        executor.submit(
+                            Worker._process_new_item, message_id, message_arguments
+                        )
                     )
 
-                # Send Task Response and Ack
-                if Worker._send_update(
-                    new_item.get_id(),
-                    new_item.get_formatted_results(),
-                    new_item.get_logger(),
-                ):
-                    Worker._send_acknowledgement(message_id, new_item.get_logger())
-                else:
-                    # Failed to send update. Do not send acknowledgement
-                    pass
+    @staticmethod
+    def _process_new_item(message_id: str, message_arguments: str) -> None:
+        """
+        A helper method to process a new redis stream item.
+        In this method, we will create a new item, process the item, send the response and the message ack,
+        and clean up the generated item.
 
-                # Perform cleanup
-                new_item.cleanup()
+        Args:
+            message_id (str): The redis message id
+            message_arguments (str): The redis message arguments
+        """
+        # Get the new item instance for processing
+        if Worker._worker_type is WorkerType.SERVICE:
+            # Service WorkerType
+            AppLogger.add_to_log(
+                Worker._logger,
+                logging.INFO,
+                f"Working on new service message: "
+                f"message_id - {message_id}, "
+                f"message_args - {message_arguments}",
+            )
+            new_item = Service(
+                message_id,
+                message_arguments,
+                EnvironmentVariables.get_validation_schemas_folder(),
+                ServiceType.NEW,
+                Worker._send_update,
+            )
+        else:
+            # Process WorkerType
+            AppLogger.add_to_log(
+                Worker._logger,
+                logging.INFO,
+                f"Working on new task message: "
+                f"message_id - {message_id}, "
+                f"message_args - {message_arguments}",
+            )
+            new_item = Task(
+                message_id,
+                message_arguments,
+                EnvironmentVariables.get_validation_schemas_folder(),
+                TaskType.NEW,
+                Worker._send_update,
+            )
 
-                # Set running item
-                Worker._set_running_item(None)
+        # Store running item
+        Worker._add_running_item(message_id, new_item)
+
+        try:
+            # Process the new item
+            is_success, error_messages = new_item.process()
+            if is_success:
+                # Task completed processing
+                AppLogger.add_to_log(
+                    Worker._logger,
+                    logging.INFO,
+                    f"The new stream message processed successfully: "
+                    f"message_id - {message_id}, "
+                    f"message_args - {message_arguments}",
+                )
+            else:
+                # Task failed processing
+                AppLogger.add_to_log(
+                    Worker._logger,
+                    logging.ERROR,
+                    f"The new stream message processed failed: "
+                    f"message_id - {message_id}, "
+                    f"message_args - {message_arguments}, "
+                    f"error_messages - {error_messages}",
+                )
+
+            # Send Task Response and Ack
+            if Worker._send_update(
+                new_item.get_id(),
+                new_item.get_formatted_results(),
+                new_item.get_logger(),
+            ):
+                Worker._send_acknowledgement(message_id, new_item.get_logger())
+            else:
+                # Failed to send update. Do not send acknowledgement
+                pass
+
+            # Perform cleanup
+            new_item.cleanup()
+
+        finally:
+            # Remove running item
+            Worker._remove_running_item(message_id)
 
     @staticmethod
-    def _get_running_item() -> Union[IWorkerFunction, None]:
+    def _get_running_items() -> List[IWorkerFunction]:
         """
-        A helper method to return the running item
+        A helper method to return the running items
 
         Returns:
-            Union[IWorkerFunction, None]: An instance of IWorkerFunction or None
+            List[IWorkerFunction]: A list of IWorkerFunction instances
         """
         with Worker.lock:
-            # Returns the current running item
-            return Worker._running_item
+            # Returns the current running items
+            return list(Worker._running_items.values())
 
     @staticmethod
     def _process_redis_message(response_list: List) -> List:
@@ -516,6 +603,42 @@ class Worker:
 
         return new_list
 
+    @staticmethod
+    def _process_algorithm_install_callback(message: Dict) -> None:
+        """
+        A helper callback function to process algorithm install message
+        and recycle the resident task process to pick up the new algorithm
+
+        Args:
+            message (Dict): A pubsub message indicating the message id
+        """
+        PluginController.process_algorithm_install_callback(message)
+        TaskExecutor.recycle()
+
+    @staticmethod
+    def _process_algorithm_update_callback(message: Dict) -> None:
+        """
+        A helper callback function to process algorithm update message
+        and recycle the resident task process to pick up the updated algorithm
+
+        Args:
+            message (Dict): A pubsub message indicating the message id
+        """
+        PluginController.process_algorithm_update_callback(message)
+        TaskExecutor.recycle()
+
+    @staticmethod
+    def _process_algorithm_delete_callback(message: Dict) -> None:
+        """
+        A helper callback function to process algorithm delete message
+        and recycle the resident task process to remove the deleted algorithm
+
+        Args:
+            message (Dict): A pubsub message indicating the message id
+        """
+        PluginController.process_algorithm_delete_callback(message)
+        TaskExecutor.recycle()
+
     @staticmethod
     def _process_task_stop_callback(message: Dict) -> bool:
         """
@@ -552,13 +675,15 @@ class Worker:
             )
             return False
 
-        running_item = Worker._get_running_item()
-        if running_item:
-            if item_id == running_item.get_id():
-                # This is the item that is running now. Cancel this item.
-                running_item.cancel()
+        running_items = Worker._get_running_items()
+        if running_items:
+            for running_item in running_items:
+                if item_id == running_item.get_id():
+                    # This is the item that is running now. Cancel this item.
+                    running_item.cancel()
+                    break
             else:
-                # Running a different item
+                # Running different items
                 AppLogger.add_to_log(
                     Worker._logger,
                     logging.WARNING,
@@ -671,16 +796,38 @@ class Worker:
             return False
 
     @staticmethod
-    def _set_running_item(item: Union[IWorkerFunction, None]) -> None:
+    def _add_running_item(message_id: str, item: IWorkerFunction) -> None:
+        """
+        A helper method to add a running item
+
+        Args:
+            message_id (str): The redis message id of the item
+            item (IWorkerFunction): An instance of IWorkerFunction
+        """
+        with Worker.lock:
+            # Add the running item
+            Worker._running_items[message_id] = item
+
+    @staticmethod
+    def _clear_running_items() -> None:
+        """
+        A helper method to remove all the running items
+        """
+        with Worker.lock:
+            # Clear the running items
+            Worker._running_items.clear()
+
+    @staticmethod
+    def _remove_running_item(message_id: str) -> None:
         """
-        A helper method to update the running item
+        A helper method to remove a running item
 
         Args:
-            item (Union[IWorkerFunction, None]): An instance of IWorkerFunction or None
+            message_id (str): The redis message id of the item
         """
         with Worker.lock:
-            # Set the running item
-            Worker._running_item = item
+            # Remove the running item
+            Worker._running_items.pop(message_id, None)
 
     @staticmethod
     def _setup_redis(stream_name: str) -> None:
@@ -714,9 +861,9 @@ class Worker:
             is_success = Redis.connect_to_pubsub(
                 **{
                     "TASK_CANCEL": Worker._process_task_stop_callback,
-                    "ALGO_INSTALL": PluginController.process_algorithm_install_callback,
-                    "ALGO_UPDATE": PluginController.process_algorithm_update_callback,
-                    "ALGO_DELETE": PluginController.process_algorithm_delete_callback,
+                    "ALGO_INSTALL": Worker._process_algorithm_install_callback,
+                    "ALGO_UPDATE": Worker._process_algorithm_update_callback,
+                    "ALGO_DELETE": Worker._process_algorithm_delete_callback,
                 }
             )
             if is_success:
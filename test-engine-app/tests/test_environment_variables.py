@@ -20,6 +20,14 @@ class TestCollectionEnvironmentVariables:
         EnvironmentVariables._redis_server_hostname = "localhost"
         EnvironmentVariables._redis_server_port = 6379
         EnvironmentVariables._api_server_port = 8080
+        EnvironmentVariables._task_executor_max_tasks = 0
+        EnvironmentVariables._task_executor_max_memory = 0
+        EnvironmentVariables._worker_prefetch_items = 1
+        EnvironmentVariables._worker_concurrent_items = 1
+        EnvironmentVariables._shared_data_max_memory = 0
+        EnvironmentVariables._shared_data_namespace = ""
+        EnvironmentVariables._instance_cache_max_items = 8
+        EnvironmentVariables._instance_cache_max_size = 4096
 
         # Remove .env file
         try:
@@ -58,7 +66,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup123\n'
                 f'REDIS_SERVER_HOSTNAME: 192.168.1.1\n'
                 f'REDIS_SERVER_PORT: 1234\n'
-                f'API_SERVER_PORT: 4321'
+                f'API_SERVER_PORT: 4321\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             # tests core_modules
             (
@@ -76,7 +91,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/env_core_modules/path_issues_env_1",
@@ -93,7 +115,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/env_core_modules/path_issues_env_2",
@@ -110,7 +139,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/env_core_modules/path_issues_env_3",
@@ -127,7 +163,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/env_core_modules/path_issues_env_4",
@@ -144,7 +187,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/env_core_modules/path_issues_env_5",
@@ -161,7 +211,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup123\n'
                 f'REDIS_SERVER_HOSTNAME: 192.168.1.1\n'
                 f'REDIS_SERVER_PORT: 1234\n'
-                f'API_SERVER_PORT: 4321'
+                f'API_SERVER_PORT: 4321\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             # Tests validation_schema
             (
@@ -179,7 +236,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/validation_schema/path_issues_env_1",
@@ -196,7 +260,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/validation_schema/path_issues_env_2",
@@ -213,7 +284,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/validation_schema/path_issues_env_3",
@@ -230,7 +308,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/validation_schema/path_issues_env_4",
@@ -247,7 +332,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/validation_schema/path_issues_env_5",
@@ -264,7 +356,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup123\n'
                 f'REDIS_SERVER_HOSTNAME: 192.168.1.1\n'
                 f'REDIS_SERVER_PORT: 1234\n'
-                f'API_SERVER_PORT: 4321'
+                f'API_SERVER_PORT: 4321\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             # Tests consumer_group
             (
@@ -282,7 +381,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: /etc/IDontExist/\n'
                 f'REDIS_SERVER_HOSTNAME: 192.168.1.1\n'
                 f'REDIS_SERVER_PORT: 1234\n'
-                f'API_SERVER_PORT: 4321'
+                f'API_SERVER_PORT: 4321\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/consumer_group/path_issues_env_1",
@@ -299,7 +405,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/consumer_group/path_issues_env_2",
@@ -316,7 +429,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: 123\n'
                 f'REDIS_SERVER_HOSTNAME: 192.168.1.1\n'
                 f'REDIS_SERVER_PORT: 1234\n'
-                f'API_SERVER_PORT: 4321'
+                f'API_SERVER_PORT: 4321\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/consumer_group/path_issues_env_3",
@@ -333,7 +453,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/consumer_group/path_issues_env_4",
@@ -350,7 +477,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/consumer_group/path_issues_env_5",
@@ -367,7 +501,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: 192.168.1.1\n'
                 f'REDIS_SERVER_PORT: 1234\n'
-                f'API_SERVER_PORT: 4321'
+                f'API_SERVER_PORT: 4321\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             # Tests redis_hostname
             (
@@ -385,7 +526,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup123\n'
                 f'REDIS_SERVER_HOSTNAME: /etc/IDontExist/\n'
                 f'REDIS_SERVER_PORT: 1234\n'
-                f'API_SERVER_PORT: 4321'
+                f'API_SERVER_PORT: 4321\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/redis_hostname/path_issues_env_1",
@@ -402,7 +550,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/redis_hostname/path_issues_env_2",
@@ -419,7 +574,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup123\n'
                 f'REDIS_SERVER_HOSTNAME: 123\n'
                 f'REDIS_SERVER_PORT: 1234\n'
-                f'API_SERVER_PORT: 4321'
+                f'API_SERVER_PORT: 4321\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/redis_hostname/path_issues_env_3",
@@ -436,7 +598,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/redis_hostname/path_issues_env_4",
@@ -453,7 +622,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/redis_hostname/path_issues_env_5",
@@ -470,7 +646,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup123\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 1234\n'
-                f'API_SERVER_PORT: 4321'
+                f'API_SERVER_PORT: 4321\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             # Tests server_port
             (
@@ -488,7 +671,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/server_port/path_issues_env_1",
@@ -505,7 +695,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/server_port/path_issues_env_2",
@@ -522,7 +719,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup123\n'
                 f'REDIS_SERVER_HOSTNAME: 192.168.1.1\n'
                 f'REDIS_SERVER_PORT: 123\n'
-                f'API_SERVER_PORT: 4321'
+                f'API_SERVER_PORT: 4321\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/server_port/path_issues_env_3",
@@ -539,7 +743,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/server_port/path_issues_env_4",
@@ -556,7 +767,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/server_port/path_issues_env_5",
@@ -573,7 +791,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup123\n'
                 f'REDIS_SERVER_HOSTNAME: 192.168.1.1\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 4321'
+                f'API_SERVER_PORT: 4321\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/server_port/value_issues_env",
@@ -590,7 +815,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/server_port/value_issues_env_1",
@@ -607,7 +839,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             # Tests api_server_port
             (
@@ -625,7 +864,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/api_server_port/path_issues_env_1",
@@ -642,7 +888,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/api_server_port/path_issues_env_2",
@@ -659,7 +912,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup123\n'
                 f'REDIS_SERVER_HOSTNAME: 192.168.1.1\n'
                 f'REDIS_SERVER_PORT: 1234\n'
-                f'API_SERVER_PORT: 123'
+                f'API_SERVER_PORT: 123\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/api_server_port/path_issues_env_3",
@@ -676,7 +936,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/api_server_port/path_issues_env_4",
@@ -693,7 +960,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/api_server_port/path_issues_env_5",
@@ -710,7 +984,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup123\n'
                 f'REDIS_SERVER_HOSTNAME: 192.168.1.1\n'
                 f'REDIS_SERVER_PORT: 1234\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/api_server_port/value_issues_env",
@@ -727,7 +1008,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             (
                 "tests/env_files/api_server_port/value_issues_env_1",
@@ -744,7 +1032,209 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
+            ),
+            # Tests task executor
+            (
+                "tests/env_files/task_executor/working_env",
+                {
+                    "core_modules_folder": "/etc/",
+                    "validation_folder": "/etc/",
+                    "consumer_group": "MyGroup123",
+                    "hostname": "192.168.1.1",
+                    "server_port": 1234,
+                    "api_server_port": 4321
+                },
+                f'\nEnvironment Variables:\nCORE_MODULES_FOLDER: /etc/\n'
+                f'VALIDATION_SCHEMAS_FOLDER: /etc/\n'
+                f'REDIS_CONSUMER_GROUP: MyGroup123\n'
+                f'REDIS_SERVER_HOSTNAME: 192.168.1.1\n'
+                f'REDIS_SERVER_PORT: 1234\n'
+                f'API_SERVER_PORT: 4321\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 10\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 2048\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
+            ),
+            (
+                "tests/env_files/task_executor/value_issues_env",
+                {
+                    "core_modules_folder": str(Path().resolve().parent / "test-engine-core-modules"),
+                    "validation_folder": str(Path().resolve() / "validation_schemas"),
+                    "consumer_group": "MyGroup",
+                    "hostname": "localhost",
+                    "server_port": 6379,
+                    "api_server_port": 8080
+                },
+                f'\nEnvironment Variables:\nCORE_MODULES_FOLDER: {str(Path().resolve().parent / "test-engine-core-modules")}\n'
+                f'VALIDATION_SCHEMAS_FOLDER: {str(Path().resolve() / "validation_schemas")}\n'
+                f'REDIS_CONSUMER_GROUP: MyGroup\n'
+                f'REDIS_SERVER_HOSTNAME: localhost\n'
+                f'REDIS_SERVER_PORT: 6379\n'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
+            ),
+            (
+                "tests/env_files/task_executor/value_issues_env_1",
+                {
+                    "core_modules_folder": str(Path().resolve().parent / "test-engine-core-modules"),
+                    "validation_folder": str(Path().resolve() / "validation_schemas"),
+                    "consumer_group": "MyGroup",
+                    "hostname": "localhost",
+                    "server_port": 6379,
+                    "api_server_port": 8080
+                },
+                f'\nEnvironment Variables:\nCORE_MODULES_FOLDER: {str(Path().resolve().parent / "test-engine-core-modules")}\n'
+                f'VALIDATION_SCHEMAS_FOLDER: {str(Path().resolve() / "validation_schemas")}\n'
+                f'REDIS_CONSUMER_GROUP: MyGroup\n'
+                f'REDIS_SERVER_HOSTNAME: localhost\n'
+                f'REDIS_SERVER_PORT: 6379\n'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
+            ),
+            # Tests worker
+            (
+                "tests/env_files/worker/working_env",
+                {
+                    "core_modules_folder": "/etc/",
+                    "validation_folder": "/etc/",
+                    "consumer_group": "MyGroup123",
+                    "hostname": "192.168.1.1",
+                    "server_port": 1234,
+                    "api_server_port": 4321
+                },
+                f'\nEnvironment Variables:\nCORE_MODULES_FOLDER: /etc/\n'
+                f'VALIDATION_SCHEMAS_FOLDER: /etc/\n'
+                f'REDIS_CONSUMER_GROUP: MyGroup123\n'
+                f'REDIS_SERVER_HOSTNAME: 192.168.1.1\n'
+                f'REDIS_SERVER_PORT: 1234\n'
+                f'API_SERVER_PORT: 4321\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 8\n'
+                f'WORKER_CONCURRENT_ITEMS: 4\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
+            ),
+            (
+                "tests/env_files/worker/value_issues_env",
+                {
+                    "core_modules_folder": str(Path().resolve().parent / "test-engine-core-modules"),
+                    "validation_folder": str(Path().resolve() / "validation_schemas"),
+                    "consumer_group": "MyGroup",
+                    "hostname": "localhost",
+                    "server_port": 6379,
+                    "api_server_port": 8080
+                },
+                f'\nEnvironment Variables:\nCORE_MODULES_FOLDER: {str(Path().resolve().parent / "test-engine-core-modules")}\n'
+                f'VALIDATION_SCHEMAS_FOLDER: {str(Path().resolve() / "validation_schemas")}\n'
+                f'REDIS_CONSUMER_GROUP: MyGroup\n'
+                f'REDIS_SERVER_HOSTNAME: localhost\n'
+                f'REDIS_SERVER_PORT: 6379\n'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
+            ),
+            (
+                "tests/env_files/worker/value_issues_env_1",
+                {
+                    "core_modules_folder": str(Path().resolve().parent / "test-engine-core-modules"),
+                    "validation_folder": str(Path().resolve() / "validation_schemas"),
+                    "consumer_group": "MyGroup",
+                    "hostname": "localhost",
+                    "server_port": 6379,
+                    "api_server_port": 8080
+                },
+                f'\nEnvironment Variables:\nCORE_MODULES_FOLDER: {str(Path().resolve().parent / "test-engine-core-modules")}\n'
+                f'VALIDATION_SCHEMAS_FOLDER: {str(Path().resolve() / "validation_schemas")}\n'
+                f'REDIS_CONSUMER_GROUP: MyGroup\n'
+                f'REDIS_SERVER_HOSTNAME: localhost\n'
+                f'REDIS_SERVER_PORT: 6379\n'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
+            ),
+            # Tests shared data
+            (
+                "tests/env_files/shared_data/working_env",
+                {
+                    "core_modules_folder": "/etc/",
+                    "validation_folder": "/etc/",
+                    "consumer_group": "MyGroup123",
+                    "hostname": "192.168.1.1",
+                    "server_port": 1234,
+                    "api_server_port": 4321
+                },
+                f'\nEnvironment Variables:\nCORE_MODULES_FOLDER: /etc/\n'
+                f'VALIDATION_SCHEMAS_FOLDER: /etc/\n'
+                f'REDIS_CONSUMER_GROUP: MyGroup123\n'
+                f'REDIS_SERVER_HOSTNAME: 192.168.1.1\n'
+                f'REDIS_SERVER_PORT: 1234\n'
+                f'API_SERVER_PORT: 4321\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 1024\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
+            ),
+            (
+                "tests/env_files/shared_data/value_issues_env",
+                {
+                    "core_modules_folder": str(Path().resolve().parent / "test-engine-core-modules"),
+                    "validation_folder": str(Path().resolve() / "validation_schemas"),
+                    "consumer_group": "MyGroup",
+                    "hostname": "localhost",
+                    "server_port": 6379,
+                    "api_server_port": 8080
+                },
+                f'\nEnvironment Variables:\nCORE_MODULES_FOLDER: {str(Path().resolve().parent / "test-engine-core-modules")}\n'
+                f'VALIDATION_SCHEMAS_FOLDER: {str(Path().resolve() / "validation_schemas")}\n'
+                f'REDIS_CONSUMER_GROUP: MyGroup\n'
+                f'REDIS_SERVER_HOSTNAME: localhost\n'
+                f'REDIS_SERVER_PORT: 6379\n'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
             # Tests random
             (
@@ -762,7 +1252,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             )
         ],
     )
@@ -782,6 +1279,47 @@ class TestCollectionEnvironmentVariables:
         assert EnvironmentVariables.get_api_server_port() == expected_result["api_server_port"]
         assert EnvironmentVariables.print_environment_variables() == expected_print_output
 
+    @pytest.mark.parametrize(
+        "env_location, expected_max_items, expected_max_size",
+        [
+            ("tests/env_files/instance_cache/working_env", 4, 1024),
+            ("tests/env_files/instance_cache/value_issues_env", 8, 4096),
+        ],
+    )
+    def test_init_instance_cache(self, env_location, expected_max_items, expected_max_size):
+        # Copy the env file
+        shutil.copyfile(env_location, ".env")
+
+        # Run
+        EnvironmentVariables()
+
+        # Assert
+        assert EnvironmentVariables.get_instance_cache_max_items() == expected_max_items
+        assert EnvironmentVariables.get_instance_cache_max_size() == expected_max_size
+        assert EnvironmentVariables.print_environment_variables().endswith(
+            f'INSTANCE_CACHE_MAX_ITEMS: {expected_max_items}\n'
+            f'INSTANCE_CACHE_MAX_SIZE: {expected_max_size}'
+        )
+
+    @pytest.mark.parametrize(
+        "env_location, expected_namespace",
+        [
+            ("tests/env_files/shared_data/working_env", "secret123"),
+            ("tests/env_files/shared_data/value_issues_env", ""),
+        ],
+    )
+    def test_init_shared_data_namespace(self, env_location, expected_namespace):
+        # Copy the env file
+        shutil.copyfile(env_location, ".env")
+
+        # Run
+        EnvironmentVariables()
+
+        # Assert
+        assert EnvironmentVariables.get_shared_data_namespace() == expected_namespace
+        # The namespace is a secret
+        assert "secret123" not in EnvironmentVariables.print_environment_variables()
+
     @pytest.mark.parametrize(
         "expected_result, expected_print_output",
         [
@@ -800,7 +1338,14 @@ class TestCollectionEnvironmentVariables:
                 f'REDIS_CONSUMER_GROUP: MyGroup\n'
                 f'REDIS_SERVER_HOSTNAME: localhost\n'
                 f'REDIS_SERVER_PORT: 6379\n'
-                f'API_SERVER_PORT: 8080'
+                f'API_SERVER_PORT: 8080\n'
+                f'TASK_EXECUTOR_MAX_TASKS: 0\n'
+                f'TASK_EXECUTOR_MAX_MEMORY: 0\n'
+                f'WORKER_PREFETCH_ITEMS: 1\n'
+                f'WORKER_CONCURRENT_ITEMS: 1\n'
+                f'SHARED_DATA_MAX_MEMORY: 0\n'
+                f'INSTANCE_CACHE_MAX_ITEMS: 8\n'
+                f'INSTANCE_CACHE_MAX_SIZE: 4096'
             ),
         ]
     )
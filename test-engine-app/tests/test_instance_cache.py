@@ -0,0 +1,190 @@
+import os
+from pathlib import Path
+
+import pytest
+from test_engine_app.processing.instance_cache import InstanceCache
+from test_engine_core.plugins.enums.plugin_type import PluginType
+
+
+class TestCollectionInstanceCache:
+    @pytest.fixture(autouse=True)
+    def init(self, tmp_path):
+        # Reset
+        InstanceCache.clear()
+        InstanceCache._max_items = 8
+        InstanceCache._max_size = 4096 * 1024 * 1024
+
+        pytest.data_file = str(tmp_path / "data.sav")
+        pytest.model_file = str(tmp_path / "model.sav")
+        Path(pytest.data_file).write_bytes(b"0" * 100)
+        Path(pytest.model_file).write_bytes(b"0" * 200)
+
+        # Perform tests
+        yield
+
+        InstanceCache.clear()
+
+    def test_put_and_get(self):
+        instances = ({"data": [1, 2, 3]}, None)
+        assert InstanceCache.put(PluginType.DATA, pytest.data_file, instances) is True
+
+        cached_instances = InstanceCache.get(PluginType.DATA, pytest.data_file)
+        assert cached_instances == instances
+        assert cached_instances is not instances
+
+        # Changes to the returned instances should not affect the cache
+        cached_instances[0]["data"].append(4)
+        assert InstanceCache.get(PluginType.DATA, pytest.data_file) == instances
+
+        # Changes to the stored instances should not affect the cache
+        instances[0]["data"].append(5)
+        assert InstanceCache.get(PluginType.DATA, pytest.data_file)[0] == {
+            "data": [1, 2, 3]
+        }
+
+    def test_get_different_plugin_type(self):
+        InstanceCache.put(PluginType.DATA, pytest.data_file, ("data", None))
+        assert InstanceCache.get(PluginType.MODEL, pytest.data_file) is None
+
+    def test_get_different_arguments(self):
+        InstanceCache.put(PluginType.DATA, pytest.data_file, ("data", None))
+        InstanceCache.put(
+            PluginType.DATA, pytest.data_file, ("label", None), (("label",),)
+        )
+
+        # The instances loaded with different arguments are kept separately
+        assert len(InstanceCache._entries) == 2
+        assert InstanceCache.get(PluginType.DATA, pytest.data_file) == ("data", None)
+        assert InstanceCache.get(PluginType.DATA, pytest.data_file, (("label",),)) == (
+            "label",
+            None,
+        )
+        assert InstanceCache.get(PluginType.DATA, pytest.data_file, (("age",),)) is None
+        assert InstanceCache.get(PluginType.DATA, pytest.data_file, ["label"]) is None
+
+    def test_get_modified_file(self):
+        InstanceCache.put(PluginType.DATA, pytest.data_file, ("data", None))
+
+        # Modify the file content and time
+        Path(pytest.data_file).write_bytes(b"1" * 150)
+        os.utime(pytest.data_file, ns=(0, 0))
+        assert InstanceCache.get(PluginType.DATA, pytest.data_file) is None
+
+        # Storing the new instances replaces the outdated entry
+        InstanceCache.put(PluginType.DATA, pytest.data_file, ("new data", None))
+        assert len(InstanceCache._entries) == 1
+        assert InstanceCache._current_size == 150
+        assert InstanceCache.get(PluginType.DATA, pytest.data_file) == (
+            "new data",
+            None,
+        )
+
+    def test_folder_path(self, tmp_path):
+        folder_path = tmp_path / "images"
+        folder_path.mkdir()
+        (folder_path / "0.png").write_bytes(b"0" * 10)
+        (folder_path / "1.png").write_bytes(b"0" * 20)
+
+        assert InstanceCache.put(PluginType.DATA, str(folder_path), ("images", None))
+        assert InstanceCache._current_size == 30
+        assert InstanceCache.get(PluginType.DATA, str(folder_path)) == ("images", None)
+
+        # Adding a new file to the folder makes the entry outdated
+        (folder_path / "2.png").write_bytes(b"0" * 30)
+        assert InstanceCache.get(PluginType.DATA, str(folder_path)) is None
+
+    def test_evict_max_items(self):
+        InstanceCache._max_items = 1
+        InstanceCache.put(PluginType.DATA, pytest.data_file, ("data", None))
+        InstanceCache.put(PluginType.MODEL, pytest.model_file, ("model", None))
+
+        assert InstanceCache.get(PluginType.DATA, pytest.data_file) is None
+        assert InstanceCache.get(PluginType.MODEL, pytest.model_file) == (
+            "model",
+            None,
+        )
+        assert InstanceCache._current_size == 200
+
+    def test_evict_max_size_least_recently_used(self, tmp_path):
+        other_file = str(tmp_path / "other.sav")
+        Path(other_file).write_bytes(b"0" * 50)
+
+        InstanceCache._max_size = 300
+        InstanceCache.put(PluginType.DATA, pytest.data_file, ("data", None))
+        InstanceCache.put(PluginType.DATA, other_file, ("other", None))
+
+        # Access the first entry so that the other entry is the least recently used
+        assert InstanceCache.get(PluginType.DATA, pytest.data_file) == ("data", None)
+        InstanceCache.put(PluginType.MODEL, pytest.model_file, ("model", None))
+
+        assert InstanceCache.get(PluginType.DATA, other_file) is None
+        assert InstanceCache.get(PluginType.DATA, pytest.data_file) == ("data", None)
+        assert InstanceCache.get(PluginType.MODEL, pytest.model_file) == (
+            "model",
+            None,
+        )
+        assert InstanceCache._current_size == 300
+
+    @pytest.mark.parametrize(
+        "max_items, max_size, expected_max_items, expected_max_size",
+        [
+            (4, 1024, 4, 1024 * 1024 * 1024),
+            (0, 0, 0, 0),
+            (-1, -1, 8, 4096 * 1024 * 1024),
+            (None, "1024", 8, 4096 * 1024 * 1024),
+        ],
+    )
+    def test_setup(self, max_items, max_size, expected_max_items, expected_max_size):
+        InstanceCache.setup(max_items, max_size)
+        assert InstanceCache._max_items == expected_max_items
+        assert InstanceCache._max_size == expected_max_size
+
+    def test_setup_evicts_entries(self):
+        InstanceCache.put(PluginType.DATA, pytest.data_file, ("data", None))
+        InstanceCache.put(PluginType.MODEL, pytest.model_file, ("model", None))
+
+        # Reducing the max items evicts the least recently used entry
+        InstanceCache.setup(1, 4096)
+        assert InstanceCache.get(PluginType.DATA, pytest.data_file) is None
+        assert InstanceCache.get(PluginType.MODEL, pytest.model_file) == (
+            "model",
+            None,
+        )
+
+        # Disabling the cache evicts all the entries
+        InstanceCache.setup(0, 4096)
+        assert len(InstanceCache._entries) == 0
+        assert InstanceCache._current_size == 0
+        assert (
+            InstanceCache.put(PluginType.DATA, pytest.data_file, ("data", None))
+            is False
+        )
+
+    def test_put_exceed_max_size(self):
+        InstanceCache._max_size = 150
+        assert (
+            InstanceCache.put(PluginType.MODEL, pytest.model_file, ("model", None))
+            is False
+        )
+        assert InstanceCache.get(PluginType.MODEL, pytest.model_file) is None
+
+    def test_put_uncopyable_instances(self):
+        instances = ((value for value in range(3)), None)
+        assert InstanceCache.put(PluginType.DATA, pytest.data_file, instances) is False
+        assert InstanceCache.get(PluginType.DATA, pytest.data_file) is None
+
+    @pytest.mark.parametrize(
+        "plugin_type, path",
+        [
+            (PluginType.DATA, None),
+            (PluginType.DATA, ""),
+            (PluginType.DATA, "None"),
+            (PluginType.DATA, {}),
+            (PluginType.DATA, "tests/non_existent_file.sav"),
+            (None, "tests/__init__.py"),
+            ("DATA", "tests/__init__.py"),
+        ],
+    )
+    def test_invalid_inputs(self, plugin_type, path):
+        assert InstanceCache.put(plugin_type, path, ("data", None)) is False
+        assert InstanceCache.get(plugin_type, path) is None
@@ -262,6 +262,49 @@ class TestCollectionRedis:
         output = Redis.connect_to_pubsub(**kwargs)
         assert output == expected_output
 
+    @pytest.mark.parametrize(
+        "kwargs, expected_output",
+        [
+            (
+                {
+                    "ALGO_INSTALL": my_callback_function,
+                    "ALGO_UPDATE": my_callback_function,
+                },
+                True
+            ),
+            (
+                {
+                    "ALGO_INSTALL": my_callback_function,
+                },
+                False
+            ),
+            (
+                {
+                    "ALGO_INSTALL": None,
+                    "ALGO_UPDATE": None,
+                },
+                False
+            )
+        ]
+    )
+    def test_connect_to_algorithm_pubsub(self, mocker, kwargs, expected_output):
+        """
+        Tests connecting to algorithm pubsub
+        """
+        # Set logger
+        Redis.set_logger(pytest.my_logger)
+
+        # Setup redis host name and host port
+        Redis.setup("localhost", 1234)
+
+        # Connect to algorithm pubsub without a redis server
+        with (
+            mocker.patch.object(RedisPubSub, "setup", return_value=(True, "")),
+            mocker.patch.object(RedisPubSub, "subscribe", return_value=True)
+        ):
+            output = Redis.connect_to_algorithm_pubsub(**kwargs)
+            assert output == expected_output
+
     @pytest.mark.parametrize(
         "kwargs, expected_output",
         [
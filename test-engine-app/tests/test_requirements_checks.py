@@ -0,0 +1,144 @@
+import pytest
+from multidict import MultiDict, MultiDictProxy
+
+from test_engine_app.api.requirements_checks import RequirementsChecks
+from test_engine_app.api.requirements_checks_api import RequirementsChecksApi
+from test_engine_app.app_logger import AppLogger
+from test_engine_app.network.redis import Redis
+
+
+class TestCollectionRequirementsChecks:
+    pytest.my_logger = AppLogger()
+    pytest.my_logger.generate_logger()
+
+    @pytest.fixture(autouse=True)
+    def init(self, mocker):
+        # Reset
+        RequirementsChecks._installed_packages = None
+        RequirementsChecks._is_installed_packages_cached = False
+        RequirementsChecks.set_logger(pytest.my_logger)
+        RequirementsChecks.set_validation_folder("test_engine_app/validation_schemas")
+
+        # Count the number of times the index of installed packages is built
+        pytest.installed_packages = {"numpy": "1.24.1"}
+        pytest.load_installed_packages = mocker.patch.object(
+            RequirementsChecks, "load_installed_packages",
+            side_effect=lambda: dict(pytest.installed_packages)
+        )
+
+        # Perform tests
+        yield
+
+        # Reset
+        RequirementsChecks._installed_packages = None
+        RequirementsChecks._is_installed_packages_cached = False
+
+    def check_requirement(self, requirement: str) -> bool:
+        requirements_checks = RequirementsChecks(MultiDictProxy(MultiDict([("requirement", requirement)])))
+        results = requirements_checks.is_packages_supported()
+        assert len(results) == 1
+        return results[0]["result"]
+
+    def test_installed_packages_built_once(self):
+        """
+        Tests that the cached index of installed packages is only built once
+        """
+        RequirementsChecks.set_installed_packages_cache(True)
+        assert pytest.load_installed_packages.call_count == 1
+
+        assert self.check_requirement("numpy==1.24.1") is True
+        assert self.check_requirement("numpy==1.24.1") is True
+        assert pytest.load_installed_packages.call_count == 1
+
+    def test_reset_installed_packages(self):
+        """
+        Tests that resetting the cached index of installed packages rebuilds it on the next check
+        """
+        RequirementsChecks.set_installed_packages_cache(True)
+        pytest.installed_packages = {"numpy": "1.25.0"}
+        assert self.check_requirement("numpy==1.25.0") is False
+
+        RequirementsChecks.reset_installed_packages({"msg": "algo_id"})
+        assert RequirementsChecks._installed_packages is None
+        assert self.check_requirement("numpy==1.25.0") is True
+        assert self.check_requirement("numpy==1.25.0") is True
+        assert pytest.load_installed_packages.call_count == 2
+
+    def test_installed_packages_not_cached(self):
+        """
+        Tests that the index of installed packages is built for every check when the cache is disabled
+        """
+        RequirementsChecks.set_installed_packages_cache(False)
+        assert pytest.load_installed_packages.call_count == 0
+        assert RequirementsChecks._installed_packages is None
+
+        assert self.check_requirement("numpy==1.24.1") is True
+        assert self.check_requirement("numpy==1.24.1") is True
+        assert pytest.load_installed_packages.call_count == 2
+
+    @pytest.mark.parametrize(
+        "requirement, expected_output",
+        [
+            ("numpy==1.24.1", True),
+            ("NumPy==1.24.1", True),
+            (" NUMPY >= 1.24.1", True),
+            ("numpy==1.24.0", False),
+            ("pandas==1.24.1", False),
+        ]
+    )
+    def test_check_package_name_in_lower_case(self, requirement, expected_output):
+        """
+        Tests that the package names are looked up in lower case
+        """
+        assert self.check_requirement(requirement) is expected_output
+
+    @pytest.mark.parametrize(
+        "package_name, expected_output",
+        [
+            ("numpy", (True, "1.24.1", "")),
+            ("NumPy", (False, None, "Unable to get package version")),
+            ("pandas", (False, None, "Unable to get package version")),
+        ]
+    )
+    def test_get_installed_package_version(self, package_name, expected_output):
+        """
+        Tests getting the installed package version from the index keyed by lowercase names
+        """
+        requirements_checks = RequirementsChecks(MultiDictProxy(MultiDict()))
+        output = requirements_checks._get_installed_package_version(package_name, {"numpy": "1.24.1"})
+        assert output == expected_output
+
+    def test_load_installed_packages(self, mocker):
+        """
+        Tests that the index of installed packages is keyed by lowercase names
+        """
+        mocker.stopall()
+        installed_packages = RequirementsChecks.load_installed_packages()
+        assert "pytest" in installed_packages
+        assert all(package_name == package_name.lower() for package_name in installed_packages)
+
+    @pytest.mark.parametrize(
+        "is_subscribed, expected_is_cached",
+        [
+            (True, True),
+            (False, False),
+        ]
+    )
+    def test_setup_installed_packages_cache(self, mocker, is_subscribed, expected_is_cached):
+        """
+        Tests that the cache is only enabled when the algorithm channels are subscribed,
+        and is reset by the algorithm install and update messages
+        """
+        connect_to_algorithm_pubsub = mocker.patch.object(
+            Redis, "connect_to_algorithm_pubsub", return_value=is_subscribed
+        )
+        RequirementsChecksApi._setup_installed_packages_cache(pytest.my_logger)
+        assert RequirementsChecks._is_installed_packages_cached is expected_is_cached
+        assert pytest.load_installed_packages.call_count == int(expected_is_cached)
+
+        callbacks = connect_to_algorithm_pubsub.call_args.kwargs
+        assert set(callbacks.keys()) == {"ALGO_INSTALL", "ALGO_UPDATE"}
+        for channel_name, callback in callbacks.items():
+            RequirementsChecks._installed_packages = {}
+            callback({"msg": "algo_id"})
+            assert RequirementsChecks._installed_packages is None
@@ -0,0 +1,141 @@
+import queue
+import time
+from multiprocessing import resource_tracker
+from pathlib import Path
+
+import numpy as np
+import pytest
+from test_engine_app.app_logger import AppLogger
+from test_engine_app.enums.task_type import TaskType
+from test_engine_app.processing.task_executor import TaskExecutor
+from test_engine_app.processing.task_processing import TaskProcessing
+from test_engine_core.utils.shared_data import SharedData
+
+
+class StubTaskArgument:
+    id = "test_task"
+
+
+def publish_and_wait(*args):
+    SharedData.publish("test_key", np.arange(10), {})
+    time.sleep(60)
+
+
+class TestCollectionTaskExecutor:
+    @pytest.fixture(autouse=True)
+    def init(self):
+        # Reset
+        TaskExecutor.terminate()
+        TaskExecutor._max_tasks = 0
+        TaskExecutor._max_memory = 0
+        TaskExecutor._to_recycle = False
+
+        # Perform tests
+        yield
+
+        TaskExecutor.terminate()
+        TaskExecutor._max_tasks = 0
+        TaskExecutor._max_memory = 0
+        TaskExecutor._to_recycle = False
+
+    @pytest.mark.parametrize(
+        "max_tasks, max_memory, expected_max_tasks, expected_max_memory, expected_enabled",
+        [
+            (0, 0, 0, 0, False),
+            (1, 0, 1, 0, True),
+            (10, 2048, 10, 2048, True),
+            (-1, -1, 0, 0, False),
+            (None, None, 0, 0, False),
+            ("10", "2048", 0, 0, False),
+            ({}, [], 0, 0, False),
+        ],
+    )
+    def test_setup(
+        self,
+        max_tasks,
+        max_memory,
+        expected_max_tasks,
+        expected_max_memory,
+        expected_enabled,
+    ):
+        TaskExecutor.setup(max_tasks, max_memory)
+        assert TaskExecutor._max_tasks == expected_max_tasks
+        assert TaskExecutor._max_memory == expected_max_memory
+        assert TaskExecutor.is_enabled() is expected_enabled
+
+    def test_recycle(self):
+        assert TaskExecutor._to_recycle is False
+        TaskExecutor.recycle()
+        assert TaskExecutor._to_recycle is True
+
+    def test_terminate_without_process(self):
+        TaskExecutor.terminate()
+        assert TaskExecutor._process is None
+        assert TaskExecutor._task_queue is None
+        assert TaskExecutor._result_queue is None
+
+    def test_run_executor_in_process_stop(self):
+        task_queue = queue.Queue()
+        result_queue = queue.Queue()
+        task_queue.put(None)
+
+        TaskExecutor.run_executor_in_process(task_queue, result_queue, 10, 0)
+        assert task_queue.empty()
+        assert result_queue.empty()
+
+    def test_run_executor_in_process_releases_shared_data(self):
+        task_queue = queue.Queue()
+        result_queue = queue.Queue()
+        task_queue.put(None)
+
+        SharedData.setup(1)
+        try:
+            assert SharedData.publish("test_key", np.arange(10), {}) is True
+            TaskExecutor.run_executor_in_process(task_queue, result_queue, 10, 0)
+            assert SharedData.attach("test_key") is None
+        finally:
+            SharedData.release_all()
+            SharedData.setup(0)
+
+    def test_start_and_stop_process(self):
+        TaskExecutor.setup(10, 0)
+        TaskExecutor._start_process()
+        process = TaskExecutor._process
+        assert process.is_alive()
+        assert TaskExecutor._to_recycle is False
+
+        TaskExecutor._stop_process()
+        assert not process.is_alive()
+        assert process.exitcode == 0
+        assert TaskExecutor._process is None
+
+    def test_terminate_removes_shared_data(self, mocker):
+        mocker.patch.object(AppLogger, "generate_stream_logger")
+        mocker.patch.object(
+            TaskProcessing,
+            "run_task_processing_in_process",
+            side_effect=publish_and_wait,
+        )
+        TaskExecutor.setup(10, 0)
+        SharedData.setup(1, "test_namespace")
+        # The task process shares the resource tracker of this process, which does not remove the shared memory
+        # of the terminated task process
+        resource_tracker.ensure_running()
+        try:
+            # The task process places the data in shared memory, and is terminated during the task
+            TaskExecutor.submit(StubTaskArgument(), "1-0", "{}", TaskType.NEW)
+            for _ in range(100):
+                if SharedData.attach("test_key") is not None:
+                    break
+                time.sleep(0.1)
+            assert SharedData.attach("test_key") is not None
+
+            TaskExecutor.terminate()
+            assert SharedData.attach("test_key") is None
+            assert not (
+                Path(SharedData._shared_memory_folder)
+                / SharedData._get_name("test_key")
+            ).exists()
+            assert TaskExecutor._shared_data_names == set()
+        finally:
+            SharedData.setup(0, "")
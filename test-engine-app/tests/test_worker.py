@@ -18,7 +18,7 @@ class TestCollectionWorker:
     @pytest.fixture(autouse=True)
     def init(self):
         # Reset
-        Worker._running_item = None
+        Worker._running_items = dict()
         Worker._logger = AppLogger()
         Worker._to_stop = False
         Worker._worker_name = ""
@@ -477,8 +477,8 @@ class TestCollectionWorker:
         assert is_success is True
         assert error_message == ""
 
-        Worker._set_running_item(new_task)
-        assert Worker._running_item == new_task
+        Worker._add_running_item("1-0", new_task)
+        assert Worker._get_running_items() == [new_task]
         is_sent = Worker._process_task_stop_callback(message)
         assert is_sent == expected_output
 
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from typing import Any
+
+from pyarrow import ipc, memory_map, parquet
+from test_engine_core.interfaces.iserializer import ISerializer
+from test_engine_core.plugins.enums.arrow_file_type import ArrowFileType
+from test_engine_core.plugins.enums.plugin_type import PluginType
+from test_engine_core.plugins.enums.serializer_plugin_type import SerializerPluginType
+from test_engine_core.plugins.metadata.arrow_metadata import ArrowMetadata
+from test_engine_core.plugins.metadata.plugin_metadata import PluginMetadata
+
+
+# NOTE: Do not change the class name, else the plugin cannot be read by the system
+class Plugin(ISerializer):
+    """
+    The Plugin(arrowserializer) class specifies methods on serialization.
+    """
+
+    # Some information on plugin
+    _name: str = "arrowserializer"
+    _description: str = "arrowserializer supports reading columnar data in parquet, feather and arrow files"
+    _version: str = "0.9.0"
+    _metadata: PluginMetadata = PluginMetadata(_name, _description, _version)
+    _plugin_type: PluginType = PluginType.SERIALIZER
+    _serializer_plugin_type: SerializerPluginType = SerializerPluginType.ARROW
+
+    # The magic bytes that identify the supported file types
+    _parquet_magic: bytes = b"PAR1"
+    _arrow_magic: bytes = b"ARROW1"
+
+    @staticmethod
+    def get_metadata() -> PluginMetadata:
+        """
+        A method to return the metadata for this plugin
+
+        Returns:
+            PluginMetadata: Metadata of this plugin
+        """
+        return Plugin._metadata
+
+    @staticmethod
+    def get_plugin_type() -> PluginType:
+        """
+        A method to return the type for this plugin
+
+        Returns:
+             PluginType: Type of this plugin
+        """
+        return Plugin._plugin_type
+
+    @staticmethod
+    def deserialize_data(data_path: str) -> Any:
+        """
+        A method to read the data path and attempt to deserialize it.
+        Only the file schema is read, the columns are read when the data is converted to a dataframe
+
+        Args:
+            data_path (str): data path that is serialized
+
+        Returns:
+            Any: deserialized data
+        """
+        # check the magic bytes to identify the file type. if not supported, raise an error
+        try:
+            with open(data_path, "rb") as binary_file:
+                magic_bytes = binary_file.read(len(Plugin._arrow_magic))
+
+            if magic_bytes.startswith(Plugin._parquet_magic):
+                file_type = ArrowFileType.PARQUET
+                parquet_metadata = parquet.read_metadata(data_path, memory_map=True)
+                schema = parquet_metadata.schema.to_arrow_schema()
+                num_rows = parquet_metadata.num_rows
+
+            elif magic_bytes == Plugin._arrow_magic:
+                file_type = ArrowFileType.ARROW
+                with memory_map(data_path, "r") as source:
+                    reader = ipc.open_file(source)
+                    schema = reader.schema
+                    num_rows = sum(
+                        reader.get_batch(count).num_rows
+                        for count in range(reader.num_record_batches)
+                    )
+
+            else:
+                raise ValueError("The file type is not supported.")
+
+            return ArrowMetadata(
+                {field.name: str(field.type) for field in schema},
+                num_rows,
+                file_type,
+                data_path,
+            )
+
+        except Exception:
+            raise
+
+    @staticmethod
+    def get_serializer_plugin_type() -> SerializerPluginType:
+        """
+        A method to return SerializerPluginType
+
+        Returns:
+            SerializerPluginType: Serializer Plugin Type
+        """
+        return Plugin._serializer_plugin_type
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import csv
+import io
 from typing import Any
 
 from test_engine_core.interfaces.iserializer import ISerializer
@@ -26,6 +27,7 @@ class Plugin(ISerializer):
     _metadata: PluginMetadata = PluginMetadata(_name, _description, _version)
     _plugin_type: PluginType = PluginType.SERIALIZER
     _serializer_plugin_type: SerializerPluginType = SerializerPluginType.DELIMITER
+    _sample_size: int = 65536  # 64 KB
 
     @staticmethod
     def get_metadata() -> PluginMetadata:
@@ -69,9 +71,18 @@ class Plugin(ISerializer):
         ]
 
         # check if file can be parsed properly and if the delimiter is supported. if not, raise an error
+        # only the head of the file is read to detect the delimiter.
+        # the whole file is parsed once when it is converted to a dataframe
         try:
             with open(data_path, "r") as text_file:
-                list_data = list(csv.reader(text_file))
+                sample = text_file.read(Plugin._sample_size)
+                if len(sample) == Plugin._sample_size:
+                    # remove the last partial line if the file is larger than the sample
+                    last_line_index = sample.rfind("\n")
+                    if last_line_index > 0:
+                        sample = sample[: last_line_index + 1]
+
+                list_data = list(csv.reader(io.StringIO(sample)))
                 # check if SV file only has a single column by checking for presence of supported SVs
                 if all(
                     supported_separated_value[1] not in list_data[0][0]
@@ -83,7 +94,7 @@ class Plugin(ISerializer):
                     )
                     return delimiter_instance
                 else:
-                    dialect = csv.Sniffer().sniff(text_file.read(4096))
+                    dialect = csv.Sniffer().sniff(sample)
                     detected_delimiter_tuple = None
                     for count, item in enumerate(supported_separated_values_list):
                         if (
@@ -97,8 +108,9 @@ class Plugin(ISerializer):
                     if not detected_delimiter_tuple:
                         raise ValueError("The delimiter is not supported.")
 
-                    text_file.seek(0)
-                    reader = csv.reader(text_file, delimiter=dialect.delimiter)
+                    reader = csv.reader(
+                        io.StringIO(sample), delimiter=dialect.delimiter
+                    )
                     list_data_with_delimiter = list(reader)
                     delimiter_instance = DelimiterMetadata(
                         list_data_with_delimiter, detected_delimiter_tuple, data_path
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any
+import os
+from typing import Any, Union
 
 import joblib
 from test_engine_core.interfaces.iserializer import ISerializer
@@ -23,6 +24,12 @@ class Plugin(ISerializer):
     _plugin_type: PluginType = PluginType.SERIALIZER
     _serializer_plugin_type: SerializerPluginType = SerializerPluginType.JOBLIB
 
+    # The numpy arrays in uncompressed joblib files are memory-mapped copy-on-write, so that the processes
+    # reading the same file share the pages, and in-place changes are kept private to each process
+    _mmap_mode: str = "c"
+    # Uncompressed joblib files are pickle files which start with the PROTO opcode
+    _uncompressed_file_signature: bytes = b"\x80"
+
     @staticmethod
     def get_metadata() -> PluginMetadata:
         """
@@ -55,7 +62,51 @@ class Plugin(ISerializer):
             Any: deserialized data
         """
         try:
-            return joblib.load(open(data_path, "rb"))
+            with open(data_path, "rb") as data_file:
+                is_uncompressed = (
+                    data_file.read(1) == Plugin._uncompressed_file_signature
+                )
+
+            # Compressed files cannot be memory-mapped and are loaded into memory
+            if is_uncompressed:
+                return joblib.load(data_path, mmap_mode=Plugin._mmap_mode)
+            else:
+                return joblib.load(data_path)
+        except Exception:
+            raise
+
+    @staticmethod
+    def convert_to_mmap_file(
+        data_path: str, output_path: Union[str, None] = None
+    ) -> str:
+        """
+        A method to re-dump a serialized pickle or joblib file into an uncompressed joblib file,
+        where the numpy arrays are stored aligned so that they can be memory-mapped when deserialized
+
+        Args:
+            data_path (str): data path that is serialized
+            output_path (Union[str, None]): the path of the re-dumped file. Defaults to None, which replaces
+            the data path
+
+        Returns:
+            str: the path of the re-dumped file
+        """
+        try:
+            if output_path is None:
+                output_path = data_path
+
+            data = joblib.load(data_path)
+
+            # Dump to a temporary file first so that the file is not partially written if it fails
+            temp_output_path = f"{output_path}.tmp"
+            try:
+                joblib.dump(data, temp_output_path, compress=0)
+                os.replace(temp_output_path, output_path)
+            finally:
+                if os.path.exists(temp_output_path):
+                    os.remove(temp_output_path)
+
+            return str(output_path)
         except Exception:
             raise
 
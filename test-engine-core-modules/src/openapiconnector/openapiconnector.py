@@ -1,9 +1,13 @@
 import asyncio
 import functools
+import hashlib
 import http
 import json
+import logging
 import pathlib
+import threading
 import time
+from collections import OrderedDict
 from enum import Enum, auto
 from typing import Any, Callable, Dict, List, Tuple, Union
 
@@ -19,6 +23,7 @@ from test_engine_core.interfaces.imodel import IModel
 from test_engine_core.plugins.enums.model_plugin_type import ModelPluginType
 from test_engine_core.plugins.enums.plugin_type import PluginType
 from test_engine_core.plugins.metadata.plugin_metadata import PluginMetadata
+from test_engine_core.utils.log_utils import log_message
 
 
 class BatchStrategy(Enum):
@@ -30,6 +35,19 @@ class BatchStrategy(Enum):
     APPLICATION_JSON = auto()
 
 
+class ResponseFormat(Enum):
+    """
+    The ResponseFormat enum class specifies the different formats of the response body
+    """
+
+    PRIMITIVE = auto()  # 100
+    OBJECT = auto()  # {data: 100}
+    OBJECT_OF_ARRAY = auto()  # {data: [1, 2, 3]}
+    ARRAY = auto()  # [1, 2, 3]
+    ARRAY_OF_OBJECTS = auto()  # [{data: 123}, {data: 234}]
+    ARRAY_OF_ARRAYS = auto()  # [[1, 2], [3, 4]]
+
+
 # NOTE: Do not change the class name, else the plugin cannot be read by the system
 class Plugin(IModel):
     """
@@ -62,6 +80,9 @@ class Plugin(IModel):
     _api_batch_limit_default: int = 500
     _api_max_connections_default: int = 20
     _api_connection_retries_default: int = 3
+    _api_response_cache_size_default: int = 0
+    _api_response_cache_timeout_default: float = -1
+    _api_adaptive_connections_default: bool = False
     # Set request options values
     _api_ssl_verify: bool = _api_ssl_verify_default
     _api_ssl_cert: Union[str, None] = _api_ssl_cert_default
@@ -72,6 +93,9 @@ class Plugin(IModel):
     _api_batch_limit: int = _api_batch_limit_default
     _api_max_connections: int = _api_max_connections_default
     _api_connection_retries: int = _api_connection_retries_default
+    _api_response_cache_size: int = _api_response_cache_size_default
+    _api_response_cache_timeout: float = _api_response_cache_timeout_default
+    _api_adaptive_connections: bool = _api_adaptive_connections_default
     # OpenAPI request error
     _lock = asyncio.Lock()
     _response_error_message: str = ""
@@ -124,24 +148,42 @@ class Plugin(IModel):
                 Plugin._api_connection_timeout, connect=Plugin._api_connection_timeout
             )
         kwargs["timeout"] = httpx_timeout
-        kwargs["transport"] = OpenAPICustomTransport(
-            verify=Plugin._api_ssl_verify,
-            cert=Plugin._api_ssl_cert,
-            rate_limit=Plugin._api_rate_limit,
-            rate_limit_timeout=Plugin._api_rate_limit_timeout,
-            batch_strategy=Plugin._api_batch_strategy,
-            batch_limit=Plugin._api_batch_limit,
-            max_connections=Plugin._api_max_connections,
-            connection_retries=Plugin._api_connection_retries,
-            response_error_callback=Plugin._notify_response_error,
-        )
+        if kwargs.get("transport") is None:
+            kwargs["transport"] = Plugin._create_custom_transport(is_persistent=False)
 
         return httpx.AsyncClient(*args, **kwargs)
 
+    def persistent_session_factory(self, *args, **kwargs) -> httpx.AsyncClient:
+        """
+        A session factory that generates async client with the persistent transport module of this
+        plugin instance. The transport keeps the connections alive between requests and predictions,
+        and will be closed when the plugin is cleaned up.
+
+        Returns:
+            httpx.AsyncClient: Returns a httpx AsyncClient
+        """
+        if self._api_transport is None:
+            self._api_transport = Plugin._create_custom_transport(is_persistent=True)
+        kwargs["transport"] = self._api_transport
+
+        return Plugin.custom_session_factory(*args, **kwargs)
+
     def __init__(self, **kwargs) -> None:
         # Configuration
         self._is_setup_completed = False
         self._api_instance = None
+        self._logger: Union[logging.Logger, None] = kwargs.get("logger", None)
+        # Persistent event loop and transport
+        self._event_loop: Union[asyncio.AbstractEventLoop, None] = None
+        self._event_loop_thread: Union[threading.Thread, None] = None
+        self._event_loop_lock = threading.Lock()
+        self._api_transport: Union[OpenAPICustomTransport, None] = None
+        # Response cache key of the API schema and configuration
+        self._api_cache_key: str = ""
+        # Response body format resolved from the API configuration
+        self._response_format: ResponseFormat = ResponseFormat.PRIMITIVE
+        self._response_keyname: Union[str, None] = None
+        self._response_type_to_cast: Union[Callable, None] = None
         api_schema = kwargs.get("api_schema", None)
         api_config = kwargs.get("api_config", None)
 
@@ -152,11 +194,55 @@ class Plugin(IModel):
             self._api_schema: Dict = dict()
             self._api_config: Dict = dict()
 
+    def __getstate__(self) -> Dict:
+        """
+        A method to return the state of the plugin for pickling.
+        The event loop, thread and transport cannot be pickled and will be created again when required.
+
+        Returns:
+            Dict: The state of the plugin
+        """
+        state = self.__dict__.copy()
+        state["_event_loop"] = None
+        state["_event_loop_thread"] = None
+        state["_event_loop_lock"] = None
+        state["_api_transport"] = None
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        """
+        A method to restore the state of the plugin after unpickling
+
+        Args:
+            state (Dict): The state of the plugin
+        """
+        self.__dict__.update(state)
+        self._event_loop_lock = threading.Lock()
+
     def cleanup(self) -> None:
         """
         A method to clean-up objects
         """
-        pass
+        with self._event_loop_lock:
+            if self._event_loop is None:
+                return
+
+            # Close the persistent connections in the event loop they were opened in
+            if self._api_transport is not None:
+                try:
+                    asyncio.run_coroutine_threadsafe(
+                        self._api_transport.close_transport(), self._event_loop
+                    ).result()
+                except Exception:
+                    pass
+                self._api_transport = None
+
+            # Stop the event loop and its thread
+            self._event_loop.call_soon_threadsafe(self._event_loop.stop)
+            self._event_loop_thread.join()
+            self._event_loop.close()
+            self._event_loop = None
+            self._event_loop_thread = None
 
     def setup(self) -> Tuple[bool, str]:
         """
@@ -218,15 +304,40 @@ class Plugin(IModel):
             Plugin._api_connection_retries = self._api_config.get(
                 "requestConfig", {}
             ).get("connectionRetries", Plugin._api_connection_retries_default)
+            Plugin._api_response_cache_size = self._api_config.get(
+                "requestConfig", {}
+            ).get("responseCacheSize", Plugin._api_response_cache_size_default)
+            Plugin._api_response_cache_timeout = self._api_config.get(
+                "requestConfig", {}
+            ).get("responseCacheTimeout", Plugin._api_response_cache_timeout_default)
+            Plugin._api_adaptive_connections = self._api_config.get(
+                "requestConfig", {}
+            ).get("adaptiveConnections", Plugin._api_adaptive_connections_default)
 
             # Perform input validation
             self._validate_input()
 
+            # Setup the response cache.
+            # The request options do not change the response, and are not part of the cache key.
+            OpenAPIResponseCache.setup(
+                Plugin._api_response_cache_size, Plugin._api_response_cache_timeout
+            )
+            api_cache_config = {
+                key: value
+                for key, value in self._api_config.items()
+                if key != "requestConfig"
+            }
+            self._api_cache_key = hashlib.sha256(
+                json.dumps(
+                    [self._api_schema, api_cache_config], sort_keys=True, default=str
+                ).encode()
+            ).hexdigest()
+
             # Create the api instance based on the provided api schema
             self._api_instance = OpenAPI.loads(
                 url="",
                 data=json.dumps(self._api_schema),
-                session_factory=Plugin.custom_session_factory,
+                session_factory=self.persistent_session_factory,
                 loader=FileSystemLoader(pathlib.Path("")),
                 use_operation_tags=True,
             )
@@ -282,7 +393,7 @@ class Plugin(IModel):
         """
         # Call the function to make multiple requests
         try:
-            return asyncio.run(self.make_request(data, *args))
+            return self._run_in_event_loop(self.make_request(data, *args))
         except:
             raise RuntimeError("Unable to send request to API Server. Please ensure that the URL is correct.")
 
@@ -299,7 +410,7 @@ class Plugin(IModel):
         """
         # Call the function to make multiple requests
         try:
-            return asyncio.run(self.make_request(data, *args))
+            return self._run_in_event_loop(self.make_request(data, *args))
         except:
             raise RuntimeError("Unable to send request to API Server. Please ensure that the URL is correct.")
 
@@ -395,13 +506,28 @@ class Plugin(IModel):
             - The method retrieves the requestBody data mapping dictionary from the requestBody and
             updates it with the values from the data_row based on the data_labels.
         """
-
         # Make sure that the data row comes in as a list, so we can reference the index and pull the value
         if isinstance(data_row, pd.Series):
             data_row_list = data_row.tolist()
         else:
-            data_row_list = data_row
+            data_row_list = list(data_row)
+
+        return self._get_data_payloads([data_row_list], self._get_payload_mapping(data_labels))[0]
 
+    def _get_payload_mapping(self, data_labels: Tuple[Any, ...]) -> List[Tuple[str, int]]:
+        """
+        A helper method to resolve the column index of each payload field once, so that the payloads
+        can be built column-wise instead of searching the data labels for every row
+
+        Args:
+            data_labels (Tuple[Any, ...]): A tuple containing key-value pairs representing the data labels.
+
+        Raises:
+            RuntimeError: Exception if a payload field is mapped to a label that is not in the data labels
+
+        Returns:
+            List[Tuple[str, int]]: A list of payload field names and their column index in the data
+        """
         # parameters field is not empty
         if len(self._api_config.get("parameters", [])):
             data_mapping = self._api_config.get("parameters", dict())
@@ -409,29 +535,52 @@ class Plugin(IModel):
         else:
             data_mapping = self._api_config.get("requestBody", dict())
 
-        # Update the data mapping dictionary with the row value
-        return_list = dict()
+        label_index = dict()
+        for index, (label, _) in enumerate(data_labels):
+            label_index.setdefault(label, index)
+
+        payload_mapping = list()
         for key, value in data_mapping.items():
-            index = next(
-                (
-                    index
-                    for index, (key1, value1) in enumerate(data_labels)
-                    if key1 == value
-                ),
-                None,
-            )
+            if value not in label_index:
+                raise RuntimeError(f"Unable to find the data label for the payload field: {key}")
+            payload_mapping.append((key, label_index[value]))
+        return payload_mapping
 
-            # if type is numpy float32, convert to numpy float64 as numpy float32 is non-JSON serializable
-            if isinstance(data_row_list[index], np.floating):
-                return_list[key] = float(data_row_list[index])
-            elif isinstance(data_row_list[index], np.integer):
-                return_list[key] = int(data_row_list[index])
-            else:
-                return_list[key] = data_row_list[index]
+    @staticmethod
+    def _get_data_payloads(
+        data_to_predict: Any, payload_mapping: List[Tuple[str, int]]
+    ) -> List[Dict]:
+        """
+        A helper method to build the data payloads for all the rows of the data.
+        The mapped columns are projected once and converted to records, which converts the numpy values
+        to JSON serializable python values.
+
+        Args:
+            data_to_predict (Any): The data to be predicted. It can be a pandas DataFrame, numpy ndarray or
+            a list of rows
+            payload_mapping (List[Tuple[str, int]]): A list of payload field names and their column index
 
-        return return_list
+        Returns:
+            List[Dict]: A list of data payloads, one for each row of the data
+        """
+        field_names = [key for key, _ in payload_mapping]
+        column_indexes = [index for _, index in payload_mapping]
+        if isinstance(data_to_predict, pd.DataFrame):
+            projected_data = data_to_predict.iloc[:, column_indexes].set_axis(
+                field_names, axis=1
+            )
+        else:
+            if isinstance(data_to_predict, np.ndarray):
+                data_array = data_to_predict
+            else:
+                # Keep the values of mixed types as they are
+                data_array = np.asarray(data_to_predict, dtype=object)
+            projected_data = pd.DataFrame(
+                data_array[:, column_indexes], columns=field_names
+            )
+        return projected_data.to_dict("records")
 
-    async def send_request(self, row, *args) -> Response:
+    async def send_request(self, row_data_to_send: Dict) -> Response:
         """
         An async method to send an API request based on the provided row data.
 
@@ -454,7 +603,6 @@ class Plugin(IModel):
             instance's predict_api attribute to access the API details.
             - The method returns the API response object containing the results of the API request.
         """
-        row_data_to_send = await self.get_data_payload(row, *args)
         if self._api_instance._.predict_api.method.lower() == "post":
             # POST method. Get API Instance schema
             self._api_instance_schema = await self.get_schema_content()
@@ -479,13 +627,14 @@ class Plugin(IModel):
             )
         return result
 
-    async def send_batched_request(self, list_of_rows, *args) -> Response:
+    async def send_batched_request(self, list_of_processed_rows: List[Dict]) -> Response:
         """
         An async method to send an API request based on the provided row data.
 
         Args:
-            list_of_rows (List): A list containing the rows of data to be sent in the API request.The number
-            of data in the list is dependent on the self._api_batch_limit (based on the user's input).
+            list_of_processed_rows (List[Dict]): A list containing the data payloads of the rows to be sent in
+            the API request. The number of data in the list is dependent on the self._api_batch_limit
+            (based on the user's input).
 
         Returns:
             Response: The response object representing the API response.
@@ -502,11 +651,6 @@ class Plugin(IModel):
             instance's predict_api attribute to access the API details.
             - The method returns the API response object containing the results of the API request.
         """
-        list_of_processed_rows = []
-        for row in list_of_rows:
-            row_data_to_send = await self.get_data_payload(row, *args)
-            list_of_processed_rows.append(row_data_to_send)
-
         if self._api_instance._.predict_api.method.lower() == "post":
             # POST method. Get API Instance schema
             self._api_instance_schema = await self.get_schema_content()
@@ -525,7 +669,7 @@ class Plugin(IModel):
             body = None
             # Perform api request
             headers, data, result = await self._api_instance._.predict_api.request(
-                parameters=row_data_to_send, data=body
+                parameters=list_of_processed_rows[-1], data=body
             )
         return result
 
@@ -537,7 +681,7 @@ class Plugin(IModel):
             data (Any): The data to be predicted. It can be a pandas DataFrame or a numpy ndarray, or a list containing
             multiple data objects of these types.
             *args (Tuple): Variable-length argument list. The argument list contains any additional arguments required
-            by the `get_data_payload` function.
+            to build the data payloads, such as the data labels.
 
         Returns:
             Any: The response data obtained from the API requests. It is returned as a list containing the response
@@ -546,229 +690,348 @@ class Plugin(IModel):
         Notes:
             - This method allows making multiple API requests using the provided data. The data can be a pandas
             DataFrame or a numpy ndarray, or a list containing multiple data objects of these types.
-            - For each data object in the input data list, the method iterates over the rows of the DataFrame
-            or ndarray.
-            - It prepares the row information for the payload or headers using the `get_data_payload` method, which
-            takes the row and any additional arguments (*args) as input.
-            - The row information is then passed to the `send_request` method to make the API request and
-            obtain the response.
-            - The response text from each API request is appended to the `response_data` list.
+            - The column of each payload field is resolved once from the data labels, and the payloads
+            of each data object in the input data list are built column-wise for all its rows.
+            - If the response cache is enabled, the rows with cached responses and the duplicated rows are not sent.
+            - The payloads are then passed to the `send_request` method (or `send_batched_request` method in batches)
+            to make the API request and obtain the response.
+            - The responses are decoded as they complete with the response body format resolved once, and the
+            response data from each API request is placed in the order of the requests.
             - Finally, the method returns the `response_data` list containing the response text from
             all the API requests.
         """
 
         start_time = time.time()
         response_data = list()
-        new_list_of_data = []
+
+        # Resolve the response body format once for decoding the responses
+        if self._response_type_to_cast is None:
+            self._setup_response_format()
+
+        # Resolve the payload field columns once and build the payloads column-wise.
+        # Loop through the data list. It can be a list of mixed data to be predicted such as DF or numpy.
+        payload_mapping = self._get_payload_mapping(*args)
+        list_of_payloads = list()
+        for data_to_predict in data:
+            list_of_payloads.extend(
+                self._get_data_payloads(data_to_predict, payload_mapping)
+            )
+
+        # Get the cached responses and only send the rows which are not cached, once for each duplicated row
+        if OpenAPIResponseCache.is_enabled():
+            list_of_cache_keys = [
+                self._get_payload_cache_key(payload) for payload in list_of_payloads
+            ]
+            list_of_row_results = [
+                OpenAPIResponseCache.get(cache_key) for cache_key in list_of_cache_keys
+            ]
+            rows_to_send = dict()
+            for index, (cache_key, row_results) in enumerate(
+                zip(list_of_cache_keys, list_of_row_results)
+            ):
+                if row_results is None and cache_key not in rows_to_send:
+                    rows_to_send[cache_key] = index
+            list_of_indexes_to_send = list(rows_to_send.values())
+        else:
+            list_of_cache_keys = None
+            list_of_row_results = None
+            list_of_indexes_to_send = list(range(len(list_of_payloads)))
 
         # batching using application/json
         if self._api_batch_strategy == BatchStrategy.APPLICATION_JSON:
-            batched_data = []
-            # Loop through the data list. It can be a list of mixed data to be predicted such as DF or numpy.
-            for data_to_predict in data:
-                # PANDAS DF
-                if type(data_to_predict) is pd.DataFrame:
-                    for _, row in data_to_predict.iterrows():
-                        batched_data.append(row)
-                    for i in range(0, len(batched_data), self._api_batch_limit):
-                        new_list_of_data.append(
-                            batched_data[i : i + self._api_batch_limit]
-                        )
-                # NDARRAY
-                else:
-                    for row in data_to_predict:
-                        # Pass this information to the send request function to request
-                        batched_data.append(row)
-                    for i in range(0, len(batched_data), self._api_batch_limit):
-                        new_list_of_data.append(
-                            batched_data[i : i + self._api_batch_limit]
-                        )
+            list_of_requests = [
+                list_of_indexes_to_send[i : i + self._api_batch_limit]
+                for i in range(0, len(list_of_indexes_to_send), self._api_batch_limit)
+            ]
             jobs = [
-                functools.partial(self.send_batched_request, row_data, *args)
-                for row_data in new_list_of_data
+                functools.partial(
+                    self.send_batched_request,
+                    [list_of_payloads[index] for index in request_indexes],
+                )
+                for request_indexes in list_of_requests
             ]
         # no batching
         else:
-            # loop through the data list. it can be a list of mixed data to be predicted such as DF or numpy
-            for data_to_predict in data:
-                # PANDAS DF
-                if type(data_to_predict) is pd.DataFrame:
-                    for _, row in data_to_predict.iterrows():
-                        # Pass this information to the send request function to request
-                        new_list_of_data.append(row)
-                # NDARRAY
-                else:
-                    for row in data_to_predict:
-                        # Pass this information to the send request function to request
-                        new_list_of_data.append(row)
+            list_of_requests = [[index] for index in list_of_indexes_to_send]
             jobs = [
-                functools.partial(self.send_request, row_data, *args)
-                for row_data in new_list_of_data
+                functools.partial(self.send_request, list_of_payloads[index])
+                for index in list_of_indexes_to_send
             ]
 
-        if self._api_max_connections == -1 and self._api_rate_limit == -1:
-            response_list = await aiometer.run_all(jobs)
-        elif self._api_max_connections == -1:
-            response_list = await aiometer.run_all(
-                jobs, max_per_second=self._api_rate_limit
-            )
-        elif self._api_rate_limit == -1:
-            response_list = await aiometer.run_all(
-                jobs, max_at_once=self._api_max_connections
-            )
+        # Decode the responses as they complete, and place the response data in the order of the requests
+        list_of_response_data = [None] * len(jobs)
+        async with aiometer.amap(
+            Plugin._run_job,
+            jobs,
+            max_at_once=None
+            if self._api_max_connections == -1
+            else self._api_max_connections,
+            max_per_second=None if self._api_rate_limit == -1 else self._api_rate_limit,
+            _include_index=True,
+        ) as results:
+            async for index, response in results:
+                list_of_response_data[index] = self._decode_response(response)
+
+        if list_of_row_results is None:
+            for response_data_of_request in list_of_response_data:
+                response_data.extend(response_data_of_request)
         else:
-            response_list = await aiometer.run_all(
-                jobs,
-                max_at_once=self._api_max_connections,
-                max_per_second=self._api_rate_limit,
-            )
-        # # get the response data_type: array/object/string/number/integer/boolean
+            # Match the response data to the rows, and store them in the cache
+            for request_indexes, response_data_of_request in zip(
+                list_of_requests, list_of_response_data
+            ):
+                if len(response_data_of_request) % len(request_indexes) != 0:
+                    raise RuntimeError(
+                        "Unable to match the response data to the rows for the response cache"
+                    )
+                row_size = len(response_data_of_request) // len(request_indexes)
+                for position, index in enumerate(request_indexes):
+                    row_results = response_data_of_request[
+                        position * row_size : (position + 1) * row_size
+                    ]
+                    list_of_row_results[index] = row_results
+                    OpenAPIResponseCache.put(list_of_cache_keys[index], row_results)
+
+            # Duplicated rows share the response data of the row that was sent
+            for index, row_results in enumerate(list_of_row_results):
+                if row_results is None:
+                    row_results = list_of_row_results[
+                        rows_to_send[list_of_cache_keys[index]]
+                    ]
+                response_data.extend(row_results)
+
+        end_time = time.time()
+        elapsed_time = end_time - start_time
+        self._log_throughput(len(jobs), elapsed_time)
+        return response_data
+
+    def _log_throughput(self, number_of_requests: int, elapsed_time: float) -> None:
+        """
+        A helper method to log the achieved throughput of the requests, and the number of concurrent
+        requests the adaptive connections have reached
 
-        response_data_type = (
-            self._api_config.get("responseBody").get("schema").get("type")
+        Args:
+            number_of_requests (int): The number of requests sent
+            elapsed_time (float): The time taken in seconds
+        """
+        if number_of_requests == 0:
+            return
+
+        message = (
+            f"OpenAPIConnector sent {number_of_requests} request(s) in {elapsed_time:.2f}s "
+            f"({number_of_requests / max(elapsed_time, 1e-6):.1f} requests/s)"
         )
+        if self._api_transport is not None and self._api_transport.get_adaptive_limiter():
+            message += (
+                f" with up to {self._api_transport.get_adaptive_limiter().get_limit()} "
+                f"adaptive concurrent requests"
+            )
+        log_message(self._logger, logging.INFO, message)
+
+    @staticmethod
+    async def _run_job(job: Callable) -> Any:
+        """
+        An async helper method to run the request job
+
+        Args:
+            job (Callable): The request job
+
+        Returns:
+            Any: The result of the request job
+        """
+        return await job()
+
+    def _decode_response(self, response: Response) -> List:
+        """
+        A helper method to decode the response data based on the response body format resolved at setup
+
+        Args:
+            response (Response): The response object representing the API response
+
+        Returns:
+            List: The response data of the response
+        """
+        type_to_cast = self._response_type_to_cast
+        if self._response_format is ResponseFormat.PRIMITIVE:
+            return [type_to_cast(response.text)]
+
+        response_body = json.loads(response.content)
+        if self._response_format is ResponseFormat.OBJECT:
+            return [type_to_cast(response_body.get(self._response_keyname))]
+        elif self._response_format is ResponseFormat.OBJECT_OF_ARRAY:
+            return [
+                type_to_cast(data)
+                for data in response_body.get(self._response_keyname)
+            ]
+        elif self._response_format is ResponseFormat.ARRAY_OF_OBJECTS:
+            return [
+                type_to_cast(response_body_item.get(self._response_keyname))
+                for response_body_item in response_body
+            ]
+        elif self._response_format is ResponseFormat.ARRAY_OF_ARRAYS:
+            return [
+                type_to_cast(data)
+                for nested_array in response_body
+                for data in nested_array
+            ]
+        else:
+            return [type_to_cast(data) for data in response_body]
+
+    def _setup_response_format(self) -> None:
+        """
+        A helper method to resolve the response body format, the response key name and the data type
+        from the response body schema in the API configuration
+        """
+        response_schema = self._api_config.get("responseBody").get("schema")
+        # get the response data_type: array/object/string/number/integer/boolean
+        response_data_type = response_schema.get("type")
 
         # process list data type
         if response_data_type.lower() == "array":
-            response_array_type = (
-                self._api_config.get("responseBody")
-                .get("schema")
-                .get("items")
-                .get("type")
-            )
+            response_items_schema = response_schema.get("items")
+            response_array_type = response_items_schema.get("type")
 
             # if list data consists of objects like response_body: [{data:123},{data:234}]
             if response_array_type.lower() == "object":
-                response_keyname = next(
-                    iter(
-                        self._api_config.get("responseBody")
-                        .get("schema")
-                        .get("items")
-                        .get("properties")
-                        .keys()
-                    )
+                self._response_format = ResponseFormat.ARRAY_OF_OBJECTS
+                self._response_keyname = next(
+                    iter(response_items_schema.get("properties").keys())
                 )
-                response_object_type = (
-                    self._api_config.get("responseBody")
-                    .get("schema")
-                    .get("items")
-                    .get("properties")
-                    .get(response_keyname)
+                response_value_type = (
+                    response_items_schema.get("properties")
+                    .get(self._response_keyname)
                     .get("type")
                 )
-                for response in response_list:
-                    response_body = json.loads(response.text)
-                    for response_body_item in response_body:
-                        data = response_body_item.get(response_keyname)
-                        response_data.append(
-                            self._validate_data_type(data, response_object_type)
-                        )
             elif response_array_type.lower() == "array":
-                response_nested_array_type = (
-                    self._api_config.get("responseBody")
-                    .get("schema")
-                    .get("items")
-                    .get("items")
-                    .get("type")
-                )
-                for response in response_list:
-                    response_body = json.loads(response.text)
-                    for nested_array in response_body:
-                        for data in nested_array:
-                            response_data.append(
-                                self._validate_data_type(
-                                    data, response_nested_array_type
-                                )
-                            )
+                self._response_format = ResponseFormat.ARRAY_OF_ARRAYS
+                response_value_type = response_items_schema.get("items").get("type")
             # if list data consists of primitive data type like response_body: [1, 2, 3]
             else:
-                for response in response_list:
-                    response_body = json.loads(response.text)
-                    for data in response_body:
-                        response_data.append(
-                            self._validate_data_type(data, response_array_type)
-                        )
+                self._response_format = ResponseFormat.ARRAY
+                response_value_type = response_array_type
 
         # process dictionary data type
         elif response_data_type.lower() == "object":
-            response_keyname = next(
-                iter(
-                    self._api_config.get("responseBody")
-                    .get("schema")
-                    .get("properties")
-                    .keys()
-                )
+            self._response_keyname = next(
+                iter(response_schema.get("properties").keys())
             )
-            response_object_type = (
-                self._api_config.get("responseBody")
-                .get("schema")
-                .get("properties")
-                .get(response_keyname)
-                .get("type")
+            response_property_schema = response_schema.get("properties").get(
+                self._response_keyname
             )
+            response_object_type = response_property_schema.get("type")
 
             # if dictionary data consists of list {data: [1,2,3]}
             if response_object_type.lower() == "array":
-                response_array_type = (
-                    self._api_config.get("responseBody")
-                    .get("schema")
-                    .get("properties")
-                    .get(response_keyname)
-                    .get("items")
-                    .get("type")
-                )
-                for response in response_list:
-                    response_body = json.loads(response.text)
-                    response_body_value = response_body.get(response_keyname)
-                    for data in response_body_value:
-                        response_data.append(
-                            self._validate_data_type(data, response_array_type)
-                        )
-
+                self._response_format = ResponseFormat.OBJECT_OF_ARRAY
+                response_value_type = response_property_schema.get("items").get("type")
             # if dictionary data consists of primitive data type: {data: 100}
             else:
-                for response in response_list:
-                    response_body = json.loads(response.text)
-                    data = response_body.get(response_keyname)
-                    response_data.append(
-                        self._validate_data_type(data, response_object_type)
-                    )
+                self._response_format = ResponseFormat.OBJECT
+                response_value_type = response_object_type
 
         # process primitive data types
         else:
-            for response in response_list:
-                data = response.text
-                response_data.append(self._validate_data_type(data, response_data_type))
+            self._response_format = ResponseFormat.PRIMITIVE
+            response_value_type = response_data_type
 
-        end_time = time.time()
-        elapsed_time = end_time - start_time
-        print("time taken: ", elapsed_time)
-        return response_data
+        self._response_type_to_cast = self._get_type_to_cast(response_value_type)
 
-    def _validate_data_type(self, data: Any, data_type: str) -> None:
+    @staticmethod
+    def _get_type_to_cast(data_type: str) -> Callable:
         """
-        A method to make perform validation on the response's data type. The data type should match the data
-        type the user has set before running the algorithm
+        A helper method to return the type to cast the response data to
 
         Args:
-            data (Any): The data to be validated
-            data_type (str): The name of the data type that the data is supposed to be
+            data_type (str): The name of the data type
+
+        Raises:
+            RuntimeError: Exception if the data type is unknown
+
+        Returns:
+            Callable: The type to cast the response data to
         """
         if data_type.lower() == "string":
-            type_to_cast = str
+            return str
         elif data_type.lower() == "number":
-            type_to_cast = float
+            return float
         elif data_type.lower() == "integer":
-            type_to_cast = int
+            return int
         elif data_type.lower() == "boolean":
-            type_to_cast = bool
+            return bool
         else:
             raise RuntimeError("Unknown data type.")
 
-        try:
-            return type_to_cast(data)
-        except (ValueError, TypeError):
-            raise
+    def _get_payload_cache_key(self, payload: Dict) -> str:
+        """
+        A helper method to generate the response cache key of the data payload for this API
+
+        Args:
+            payload (Dict): The data payload of a row
+
+        Returns:
+            str: The response cache key
+        """
+        return hashlib.sha256(
+            (
+                self._api_cache_key + json.dumps(payload, sort_keys=True, default=str)
+            ).encode()
+        ).hexdigest()
+
+    @staticmethod
+    def _create_custom_transport(is_persistent: bool) -> "OpenAPICustomTransport":
+        """
+        A helper method to create the custom transport module with the current request options
+
+        Args:
+            is_persistent (bool): True if the transport keeps its connections open when the client is closed
+
+        Returns:
+            OpenAPICustomTransport: The custom transport module
+        """
+        return OpenAPICustomTransport(
+            verify=Plugin._api_ssl_verify,
+            cert=Plugin._api_ssl_cert,
+            rate_limit=Plugin._api_rate_limit,
+            rate_limit_timeout=Plugin._api_rate_limit_timeout,
+            batch_strategy=Plugin._api_batch_strategy,
+            batch_limit=Plugin._api_batch_limit,
+            max_connections=Plugin._api_max_connections,
+            connection_retries=Plugin._api_connection_retries,
+            response_error_callback=Plugin._notify_response_error,
+            is_persistent=is_persistent,
+            adaptive_connections=is_persistent and Plugin._api_adaptive_connections,
+        )
+
+    def _get_event_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        A helper method to return the persistent event loop of this plugin instance.
+        The event loop runs in a background thread and is created when it is first required.
+
+        Returns:
+            asyncio.AbstractEventLoop: The persistent event loop
+        """
+        with self._event_loop_lock:
+            if self._event_loop is None:
+                self._event_loop = asyncio.new_event_loop()
+                self._event_loop_thread = threading.Thread(
+                    target=self._event_loop.run_forever, daemon=True
+                )
+                self._event_loop_thread.start()
+            return self._event_loop
+
+    def _run_in_event_loop(self, coroutine: Any) -> Any:
+        """
+        A helper method to run the coroutine in the persistent event loop and wait for its result
+
+        Args:
+            coroutine (Any): The coroutine to be run
+
+        Returns:
+            Any: The result of the coroutine
+        """
+        return asyncio.run_coroutine_threadsafe(
+            coroutine, self._get_event_loop()
+        ).result()
 
     def _setup_api_authentication(self) -> None:
         """
@@ -868,10 +1131,200 @@ class Plugin(IModel):
                 "Please provide a positive whole number for Connection Retries;"
             )
 
+        if not isinstance(self._api_adaptive_connections, bool):
+            error_message += "Bool expected for Adaptive Connections;"
+
+        if not isinstance(self._api_response_cache_size, int) or (
+            self._api_response_cache_size < 0
+        ):
+            error_message += (
+                "Please provide a positive whole number for Response Cache Size;"
+            )
+
+        if (
+            not isinstance(self._api_response_cache_timeout, int)
+            and not isinstance(self._api_response_cache_timeout, float)
+        ) or (
+            self._api_response_cache_timeout < 0
+            and self._api_response_cache_timeout != -1
+        ):
+            error_message += "Please provide a positive whole/decimal number in seconds for Response Cache Timeout;"
+
         if error_message != "":
             raise RuntimeError(f"Validation failed for API Connector: {error_message}")
 
 
+class OpenAPIResponseCache:
+    """
+    OpenAPIResponseCache class keeps the response data of the rows sent to the API in memory,
+    so that predicting the same rows again does not send the requests again.
+    The entries are keyed by a hash of the data payload and the API schema and configuration,
+    expire after the timeout and are evicted in least recently used order when the number of entries exceeds the limit.
+    """
+
+    _max_items: int = 0
+    _timeout: float = -1
+    _entries: OrderedDict = OrderedDict()
+    lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def setup(max_items: int, timeout: float) -> None:
+        """
+        A method to set up the response cache
+
+        Args:
+            max_items (int): The maximum number of cached rows. 0 disables the response cache
+            timeout (float): The number of seconds before the cached rows expire. -1 indicates no expiry
+        """
+        with OpenAPIResponseCache.lock:
+            OpenAPIResponseCache._max_items = max_items
+            OpenAPIResponseCache._timeout = timeout
+            if OpenAPIResponseCache._max_items < 1:
+                OpenAPIResponseCache._entries.clear()
+            else:
+                OpenAPIResponseCache._evict_entries()
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """
+        A method to return whether the response cache is enabled
+
+        Returns:
+            bool: True if the response cache is enabled, else False
+        """
+        return OpenAPIResponseCache._max_items > 0
+
+    @staticmethod
+    def get(key: str) -> Union[List, None]:
+        """
+        A method to retrieve the cached response data of the row
+
+        Args:
+            key (str): The response cache key of the row
+
+        Returns:
+            Union[List, None]: The cached response data, or None if the row is not cached or expired
+        """
+        with OpenAPIResponseCache.lock:
+            if key not in OpenAPIResponseCache._entries:
+                return None
+
+            expiry_time, response_data = OpenAPIResponseCache._entries[key]
+            if expiry_time is not None and expiry_time <= time.time():
+                del OpenAPIResponseCache._entries[key]
+                return None
+
+            # Mark this entry as the most recently used
+            OpenAPIResponseCache._entries.move_to_end(key)
+            return response_data
+
+    @staticmethod
+    def put(key: str, response_data: List) -> None:
+        """
+        A method to store the response data of the row
+
+        Args:
+            key (str): The response cache key of the row
+            response_data (List): The response data of the row
+        """
+        with OpenAPIResponseCache.lock:
+            if OpenAPIResponseCache._max_items < 1:
+                return
+
+            if OpenAPIResponseCache._timeout == -1:
+                expiry_time = None
+            else:
+                expiry_time = time.time() + OpenAPIResponseCache._timeout
+            OpenAPIResponseCache._entries[key] = (expiry_time, response_data)
+            OpenAPIResponseCache._entries.move_to_end(key)
+            OpenAPIResponseCache._evict_entries()
+
+    @staticmethod
+    def clear() -> None:
+        """
+        A method to remove all the cached response data
+        """
+        with OpenAPIResponseCache.lock:
+            OpenAPIResponseCache._entries.clear()
+
+    @staticmethod
+    def _evict_entries() -> None:
+        """
+        A helper method to evict the least recently used entries until it is within the limit.
+        The caller is expected to hold the lock.
+        """
+        while len(OpenAPIResponseCache._entries) > OpenAPIResponseCache._max_items:
+            OpenAPIResponseCache._entries.popitem(last=False)
+
+
+class OpenAPIAdaptiveLimiter:
+    """
+    OpenAPIAdaptiveLimiter class adjusts the number of concurrent requests with additive increase and
+    multiplicative decrease (AIMD). The limit grows by one request for every window of responses while the
+    latency stays within the tolerance of the lowest observed latency, and halves when the server responds
+    with a retry status code or fails to respond.
+    """
+
+    _decrease_factor: float = 0.5
+    _latency_tolerance: float = 2.0
+
+    def __init__(self, max_limit: Union[int, None], initial_limit: int = 1):
+        self._max_limit = max_limit
+        self._limit: float = float(initial_limit)
+        self._in_flight: int = 0
+        self._min_latency: Union[float, None] = None
+        self._last_decrease_time: float = 0.0
+        self._condition: Union[asyncio.Condition, None] = None
+
+    def get_limit(self) -> int:
+        """
+        A method to return the current number of concurrent requests allowed
+
+        Returns:
+            int: The number of concurrent requests allowed
+        """
+        return int(self._limit)
+
+    async def acquire(self) -> None:
+        """
+        An async method to wait until the number of requests in flight is below the limit
+        """
+        if self._condition is None:
+            # Create the condition in the running event loop
+            self._condition = asyncio.Condition()
+
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self._limit))
+            self._in_flight += 1
+
+    async def release(
+        self, request_start_time: float, latency: float, is_congested: bool
+    ) -> None:
+        """
+        An async method to release the request slot and adjust the limit with the request outcome
+
+        Args:
+            request_start_time (float): The time the request was sent
+            latency (float): The time taken for the server to respond in seconds
+            is_congested (bool): True if the server is overloaded or failed to respond
+        """
+        async with self._condition:
+            self._in_flight -= 1
+            if is_congested:
+                # Decrease once for the requests sent before the last decrease
+                if request_start_time >= self._last_decrease_time:
+                    self._limit = max(1.0, self._limit * self._decrease_factor)
+                    self._last_decrease_time = time.time()
+            else:
+                if self._min_latency is None or latency < self._min_latency:
+                    self._min_latency = latency
+                if latency <= self._min_latency * self._latency_tolerance:
+                    self._limit += 1.0 / self._limit
+                if self._max_limit is not None:
+                    self._limit = min(self._limit, float(self._max_limit))
+            self._condition.notify_all()
+
+
 class OpenAPICustomTransport(httpx.AsyncHTTPTransport):
     """
     A custom transport module that allows error code retries and backoff timing
@@ -892,6 +1345,8 @@ class OpenAPICustomTransport(httpx.AsyncHTTPTransport):
         max_connections: int,
         connection_retries: int,
         response_error_callback: Callable,
+        is_persistent: bool = False,
+        adaptive_connections: bool = False,
     ):
         # Save the variables
         self._ssl_verify = verify
@@ -903,7 +1358,23 @@ class OpenAPICustomTransport(httpx.AsyncHTTPTransport):
         self._max_connection = max_connections
         self._connection_retries = connection_retries
         self._response_error_callback = response_error_callback
-        self._limit_class = OpenAPICustomLimits(no_of_max_connections=1)
+        self._is_persistent = is_persistent
+        if self._is_persistent:
+            # The connections are shared by all requests. Allow up to the maximum number of connections.
+            self._limit_class = OpenAPICustomLimits(
+                no_of_max_connections=None
+                if self._max_connection == -1
+                else self._max_connection
+            )
+        else:
+            self._limit_class = OpenAPICustomLimits(no_of_max_connections=1)
+        if adaptive_connections:
+            # Adjust the number of concurrent requests up to the maximum number of connections
+            self._adaptive_limiter = OpenAPIAdaptiveLimiter(
+                max_limit=None if self._max_connection == -1 else self._max_connection
+            )
+        else:
+            self._adaptive_limiter = None
 
         # Initialize super class
         super().__init__(
@@ -913,6 +1384,56 @@ class OpenAPICustomTransport(httpx.AsyncHTTPTransport):
             limits=self._limit_class,
         )
 
+    async def aclose(self) -> None:
+        """
+        An async method to close the transport when the client is closed.
+        A persistent transport keeps its connections open, and is closed with close_transport instead.
+        """
+        if not self._is_persistent:
+            await super().aclose()
+
+    async def close_transport(self) -> None:
+        """
+        An async method to close the transport and its connections
+        """
+        await super().aclose()
+
+    def get_adaptive_limiter(self) -> Union[OpenAPIAdaptiveLimiter, None]:
+        """
+        A method to return the adaptive limiter of the transport
+
+        Returns:
+            Union[OpenAPIAdaptiveLimiter, None]: The adaptive limiter, or None if adaptive connections is disabled
+        """
+        return self._adaptive_limiter
+
+    async def send_request_attempt(self, request: httpx.Request) -> httpx.Response:
+        """
+        An async method to send the request to the server once.
+        If adaptive connections is enabled, the request waits for an available concurrent request slot,
+        and its latency and response status code are reported to the adaptive limiter.
+
+        Args:
+            request (httpx.Request): Incoming httpx async request for handling
+
+        Returns:
+            httpx.Response: The response from the server
+        """
+        if self._adaptive_limiter is None:
+            return await super().handle_async_request(request)
+
+        await self._adaptive_limiter.acquire()
+        request_start_time = time.time()
+        is_congested = True
+        try:
+            response = await super().handle_async_request(request)
+            is_congested = response.status_code in self._api_status_code
+            return response
+        finally:
+            await self._adaptive_limiter.release(
+                request_start_time, time.time() - request_start_time, is_congested
+            )
+
     async def handle_attempt_retries(
         self, attempt: int, status_code: Union[None, int]
     ) -> None:
@@ -960,7 +1481,7 @@ class OpenAPICustomTransport(httpx.AsyncHTTPTransport):
 
         for attempt in range(self._connection_retries + 1):
             try:
-                response = await super().handle_async_request(request)
+                response = await self.send_request_attempt(request)
             except httpx.ConnectTimeout as connection_exception:
                 error_message = f"{str(connection_exception)}, connection_exception"
                 await self.handle_attempt_retries(attempt, None)
@@ -1001,7 +1522,7 @@ class OpenAPICustomLimits(httpx.Limits):
 
     def __init__(
         self,
-        no_of_max_connections: int,
+        no_of_max_connections: Union[int, None],
     ):
         # Save the variables
         self._max_connections = no_of_max_connections
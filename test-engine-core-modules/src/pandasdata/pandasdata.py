@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Tuple, Union
 
 from pandas import DataFrame, read_csv
 from test_engine_core.interfaces.iconverter import IConverter
 from test_engine_core.interfaces.idata import IData
+from test_engine_core.plugins.enums.arrow_file_type import ArrowFileType
 from test_engine_core.plugins.enums.data_plugin_type import DataPluginType
 from test_engine_core.plugins.enums.plugin_type import PluginType
 from test_engine_core.plugins.metadata.plugin_metadata import PluginMetadata
@@ -195,7 +196,8 @@ class Plugin(IData, IConverter):
 
     def read_csv_as_df(self, data_path: str, delimiter_char: str) -> Any:
         """
-        A method to read in CSV, with the detected limiter, and converts the data into Pandas DataFrame
+        A method to read in CSV, with the detected limiter, and converts the data into Pandas DataFrame.
+        The file is memory-mapped and parsed once directly into the DataFrame.
 
         Args:
             data_path (str): The path of the CSV file
@@ -205,12 +207,51 @@ class Plugin(IData, IConverter):
         """
         if not is_empty_string(data_path) and not is_empty_string(delimiter_char):
             try:
-                df = read_csv(data_path, sep=delimiter_char)
+                df = read_csv(data_path, sep=delimiter_char, memory_map=True)
                 return df
             except Exception:
                 return None
         return None
 
+    def read_arrow_as_df(
+        self,
+        data_path: str,
+        file_type: ArrowFileType,
+        columns: Union[List, None] = None,
+    ) -> Any:
+        """
+        A method to read in columnar files (parquet, feather, arrow) and converts the data into Pandas DataFrame.
+        The file is memory-mapped and only the requested columns are read.
+
+        Args:
+            data_path (str): The path of the columnar file
+            file_type (ArrowFileType): The file type detected prior to calling this method by ArrowMetadata
+            columns (Union[List, None], optional): The columns to be read. Defaults to None, which reads all the columns
+        Returns:
+            Any: The columnar data in a Pandas DataFrame
+        """
+        if (
+            not is_empty_string(data_path)
+            and isinstance(file_type, ArrowFileType)
+            and (columns is None or isinstance(columns, list))
+        ):
+            try:
+                # pyarrow is only required when reading columnar files
+                from pyarrow import feather, parquet
+
+                if file_type is ArrowFileType.PARQUET:
+                    table = parquet.read_table(
+                        data_path, columns=columns, memory_map=True
+                    )
+                else:
+                    table = feather.read_table(
+                        data_path, columns=columns, memory_map=True
+                    )
+                return table.to_pandas()
+            except Exception:
+                return None
+        return None
+
     def read_image_as_df(self, image_paths: List, column_name: str) -> Any:
         """
         A method to read in image file information, converts the data into Pandas DataFrame.
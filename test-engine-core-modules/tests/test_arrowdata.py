@@ -0,0 +1,111 @@
+import pytest
+from test_engine_core.plugins.enums.arrow_file_type import ArrowFileType
+from test_engine_core.plugins.enums.data_plugin_type import DataPluginType
+from test_engine_core.plugins.enums.plugin_type import PluginType
+from test_engine_core.plugins.metadata.arrow_metadata import ArrowMetadata
+
+from src.arrowdata.arrowdata import Plugin
+
+
+class TestCollectionArrowData:
+    pytest.data = ArrowMetadata(
+        {"Name": "string", "Age": "int64", "Gender": "string"},
+        3,
+        ArrowFileType.PARQUET,
+        "/home/ubuntu/data.parquet",
+    )
+
+    @pytest.mark.parametrize(
+        "expected_name, expected_description, expected_version",
+        [
+            (
+                "arrowdata",
+                "arrowdata supports columnar data in parquet, feather and arrow files",
+                "0.9.0",
+            ),
+        ],
+    )
+    def test_get_metadata(self, expected_name, expected_description, expected_version):
+        metadata = Plugin.get_metadata()
+        assert metadata.name == expected_name
+        assert metadata.description == expected_description
+        assert metadata.version == expected_version
+
+    def test_get_plugin_type(self):
+        assert Plugin.get_plugin_type() is PluginType.DATA
+        assert Plugin.get_data_plugin_type() is DataPluginType.ARROW
+
+    @pytest.mark.parametrize(
+        "data, expected_supported, expected_file_type, expected_labels, expected_shape, expected_dict",
+        [
+            (
+                pytest.data,
+                True,
+                ArrowFileType.PARQUET,
+                {"Name": "string", "Age": "int64", "Gender": "string"},
+                (3, 3),
+                {
+                    "data_path": "/home/ubuntu/data.parquet",
+                    "file_type": ArrowFileType.PARQUET,
+                },
+            ),
+            (
+                None,
+                False,
+                None,
+                {},
+                None,
+                {},
+            ),
+            (
+                "None",
+                False,
+                None,
+                {},
+                None,
+                {},
+            ),
+            (
+                [],
+                False,
+                None,
+                {},
+                None,
+                {},
+            ),
+            (
+                {},
+                False,
+                None,
+                {},
+                None,
+                {},
+            ),
+        ],
+    )
+    def test_init(
+        self,
+        data,
+        expected_supported,
+        expected_file_type,
+        expected_labels,
+        expected_shape,
+        expected_dict,
+    ):
+        new_plugin = Plugin(data=data)
+        assert new_plugin.is_supported() is expected_supported
+        assert new_plugin.get_file_type() == expected_file_type
+        assert new_plugin.read_labels() == expected_labels
+        assert new_plugin.get_shape() == expected_shape
+        assert new_plugin.convert_to_dict() == expected_dict
+
+    def test_set_data(self):
+        new_plugin = Plugin()
+        assert new_plugin.get_data() is None
+
+        new_plugin.set_data(pytest.data)
+        assert new_plugin.get_data() is pytest.data
+
+        # Invalid data does not replace the current data
+        new_plugin.set_data("None")
+        assert new_plugin.get_data() is pytest.data
@@ -0,0 +1,83 @@
+import pytest
+from test_engine_core.plugins.enums.arrow_file_type import ArrowFileType
+from test_engine_core.plugins.enums.plugin_type import PluginType
+from test_engine_core.plugins.enums.serializer_plugin_type import SerializerPluginType
+
+from src.arrowserializer.arrowserializer import Plugin
+
+
+class TestCollectionArrowSerializer:
+    @pytest.mark.parametrize(
+        "expected_name, expected_description, expected_version",
+        [
+            (
+                "arrowserializer",
+                "arrowserializer supports reading columnar data in parquet, feather and arrow files",
+                "0.9.0",
+            ),
+        ],
+    )
+    def test_get_metadata(self, expected_name, expected_description, expected_version):
+        metadata = Plugin.get_metadata()
+        assert metadata.name == expected_name
+        assert metadata.description == expected_description
+        assert metadata.version == expected_version
+
+    @pytest.mark.parametrize(
+        "expected_output",
+        [
+            (PluginType.SERIALIZER),
+        ],
+    )
+    def test_get_plugin_type(self, expected_output):
+        assert Plugin.get_plugin_type() is expected_output
+
+    @pytest.mark.parametrize(
+        "data_path, expected_file_type",
+        [
+            (
+                "src/arrowserializer/user_defined_files/sample.parquet",
+                ArrowFileType.PARQUET,
+            ),
+            (
+                "src/arrowserializer/user_defined_files/sample.feather",
+                ArrowFileType.ARROW,
+            ),
+        ],
+    )
+    def test_deserialize_data(self, data_path, expected_file_type):
+        output = Plugin.deserialize_data(data_path)
+        assert output.get_schema() == {
+            "Name": "string",
+            "Age": "int64",
+            "Gender": "string",
+        }
+        assert output.get_num_rows() == 3
+        assert output.get_file_type() is expected_file_type
+        assert output.get_data_path() == data_path
+
+    @pytest.mark.parametrize(
+        "data_path, expected_error_message",
+        [
+            ("1234.parquet", "[Errno 2] No such file or directory: '1234.parquet'"),
+            (
+                "src/delimiterdata/user_defined_files/sv_comma.txt",
+                "The file type is not supported.",
+            ),
+            (None, "expected str, bytes or os.PathLike object, not NoneType"),
+            ({}, "expected str, bytes or os.PathLike object, not dict"),
+        ],
+    )
+    def test_deserialize_data_with_exception(self, data_path, expected_error_message):
+        with pytest.raises(Exception) as exc_info:
+            Plugin.deserialize_data(data_path)
+        assert str(exc_info.value) == expected_error_message
+
+    @pytest.mark.parametrize(
+        "expected_output",
+        [
+            (SerializerPluginType.ARROW),
+        ],
+    )
+    def test_get_serializer_plugin_type(self, expected_output):
+        assert Plugin.get_serializer_plugin_type() is expected_output
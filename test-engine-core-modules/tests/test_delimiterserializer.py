@@ -57,6 +57,33 @@ class TestCollectionDelimiterSerializer:
             assert output.get_delimiter_type() == expected_output.get_delimiter_type()
             assert output.get_data_path() == expected_output.get_data_path()
 
+    @pytest.mark.parametrize(
+        "delimiter_char, expected_delimiter_type",
+        [
+            (",", DelimiterType.COMMA),
+            (":", DelimiterType.COLON),
+            ("|", DelimiterType.PIPE),
+            ("\t", DelimiterType.TAB),
+        ],
+    )
+    def test_deserialize_data_reads_head_sample(self, tmp_path, delimiter_char, expected_delimiter_type):
+        data_path = str(tmp_path / "large_file.txt")
+        header = delimiter_char.join(["Name", "Age", "Gender"])
+        row = delimiter_char.join(["Alex", "30", "M"])
+        with open(data_path, "w") as text_file:
+            text_file.write("\n".join([header] + [row] * 20000))
+
+        output = Plugin.deserialize_data(data_path)
+        assert output.get_delimiter_char() == delimiter_char
+        assert output.get_delimiter_type() == expected_delimiter_type
+        assert output.get_data_path() == data_path
+
+        # Only the complete lines in the head sample are read
+        list_data = output.get_data()
+        assert list_data[0] == ["Name", "Age", "Gender"]
+        assert 1 < len(list_data) < 20001
+        assert all(item == ["Alex", "30", "M"] for item in list_data[1:])
+
     @pytest.mark.parametrize(
         "data_path, expected_error_message",
         [
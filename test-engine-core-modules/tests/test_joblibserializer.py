@@ -1,3 +1,7 @@
+import pickle
+
+import joblib
+import numpy as np
 import pytest
 from test_engine_core.plugins.enums.plugin_type import PluginType
 from test_engine_core.plugins.enums.serializer_plugin_type import SerializerPluginType
@@ -46,6 +50,64 @@ class TestCollectionJoblibSerializer:
         output = Plugin.deserialize_data(data_path)
         assert output == expected_output
 
+    def test_deserialize_data_with_mmap(self, tmp_path):
+        data_path = str(tmp_path / "array.sav")
+        joblib.dump(np.arange(10), data_path)
+
+        output = Plugin.deserialize_data(data_path)
+        assert isinstance(output, np.memmap)
+        assert output.tolist() == list(range(10))
+
+        # In-place changes are not written back to the file
+        output += 1
+        assert Plugin.deserialize_data(data_path).tolist() == list(range(10))
+
+    def test_deserialize_data_with_compressed_file(self, tmp_path):
+        data_path = str(tmp_path / "array.sav")
+        joblib.dump(np.arange(10), data_path, compress=3)
+
+        output = Plugin.deserialize_data(data_path)
+        assert not isinstance(output, np.memmap)
+        assert output.tolist() == list(range(10))
+
+    @pytest.mark.parametrize(
+        "compress",
+        [
+            (
+                    0
+            ),
+            (
+                    3
+            ),
+            (
+                    None
+            ),
+        ],
+    )
+    def test_convert_to_mmap_file(self, tmp_path, compress):
+        data_path = str(tmp_path / "array.sav")
+        if compress is None:
+            with open(data_path, "wb") as data_file:
+                pickle.dump(np.arange(10), data_file)
+        else:
+            joblib.dump(np.arange(10), data_path, compress=compress)
+
+        output_path = Plugin.convert_to_mmap_file(data_path, str(tmp_path / "mmap.sav"))
+        assert output_path == str(tmp_path / "mmap.sav")
+        output = Plugin.deserialize_data(output_path)
+        assert isinstance(output, np.memmap)
+        assert output.tolist() == list(range(10))
+
+        # Replaces the data path by default
+        assert Plugin.convert_to_mmap_file(data_path) == data_path
+        assert isinstance(Plugin.deserialize_data(data_path), np.memmap)
+        assert sorted(tmp_path.iterdir()) == [tmp_path / "array.sav", tmp_path / "mmap.sav"]
+
+    def test_convert_to_mmap_file_with_exception(self):
+        with pytest.raises(Exception) as exc_info:
+            Plugin.convert_to_mmap_file("1234.csv")
+        assert str(exc_info.value) == "[Errno 2] No such file or directory: '1234.csv'"
+
     @pytest.mark.parametrize(
         "data_path, expected_error_message",
         [
@@ -2,6 +2,7 @@ from logging import Logger
 from typing import Any, Dict, List
 
 from test_engine_core.interfaces.idata import IData
+from test_engine_core.plugins.enums.arrow_file_type import ArrowFileType
 from test_engine_core.plugins.enums.data_plugin_type import DataPluginType
 from test_engine_core.utils.validate_checks import is_empty_string
 
@@ -56,9 +57,46 @@ class DataConverter:
             return DataConverter._convert_delimiter_dict_to_dataframe(
                 data_dict, pandas_instance
             )
+        elif plugin_type is DataPluginType.ARROW:
+            return DataConverter._convert_arrow_dict_to_dataframe(
+                data_dict, pandas_instance
+            )
         else:
             return None
 
+    @staticmethod
+    def _convert_arrow_dict_to_dataframe(
+        data_dict: Dict, pandas_instance: IData
+    ) -> Any:
+        """
+        A helper method to convert a dictionary generated from ArrowData to pandas DataFrame
+
+        Args:
+            data_dict (Dict): The data returned from ArrowData. It should contain the data path of the columnar file,
+            the file type and optionally the columns to be read
+            pandas_instance (Any): The pandas instance created, so we can call pandas methods
+            without importing pandas in test-engine-core
+
+        Returns:
+            pandas.DataFrame (Any): the DataFrame of converted data_dict
+        """
+        data_path = data_dict.get("data_path")
+        file_type = data_dict.get("file_type")
+        columns = data_dict.get("columns")
+
+        if (
+            data_path is None
+            or is_empty_string(data_path)
+            or file_type is None
+            or not isinstance(file_type, ArrowFileType)
+            or not (columns is None or isinstance(columns, list))
+        ):
+            return None
+
+        else:
+            df = pandas_instance.read_arrow_as_df(data_path, file_type, columns)
+            return df
+
     @staticmethod
     def _convert_delimiter_dict_to_dataframe(
         data_dict: Dict, pandas_instance: IData
@@ -1,5 +1,7 @@
 from abc import abstractmethod
-from typing import Any, List
+from typing import Any, List, Union
+
+from test_engine_core.plugins.enums.arrow_file_type import ArrowFileType
 
 
 class IConverter:
@@ -12,6 +14,16 @@ class IConverter:
     def read_csv_as_df(self, data_path: str, delimiter_type: str) -> Any:
         pass
 
+    @staticmethod
+    @abstractmethod
+    def read_arrow_as_df(
+        self,
+        data_path: str,
+        file_type: ArrowFileType,
+        columns: Union[List, None] = None,
+    ) -> Any:
+        pass
+
     @staticmethod
     @abstractmethod
     def read_image_as_df(self, image_paths: List, column_name: str) -> Any:
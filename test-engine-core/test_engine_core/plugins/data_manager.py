@@ -7,7 +7,12 @@ from test_engine_core.converters.data_converter import DataConverter
 from test_engine_core.interfaces.idata import IData
 from test_engine_core.interfaces.iserializer import ISerializer
 from test_engine_core.plugins.enums.data_plugin_type import DataPluginType
+from test_engine_core.utils.format_sniffer import (
+    sniff_serializer_plugin_types,
+    sort_plugins_by_sub_types,
+)
 from test_engine_core.utils.log_utils import log_message
+from test_engine_core.utils.shared_data import SharedData
 
 
 class DataManager:
@@ -33,7 +38,10 @@ class DataManager:
 
     @staticmethod
     def read_data(
-        data_path: str, data_plugins: Dict, serializer_plugins: Dict
+        data_path: str,
+        data_plugins: Dict,
+        serializer_plugins: Dict,
+        columns: Union[List, None] = None,
     ) -> Tuple[bool, Union[IData, None], Union[ISerializer, None], str]:
         """
         A method to read the data file/folder path and return a list of tuple consisting of
@@ -44,6 +52,8 @@ class DataManager:
             data_path (str): The data file/folder path
             data_plugins (Dict): A dictionary of supported data plugins
             serializer_plugins (Dict): A dictionary of supported serializer plugins
+            columns (Union[List, None], optional): The columns to be read from columnar data files.
+            Defaults to None, which reads all the columns
 
         Returns:
             Tuple[bool, Union[IData, None], Union[ISerializer, None], str]:
@@ -65,6 +75,7 @@ class DataManager:
             or not isinstance(data_plugins, dict)
             or serializer_plugins is None
             or not isinstance(serializer_plugins, dict)
+            or not (columns is None or isinstance(columns, list))
         ):
             error_message = (
                 f"There was an error validating the input parameters: {data_path}, "
@@ -80,6 +91,23 @@ class DataManager:
         else:
             log_message(DataManager._logger, logging.INFO, "Data validation successful")
 
+        # Map the data from shared memory if it has been read by another process on this node
+        shared_data_key = SharedData.get_key(data_path, columns)
+        (
+            is_success,
+            return_data_instance,
+            return_data_serializer_instance,
+        ) = DataManager._attach_shared_data(
+            shared_data_key, data_plugins, serializer_plugins
+        )
+        if is_success:
+            log_message(
+                DataManager._logger,
+                logging.INFO,
+                f"Mapped the data from shared memory: {data_path}",
+            )
+            return True, return_data_instance, return_data_serializer_instance, ""
+
         # Perform deserialization and identification for each found paths
         data_serializer_instances = list()
         found_paths = DataManager._get_file_paths(data_path)
@@ -174,7 +202,9 @@ class DataManager:
                 is_success,
                 return_data_instance,
                 error_message,
-            ) = DataManager._convert_to_pandas(return_data_instance, data_plugins)
+            ) = DataManager._convert_to_pandas(
+                return_data_instance, data_plugins, columns
+            )
 
         # Log if there is return_data_instance found
         if return_data_instance:
@@ -184,6 +214,20 @@ class DataManager:
                 f"Supported data format: {return_data_instance.get_data_plugin_type()}"
                 f"[{return_data_serializer_instance.get_serializer_plugin_type()}]",
             )
+
+            # Place the data in shared memory for the other processes on this node
+            if SharedData.publish(
+                shared_data_key,
+                return_data_instance.get_data(),
+                {
+                    "serializer_plugin_type": return_data_serializer_instance.get_serializer_plugin_type().name
+                },
+            ):
+                log_message(
+                    DataManager._logger,
+                    logging.INFO,
+                    f"Placed the data in shared memory: {data_path}",
+                )
             return True, return_data_instance, return_data_serializer_instance, ""
         else:
             log_message(
@@ -198,6 +242,49 @@ class DataManager:
                 f"There was an error getting data instance (unsupported format): {found_paths}",
             )
 
+    @staticmethod
+    def _attach_shared_data(
+        shared_data_key: Union[str, None], data_plugins: Dict, serializer_plugins: Dict
+    ) -> Tuple[bool, Union[IData, None], Union[ISerializer, None]]:
+        """
+        A helper method to map the data from shared memory and return the data and serializer instance
+
+        Args:
+            shared_data_key (Union[str, None]): The key of the data in shared memory
+            data_plugins (Dict): A dictionary of supported data plugins
+            serializer_plugins (Dict): A dictionary of supported serializer plugins
+
+        Returns:
+            Tuple[bool, Union[IData, None], Union[ISerializer, None]]:
+            Returns a tuple consisting of bool that indicates if it succeeds,
+            If it succeeds, it will contain an object of IData, and an object of ISerializer
+            If the data is not in shared memory, it will contain None objects
+        """
+        shared_data = SharedData.attach(shared_data_key)
+        if shared_data is None:
+            return False, None, None
+
+        data, metadata = shared_data
+        for _, serializer_plugin in serializer_plugins.items():
+            try:
+                serializer = serializer_plugin.Plugin
+                if serializer.get_serializer_plugin_type().name == metadata.get(
+                    "serializer_plugin_type"
+                ):
+                    break
+            except Exception:
+                continue
+        else:
+            return False, None, None
+
+        is_success, data_instance = DataManager._try_to_identify_data_format(
+            data_plugins, **{"data": data}
+        )
+        if is_success:
+            return True, data_instance, serializer
+        else:
+            return False, None, None
+
     @staticmethod
     def _consolidate_image_paths_to_df(
         found_paths: List, data_plugins: Dict
@@ -237,7 +324,7 @@ class DataManager:
 
     @staticmethod
     def _convert_to_pandas(
-        data_instance: IData, data_plugins: Dict
+        data_instance: IData, data_plugins: Dict, columns: Union[List, None] = None
     ) -> Tuple[bool, Union[IData, None], str]:
         """
         A helper method to create a dataframe file by converting some other non-pandas datatype to pandas.
@@ -245,6 +332,8 @@ class DataManager:
         Args:
             data_instance (IData): An instance of IData
             data_plugins (Dict): A dictionary of supported data plugins
+            columns (Union[List, None], optional): The columns to be read from columnar data files.
+            Defaults to None, which reads all the columns
 
         Returns:
             Tuple[bool, Union[IData, None], str]:
@@ -258,6 +347,8 @@ class DataManager:
         if pandas_data_plugin:
             pandas_data_instance = pandas_data_plugin.Plugin()
             data_dict = data_instance.convert_to_dict()
+            if columns is not None:
+                data_dict["columns"] = columns
             df_data = DataConverter.convert_dict_to_dataframe(
                 data_dict, data_instance.get_data_plugin_type(), pandas_data_instance
             )
@@ -334,6 +425,13 @@ class DataManager:
         data = None
         serializer = None
 
+        # Try the serializers identified from the file signature first, and the other serializers as a fallback
+        serializer_plugins = sort_plugins_by_sub_types(
+            serializer_plugins,
+            sniff_serializer_plugin_types(data_file),
+            "get_serializer_plugin_type",
+        )
+
         # Scan through all the supported serializer
         # Check that this data is one of the supported data formats and can be deserialized
         for (
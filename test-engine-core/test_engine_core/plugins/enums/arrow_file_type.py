@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class ArrowFileType(Enum):
+    """
+    The ArrowFileType enum class specifies the different columnar file formats the tool supports
+    """
+
+    PARQUET = 1
+    ARROW = 2  # Arrow IPC file format, which is also the Feather (V2) file format
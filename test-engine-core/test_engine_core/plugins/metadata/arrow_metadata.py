@@ -0,0 +1,70 @@
+from typing import Dict, Union
+
+from test_engine_core.plugins.enums.arrow_file_type import ArrowFileType
+from test_engine_core.utils.validate_checks import is_empty_string
+
+
+class ArrowMetadata:
+    """
+    The ArrowMetadata class comprises information on columnar data files (Parquet, Feather, Arrow IPC)
+    """
+
+    _schema: Dict = dict()
+    _num_rows: int = 0
+    _file_type: Union[ArrowFileType, None] = None
+    _file_path: str = ""
+
+    def __init__(
+        self,
+        schema: Dict,
+        num_rows: int,
+        file_type: ArrowFileType,
+        file_path: str = "",
+    ):
+        if schema is not None and isinstance(schema, dict):
+            self._schema = schema
+
+        if num_rows is not None and isinstance(num_rows, int) and num_rows >= 0:
+            self._num_rows = num_rows
+
+        if file_type is not None and isinstance(file_type, ArrowFileType):
+            self._file_type = file_type
+
+        if not is_empty_string(file_path) and isinstance(file_path, str):
+            self._file_path = file_path
+
+    def get_schema(self) -> Dict:
+        """
+        A method to return the schema of the file
+
+        Returns:
+            Dict: the dictionary of key-value pairs for column name - column datatype
+        """
+        return self._schema
+
+    def get_num_rows(self) -> int:
+        """
+        A method to return the number of rows in the file
+
+        Returns:
+            int: the number of rows
+        """
+        return self._num_rows
+
+    def get_file_type(self) -> Union[ArrowFileType, None]:
+        """
+        A method to return the columnar file type
+
+        Returns:
+            Union[ArrowFileType, None]: the columnar file type of the file
+        """
+        return self._file_type
+
+    def get_data_path(self) -> str:
+        """
+        A method to return the file path of the columnar file
+
+        Returns:
+            str: the columnar file path
+        """
+        return self._file_path
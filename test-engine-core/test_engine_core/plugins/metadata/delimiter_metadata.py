@@ -39,7 +39,7 @@ class DelimiterMetadata:
         A method to return data value
 
         Returns:
-             Any: the delimited data that is read from the file
+             Any: the delimited data that is read from the head of the file to detect the delimiter
         """
         return self._data
 
@@ -3,6 +3,11 @@ from typing import Any, Dict, Tuple, Union
 
 from test_engine_core.interfaces.imodel import IModel
 from test_engine_core.interfaces.iserializer import ISerializer
+from test_engine_core.utils.format_sniffer import (
+    sniff_model_plugin_types,
+    sniff_serializer_plugin_types,
+    sort_plugins_by_sub_types,
+)
 from test_engine_core.utils.log_utils import log_message
 
 
@@ -86,7 +91,12 @@ class ModelManager:
             "Attempting to identify model format with api schema",
         )
         is_success, return_model_instance = ModelManager._try_to_identify_model_format(
-            model_plugins, **{"api_schema": api_schema, "api_config": api_config}
+            model_plugins,
+            **{
+                "api_schema": api_schema,
+                "api_config": api_config,
+                "logger": ModelManager._logger,
+            },
         )
         if is_success:
             error_message = ""
@@ -194,8 +204,12 @@ class ModelManager:
             logging.INFO,
             f"Attempting to identify model format: {type(model)}",
         )
+        # Try the model plugins identified from the package of the model first
         is_success, return_model_instance = ModelManager._try_to_identify_model_format(
-            model_plugins, **{"model": model}
+            sort_plugins_by_sub_types(
+                model_plugins, sniff_model_plugin_types(model), "get_model_plugin_type"
+            ),
+            **{"model": model},
         )
         if is_success:
             error_message = ""
@@ -241,6 +255,13 @@ class ModelManager:
         model = None
         serializer = None
 
+        # Try the serializers identified from the file signature first, and the other serializers as a fallback
+        serializer_plugins = sort_plugins_by_sub_types(
+            serializer_plugins,
+            sniff_serializer_plugin_types(model_file),
+            "get_serializer_plugin_type",
+        )
+
         # Scan through all the supported serializer
         # Check that this model is one of the supported model formats and can be deserialized
         for (
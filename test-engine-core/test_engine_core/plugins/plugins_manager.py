@@ -1,10 +1,13 @@
 import glob
+import json
+import os
 import re
 import sys
 from logging import Logger
 from multiprocessing import Lock
 from pathlib import Path
-from typing import Dict, List, Tuple, Union
+from types import ModuleType
+from typing import Any, Dict, List, Tuple, Union
 
 from test_engine_core.interfaces.ialgorithm import IAlgorithm
 from test_engine_core.interfaces.idata import IData
@@ -23,8 +26,10 @@ from test_engine_core.plugins.enums.serializer_plugin_type import SerializerPlug
 from test_engine_core.plugins.model_manager import ModelManager
 from test_engine_core.plugins.pipeline_manager import PipelineManager
 from test_engine_core.utils.import_modules import (
+    LazyModule,
     create_module_spec,
     import_module_from_spec,
+    register_module,
 )
 from test_engine_core.utils.validate_checks import is_empty_string
 
@@ -40,6 +45,7 @@ class PluginManager:
         DataPluginType.PANDAS,
         DataPluginType.IMAGE,
         DataPluginType.DELIMITER,
+        DataPluginType.ARROW,
     ]
     _model_priority_list: List = [
         ModelPluginType.LIGHTGBM,
@@ -52,13 +58,16 @@ class PluginManager:
         SerializerPluginType.PICKLE,
         SerializerPluginType.JOBLIB,
         SerializerPluginType.TENSORFLOW,
+        SerializerPluginType.ARROW,
         SerializerPluginType.IMAGE,
         SerializerPluginType.DELIMITER,
     ]
     _pipeline_priority_list: List = [PipelinePluginType.SKLEARN]
     _plugins: Dict = {plugin_type.name: dict() for plugin_type in PluginType}
+    _discovery_index: Dict = dict()
     lock: Lock = Lock()
     plugin_name: str = "Plugin"
+    index_file_name: str = ".plugin_index.json"
 
     @staticmethod
     def set_logger(logger: Logger) -> None:
@@ -81,7 +90,10 @@ class PluginManager:
         discover_folder: str = str(Path().absolute() / "plugins"), tag_name: str = None
     ) -> None:
         """
-        A method to discover possible plugins in the Discover folder indicated during setup phase
+        A method to discover possible plugins in the Discover folder indicated during setup phase.
+        The plugin types of the python files are stored in an index file in the Discover folder with the file
+        modification times, so that only new or modified files are imported to identify the plugins.
+        The plugins are stored as lazy modules, which are only imported when the plugins are used.
 
         Args:
             discover_folder (str, optional): A path to discover new plugins.
@@ -96,43 +108,63 @@ class PluginManager:
             file for file in glob.glob(f"{discover_folder}/**/*.py", recursive=True)
         ]
 
+        # Read the index of the python files in the given folder
+        index_file_path = str(Path(discover_folder) / PluginManager.index_file_name)
+        discovery_index = PluginManager._read_discovery_index(index_file_path)
+        is_index_updated = False
+
         # Search through the discovered paths and create modules
         plugin_modules = dict()
         for plugin_path in discover_paths:
-            # Add the plugin folder in case it uses relative path
-            plugin_folder_path = str(Path(plugin_path).parent)
-            sys.path.append(plugin_folder_path)
+            # Remove files that have underscores (__filename__.py)
+            module_name = re.sub("\\.py$", "", Path(plugin_path).name)
+            if module_name.__contains__("__"):
+                continue
 
             try:
-                # Remove files that have underscores (__filename__.py)
-                module_name = re.sub("\\.py$", "", Path(plugin_path).name)
-                if module_name.__contains__("__"):
+                index_key = PluginManager._get_index_key(plugin_path)
+                modified_time = os.stat(plugin_path).st_mtime_ns
+            except OSError:
+                continue  # Unable to read this py file; Continue next file
+
+            # Import the module to identify the plugin if the file is new or modified
+            module = None
+            index_entry = discovery_index.get(index_key)
+            if (
+                index_entry is None
+                or index_entry.get("mtime") != modified_time
+                or index_entry.get("module_name") != module_name
+            ):
+                index_entry, module = PluginManager._index_module(
+                    module_name, plugin_path, modified_time
+                )
+                if index_entry is None:
+                    # Encountered an error while processing this py file; Retry at the next discovery
+                    discovery_index.pop(index_key, None)
                     continue
+                discovery_index[index_key] = index_entry
+                is_index_updated = True
+
+            if index_entry.get("plugin_type") is None:
+                continue  # Unexpected module or Invalid plugin type
+
+            # Store the lazy modules in the dict
+            lazy_module = LazyModule(
+                module_name,
+                plugin_path,
+                module,
+                plugin_sub_type=index_entry.get("plugin_sub_type"),
+            )
+            if tag_name:
+                plugin_modules.update({tag_name: lazy_module})
+            else:
+                plugin_modules.update({module_name: lazy_module})
 
-                # Import module with the module specification
-                # Store modules in the dict
-                module_spec = create_module_spec(module_name, plugin_path)
-                if not module_spec:
-                    continue  # module spec is None
-
-                module = import_module_from_spec(module_spec)
-                if (
-                    PluginManager.plugin_name in dir(module)
-                    and module.Plugin.get_plugin_type() in PluginType
-                ):
-                    if tag_name:
-                        plugin_modules.update({tag_name: module})
-                    else:
-                        plugin_modules.update({module_name: module})
-                else:
-                    pass  # Unexpected module or Invalid plugin type
-
-            except Exception:
-                pass  # Encountered an error while processing this py file; Continue next file
-
-            finally:
-                # Remove the plugin folder from sys search path
-                sys.path.remove(plugin_folder_path)
+        # Update the index of the python files
+        with PluginManager.lock:
+            PluginManager._discovery_index.update(discovery_index)
+        if is_index_updated:
+            PluginManager._write_discovery_index(index_file_path, discovery_index)
 
         # Update list of plugin modules
         PluginManager._update_plugin_modules(plugin_modules)
@@ -240,6 +272,7 @@ class PluginManager:
         """
         # Pass the information to DataManager to process and return the detected data instance
         filename = arguments.get("filename", "")
+        columns = arguments.get("columns", None)
         (
             is_success,
             data_instance,
@@ -249,6 +282,7 @@ class PluginManager:
             filename,
             PluginManager._get_plugins_by_type(PluginType.DATA),
             PluginManager._get_plugins_by_type(PluginType.SERIALIZER),
+            columns,
         )
 
         if is_success:
@@ -438,26 +472,26 @@ class PluginManager:
         Returns:
             int : The order of this plugin with reference to the priority listing
         """
-        plugin_type = plugin_tuple[1].Plugin.get_plugin_type()
+        plugin_type, plugin_sub_type = PluginManager._get_plugin_types(plugin_tuple[1])
 
         if plugin_type is PluginType.DATA:
             return PluginManager._data_priority_list.index(
-                plugin_tuple[1].Plugin.get_data_plugin_type()
+                DataPluginType[plugin_sub_type]
             )
 
         elif plugin_type is PluginType.MODEL:
             return PluginManager._model_priority_list.index(
-                plugin_tuple[1].Plugin.get_model_plugin_type()
+                ModelPluginType[plugin_sub_type]
             )
 
         elif plugin_type is PluginType.PIPELINE:
             return PluginManager._pipeline_priority_list.index(
-                plugin_tuple[1].Plugin.get_pipeline_plugin_type()
+                PipelinePluginType[plugin_sub_type]
             )
 
         elif plugin_type is PluginType.SERIALIZER:
             return PluginManager._serializer_priority_list.index(
-                plugin_tuple[1].Plugin.get_serializer_plugin_type()
+                SerializerPluginType[plugin_sub_type]
             )
 
         else:
@@ -465,6 +499,174 @@ class PluginManager:
                 PluginManager._plugins[PluginType.ALGORITHM.name].values()
             ).index(plugin_tuple[1])
 
+    @staticmethod
+    def _get_plugin_types(
+        module: Union[LazyModule, ModuleType]
+    ) -> Tuple[PluginType, Union[str, None]]:
+        """
+        A helper method to get the plugin type and the plugin sub type name (e.g. PANDAS) of the plugin module.
+        The types are read from the discovery index, and the module is only imported if it is not indexed
+
+        Args:
+            module (Union[LazyModule, ModuleType]): The plugin module
+
+        Returns:
+            Tuple[PluginType, Union[str, None]]: The plugin type and the plugin sub type name
+        """
+        # Not locked as it is called while sorting the stored plugins with the lock held
+        index_entry = PluginManager._discovery_index.get(
+            PluginManager._get_index_key(module.__file__)
+        )
+
+        if index_entry and index_entry.get("plugin_type"):
+            return (
+                PluginType[index_entry.get("plugin_type")],
+                index_entry.get("plugin_sub_type"),
+            )
+        else:
+            return module.Plugin.get_plugin_type(), PluginManager._get_plugin_sub_type(
+                module.Plugin
+            )
+
+    @staticmethod
+    def _get_plugin_sub_type(plugin: Any) -> Union[str, None]:
+        """
+        A helper method to get the plugin sub type name of the plugin (e.g. PANDAS for data plugins)
+
+        Args:
+            plugin (Any): The Plugin class of the module
+
+        Returns:
+            Union[str, None]: The plugin sub type name, or None for algorithm plugins
+        """
+        plugin_type = plugin.get_plugin_type()
+
+        if plugin_type is PluginType.DATA:
+            return plugin.get_data_plugin_type().name
+
+        elif plugin_type is PluginType.MODEL:
+            return plugin.get_model_plugin_type().name
+
+        elif plugin_type is PluginType.PIPELINE:
+            return plugin.get_pipeline_plugin_type().name
+
+        elif plugin_type is PluginType.SERIALIZER:
+            return plugin.get_serializer_plugin_type().name
+
+        else:
+            return None
+
+    @staticmethod
+    def _index_module(
+        module_name: str, plugin_path: str, modified_time: int
+    ) -> Tuple[Union[Dict, None], Union[ModuleType, None]]:
+        """
+        A helper method to import the python file and create the index entry of its plugin type
+
+        Args:
+            module_name (str): The module name
+            plugin_path (str): The python file path
+            modified_time (int): The modification time of the python file in nanoseconds
+
+        Returns:
+            Tuple[Union[Dict, None], Union[ModuleType, None]]:
+            Returns the index entry and the imported module. The plugin type in the index entry is None
+            if the module is not a plugin.
+            If the file cannot be imported, it will return None objects
+        """
+        # Add the plugin folder in case it uses relative path
+        plugin_folder_path = str(Path(plugin_path).parent)
+        sys.path.append(plugin_folder_path)
+
+        try:
+            # Import module with the module specification
+            module_spec = create_module_spec(module_name, plugin_path)
+            if not module_spec:
+                return None, None  # module spec is None
+
+            index_entry = {
+                "module_name": module_name,
+                "mtime": modified_time,
+                "plugin_type": None,
+                "plugin_sub_type": None,
+            }
+            module = import_module_from_spec(module_spec)
+            if (
+                PluginManager.plugin_name in dir(module)
+                and module.Plugin.get_plugin_type() in PluginType
+            ):
+                index_entry["plugin_type"] = module.Plugin.get_plugin_type().name
+                index_entry["plugin_sub_type"] = PluginManager._get_plugin_sub_type(
+                    module.Plugin
+                )
+                register_module(module)
+                return index_entry, module
+            else:
+                return index_entry, None  # Unexpected module or Invalid plugin type
+
+        except Exception:
+            return None, None  # Encountered an error while processing this py file
+
+        finally:
+            # Remove the plugin folder from sys search path
+            sys.path.remove(plugin_folder_path)
+
+    @staticmethod
+    def _get_index_key(plugin_path: str) -> str:
+        """
+        A helper method to get the key of the python file in the discovery index
+
+        Args:
+            plugin_path (str): The python file path
+
+        Returns:
+            str: The absolute path of the python file
+        """
+        return str(Path(plugin_path).absolute())
+
+    @staticmethod
+    def _read_discovery_index(index_file_path: str) -> Dict:
+        """
+        A helper method to read the discovery index file
+
+        Args:
+            index_file_path (str): The discovery index file path
+
+        Returns:
+            Dict: The index entries keyed by the python file paths, or an empty dict if the file cannot be read
+        """
+        try:
+            with open(index_file_path, "r") as index_file:
+                discovery_index = json.load(index_file)
+            if isinstance(discovery_index, dict):
+                return discovery_index
+            else:
+                return dict()
+
+        except (OSError, ValueError):
+            return dict()
+
+    @staticmethod
+    def _write_discovery_index(index_file_path: str, discovery_index: Dict) -> None:
+        """
+        A helper method to write the discovery index file.
+        The file is replaced atomically as other processes may be reading it
+
+        Args:
+            index_file_path (str): The discovery index file path
+            discovery_index (Dict): The index entries keyed by the python file paths
+        """
+        temp_file_path = f"{index_file_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_file_path, "w") as index_file:
+                json.dump(discovery_index, index_file)
+            os.replace(temp_file_path, index_file_path)
+
+        except OSError:
+            # Unable to write the index file (e.g. read-only folder); The files are indexed at the next discovery
+            if Path(temp_file_path).exists():
+                os.remove(temp_file_path)
+
     @staticmethod
     def _update_plugins_by_type(plugin_type: PluginType, plugin_dict: Dict) -> None:
         """
@@ -493,7 +695,7 @@ class PluginManager:
         """
         for module_name, module in modules.items():
             # Get the module plugin type
-            plugin_type = module.Plugin.get_plugin_type()
+            plugin_type, _ = PluginManager._get_plugin_types(module)
 
             # Check if this module exists in the pluginmanager plugins list.
             # Add plugin if the module does not exist.
@@ -0,0 +1,149 @@
+import codecs
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Union
+
+from test_engine_core.plugins.enums.model_plugin_type import ModelPluginType
+from test_engine_core.plugins.enums.serializer_plugin_type import SerializerPluginType
+from test_engine_core.utils.import_modules import LazyModule
+
+# The number of bytes read from the head of the file to identify the file format
+SNIFF_SAMPLE_SIZE: int = 1024
+
+# The file signatures (magic bytes) and the serializers which can deserialize the files
+# Uncompressed joblib files are pickle files, and are tried with both serializers in the priority order
+FILE_SIGNATURES: List[Tuple[bytes, List[SerializerPluginType]]] = [
+    (b"\x80", [SerializerPluginType.PICKLE, SerializerPluginType.JOBLIB]),
+    (b"\x89HDF\r\n\x1a\n", [SerializerPluginType.TENSORFLOW]),
+    (b"PK\x03\x04", [SerializerPluginType.TENSORFLOW]),
+    (b"ARROW1", [SerializerPluginType.ARROW]),
+    (b"PAR1", [SerializerPluginType.ARROW]),
+    (b"\x89PNG\r\n\x1a\n", [SerializerPluginType.IMAGE]),
+    (b"\xff\xd8\xff", [SerializerPluginType.IMAGE]),
+    (b"\x1f\x8b", [SerializerPluginType.JOBLIB]),
+    (b"BZh", [SerializerPluginType.JOBLIB]),
+    (b"\xfd7zXZ\x00", [SerializerPluginType.JOBLIB]),
+    (b"]\x00", [SerializerPluginType.JOBLIB]),
+    (b'\x04"M\x18', [SerializerPluginType.JOBLIB]),
+    (b"x\x01", [SerializerPluginType.JOBLIB]),
+    (b"x^", [SerializerPluginType.JOBLIB]),
+    (b"x\x9c", [SerializerPluginType.JOBLIB]),
+    (b"x\xda", [SerializerPluginType.JOBLIB]),
+]
+
+# The root package names of the model objects and their model plugin types
+MODEL_PACKAGES: Dict[str, List[ModelPluginType]] = {
+    "lightgbm": [ModelPluginType.LIGHTGBM],
+    "xgboost": [ModelPluginType.XGBOOST],
+    "sklearn": [ModelPluginType.SKLEARN],
+    "keras": [ModelPluginType.TENSORFLOW],
+    "tensorflow": [ModelPluginType.TENSORFLOW],
+}
+
+
+def sniff_serializer_plugin_types(file_path: str) -> List[SerializerPluginType]:
+    """
+    A function to identify the serializers which can deserialize the file from its file signature.
+    Text files are identified as delimiter files, and TensorFlow SavedModel folders are identified
+    by the saved_model.pb file
+
+    Args:
+        file_path (str): The file or folder path
+
+    Returns:
+        List[SerializerPluginType]: The serializer plugin types for the file. It is empty if the format is unknown
+    """
+    try:
+        path = Path(file_path)
+        if path.is_dir():
+            if (path / "saved_model.pb").is_file():
+                return [SerializerPluginType.TENSORFLOW]
+            return list()
+
+        with open(path, "rb") as binary_file:
+            sample = binary_file.read(SNIFF_SAMPLE_SIZE)
+
+    except (OSError, TypeError, ValueError):
+        return list()
+
+    for signature, serializer_plugin_types in FILE_SIGNATURES:
+        if sample.startswith(signature):
+            return list(serializer_plugin_types)
+
+    if sample and b"\x00" not in sample:
+        try:
+            # The sample may end with a partial character
+            codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+            return [SerializerPluginType.DELIMITER]
+        except UnicodeDecodeError:
+            pass  # Not a text file
+
+    return list()
+
+
+def sniff_model_plugin_types(model: Any) -> List[ModelPluginType]:
+    """
+    A function to identify the model plugins which can support the model from the package of the model class
+
+    Args:
+        model (Any): The deserialized model
+
+    Returns:
+        List[ModelPluginType]: The model plugin types for the model. It is empty if the package is unknown
+    """
+    module_name = getattr(type(model), "__module__", None) or ""
+    return list(MODEL_PACKAGES.get(module_name.split(".")[0], list()))
+
+
+def sort_plugins_by_sub_types(
+    plugins: Dict, plugin_sub_types: List[Enum], sub_type_method_name: str
+) -> Dict:
+    """
+    A function to sort the plugins so that the plugins of the sniffed sub types are tried first.
+    The other plugins follow in their original order, so that they are tried if the sniffed plugins fail
+
+    Args:
+        plugins (Dict): The plugins in the priority order
+        plugin_sub_types (List[Enum]): The sniffed plugin sub types (e.g. SerializerPluginType.PICKLE)
+        sub_type_method_name (str): The name of the Plugin method which returns the plugin sub type
+        (e.g. get_serializer_plugin_type)
+
+    Returns:
+        Dict: The sorted plugins
+    """
+    if not plugin_sub_types:
+        return plugins
+
+    sub_type_names = [plugin_sub_type.name for plugin_sub_type in plugin_sub_types]
+    return dict(
+        sorted(
+            plugins.items(),
+            key=lambda plugin_item: _get_plugin_sub_type_name(
+                plugin_item[1], sub_type_method_name
+            )
+            not in sub_type_names,
+        )
+    )
+
+
+def _get_plugin_sub_type_name(
+    plugin: Any, sub_type_method_name: str
+) -> Union[str, None]:
+    """
+    A helper function to get the plugin sub type name of the plugin module.
+    The sub type of lazy modules is read from the discovery index without importing the module
+
+    Args:
+        plugin (Any): The plugin module
+        sub_type_method_name (str): The name of the Plugin method which returns the plugin sub type
+
+    Returns:
+        Union[str, None]: The plugin sub type name, or None if it cannot be found
+    """
+    if isinstance(plugin, LazyModule) and vars(plugin).get("plugin_sub_type"):
+        return vars(plugin).get("plugin_sub_type")
+
+    try:
+        return getattr(plugin.Plugin, sub_type_method_name)().name
+    except Exception:
+        return None  # Not a plugin of this sub type
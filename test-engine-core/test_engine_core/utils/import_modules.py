@@ -5,11 +5,15 @@ import sys
 from importlib.machinery import ModuleSpec
 from inspect import isclass, isfunction
 from pathlib import Path
+from threading import Lock
 from types import ModuleType
-from typing import Dict, Union
+from typing import Any, Dict, Set, Union
 
 from test_engine_core.utils.validate_checks import is_empty_string
 
+# The names of the modules registered in sys.modules by register_module
+_registered_module_names: Set[str] = set()
+
 
 def create_module_spec(
     module_name: str, module_file_path: str
@@ -33,7 +37,10 @@ def create_module_spec(
         ):
             return None
 
-        module_spec = importlib.util.find_spec(module_name)
+        # Registered modules are imported from the file path again, as the file path may have changed
+        module_spec = None
+        if module_name not in _registered_module_names:
+            module_spec = importlib.util.find_spec(module_name)
         if module_spec is None:
             # Create a module spec since it is not available
             module_spec = importlib.util.spec_from_file_location(
@@ -65,6 +72,114 @@ def import_module_from_spec(module_spec: ModuleSpec) -> Union[ModuleType, None]:
     return module
 
 
+def register_module(module: ModuleType) -> None:
+    """
+    A function to register the imported module in sys.modules, so that its classes and functions can be
+    pickled by reference (e.g. to run them in worker processes).
+    A module of the same name imported from another file is not replaced, unless it was registered by
+    this function
+
+    Args:
+        module (ModuleType): The imported module
+    """
+    if module is None or not isinstance(module, ModuleType):
+        return
+
+    existing_module = sys.modules.get(module.__name__)
+    if (
+        existing_module is None
+        or module.__name__ in _registered_module_names
+        or _get_module_file(existing_module) == _get_module_file(module)
+    ):
+        sys.modules[module.__name__] = module
+        _registered_module_names.add(module.__name__)
+
+
+def _get_module_file(module: ModuleType) -> Union[str, None]:
+    """
+    A helper function to return the resolved file path of the module
+
+    Args:
+        module (ModuleType): The module
+
+    Returns:
+        Union[str, None]: The resolved file path, or None if the module is not imported from a file
+    """
+    module_file = getattr(module, "__file__", None)
+    if module_file is None:
+        return None
+    return str(Path(module_file).resolve())
+
+
+class LazyModule:
+    """
+    The LazyModule class holds the name and file path of a python module, and only imports the module
+    when an attribute of the module is first accessed (e.g. LazyModule.Plugin).
+    Additional attributes (e.g. the plugin sub type from the discovery index) can be read without importing
+    """
+
+    def __init__(
+        self,
+        module_name: str,
+        module_file_path: str,
+        module: Union[ModuleType, None] = None,
+        **attributes,
+    ):
+        self.__dict__.update(attributes)
+        self.__name__ = module_name
+        self.__file__ = str(Path(module_file_path).absolute())
+        self._lazy_module = module
+        self._lazy_lock = Lock()
+
+    def __getattr__(self, attribute_name: str) -> Any:
+        # Only called when the attribute is not found in the LazyModule
+        if attribute_name.startswith("_lazy_"):
+            raise AttributeError(attribute_name)
+        return getattr(self.load(), attribute_name)
+
+    def __repr__(self) -> str:
+        return f"<module '{self.__name__}' from '{self.__file__}'>"
+
+    def is_loaded(self) -> bool:
+        """
+        A method to return if the module has been imported
+
+        Returns:
+            bool: True if the module has been imported
+        """
+        return self._lazy_module is not None
+
+    def load(self) -> ModuleType:
+        """
+        A method to import the module if it has not been imported
+
+        Raises:
+            RuntimeError: Raise exception when the module cannot be imported from the file path
+
+        Returns:
+            ModuleType: The imported module
+        """
+        with self._lazy_lock:
+            if self._lazy_module is None:
+                # Add the module folder in case it uses relative path
+                module_folder_path = str(Path(self.__file__).parent)
+                sys.path.append(module_folder_path)
+                try:
+                    module_spec = create_module_spec(self.__name__, self.__file__)
+                    if not module_spec:
+                        raise RuntimeError(
+                            f"There was an error importing module: {self.__file__}"
+                        )
+                    self._lazy_module = import_module_from_spec(module_spec)
+                    register_module(self._lazy_module)
+
+                finally:
+                    # Remove the module folder from sys search path
+                    sys.path.remove(module_folder_path)
+
+            return self._lazy_module
+
+
 def import_python_modules(discover_folder: str) -> None:
     """
     A function to import python modules to be imported into the system. This is to assist pipelining support
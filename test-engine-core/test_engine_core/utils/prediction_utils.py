@@ -0,0 +1,97 @@
+import ast
+import json
+from typing import Any, List
+
+import numpy as np
+
+
+def normalize_predictions(predictions: Any) -> np.ndarray:
+    """
+    A function to convert the predictions from models into a numpy array for computation.
+    Numeric predictions (i.e. numpy scalars and probability vectors) are converted without processing each value.
+    String predictions (i.e. from API models) are converted to integers or floats, and string lists
+    (i.e. "[0.1, 0.9]") are converted to rows of values. Each distinct string is only parsed once.
+    Strings that are not numeric (i.e. class names) are kept as strings.
+
+    Args:
+        predictions (Any): The predictions from the model
+
+    Returns:
+        np.ndarray: The predictions in a numpy array
+    """
+    try:
+        predictions_np = np.asarray(predictions)
+    except ValueError:
+        # Predictions of different lengths
+        predictions_np = np.empty(len(predictions), dtype=object)
+        predictions_np[:] = list(predictions)
+
+    if predictions_np.dtype.kind in "biuf":
+        return predictions_np
+
+    elif predictions_np.dtype.kind in "US":
+        for numeric_type in [np.int64, np.float64]:
+            try:
+                return predictions_np.astype(numeric_type)
+            except (ValueError, OverflowError):
+                pass  # Not all the strings are of this numeric type
+
+        unique_values, inverse_indexes = np.unique(predictions_np, return_inverse=True)
+        values = _convert_values(
+            [_parse_string(unique_value) for unique_value in unique_values.tolist()]
+        )
+        return values[inverse_indexes].reshape(predictions_np.shape + values.shape[1:])
+
+    else:
+        parsed_strings = dict()
+        converted_values = list()
+        for value in predictions_np.ravel().tolist():
+            if isinstance(value, str):
+                if value not in parsed_strings:
+                    parsed_strings[value] = _parse_string(value)
+                value = parsed_strings[value]
+            converted_values.append(value)
+
+        values = _convert_values(converted_values)
+        if predictions_np.ndim > 1 and values.ndim == 1:
+            return values.reshape(predictions_np.shape)
+        return values
+
+
+def _parse_string(value: str) -> Any:
+    """
+    A helper function to parse the string of a prediction to its value
+
+    Args:
+        value (str): The string of the prediction
+
+    Returns:
+        Any: The parsed value, or the string if it cannot be parsed
+    """
+    try:
+        return json.loads(value)
+    except ValueError:
+        pass  # Not a JSON value (i.e. python literals such as True or (0.1, 0.9))
+
+    try:
+        return ast.literal_eval(value.strip())
+    except (ValueError, SyntaxError, MemoryError, RecursionError):
+        return value
+
+
+def _convert_values(values: List) -> np.ndarray:
+    """
+    A helper function to convert the parsed values to a numpy array
+
+    Args:
+        values (List): The parsed values
+
+    Returns:
+        np.ndarray: The values in a numpy array. The array is of object type if the values have different lengths
+    """
+    try:
+        return np.asarray(values)
+    except ValueError:
+        values_np = np.empty(len(values), dtype=object)
+        values_np[:] = values
+        return values_np
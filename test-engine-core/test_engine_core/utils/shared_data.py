@@ -0,0 +1,375 @@
+import glob
+import hashlib
+import mmap
+import os
+import pickle
+import stat
+import struct
+from collections import OrderedDict
+from multiprocessing import Lock, shared_memory
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+
+class SharedData:
+    """
+    SharedData class places the deserialized data in shared memory, so that the processes on the same node
+    reading the same data files can map the data instead of deserializing it again.
+    The data is pickled with out-of-band buffers, so that the numpy arrays (i.e. dataframe columns) are mapped
+    without copying. The mapping is copy-on-write, and in-place changes are kept private to each process.
+    The shared memory is owned by the process that published it, and is removed when it is released or
+    evicted in least recently used order when the total size exceeds the memory limit.
+    The shared memory names are derived from the namespace, so that only the processes given the same
+    namespace can find the data, and the data is only mapped from shared memory owned by the same user.
+    """
+
+    _max_memory: int = 0  # MB
+    _namespace: str = ""
+    # The function called with the shared memory name, and whether it is published or removed
+    _callback: Union[Callable[[str, bool], None], None] = None
+    _current_size: int = 0
+    _published: OrderedDict = OrderedDict()
+    _shared_memory_folder: str = "/dev/shm"
+    _name_prefix: str = "aiverify_"
+    _alignment: int = 64
+    # The header offset and header size, placed at the start of the shared memory.
+    # The header size is written last, and is 0 while the data is being written
+    _prefix_format: str = "<QQ"
+    lock: Lock = Lock()
+
+    @staticmethod
+    def setup(max_memory: int, namespace: str = "") -> None:
+        """
+        A method to set up the shared data
+
+        Args:
+            max_memory (int): The total size (MB) of data this process places in shared memory. 0 disables it
+            namespace (str): The secret shared by the processes which share the data. Defaults to ""
+        """
+        if isinstance(max_memory, int) and max_memory >= 0:
+            SharedData._max_memory = max_memory
+        if isinstance(namespace, str):
+            SharedData._namespace = namespace
+
+    @staticmethod
+    def set_callback(callback: Union[Callable[[str, bool], None], None]) -> None:
+        """
+        A method to set the function to be called with the shared memory name, and whether it is published
+        or removed. This allows the parent process to remove the shared memory if this process is terminated
+
+        Args:
+            callback (Union[Callable[[str, bool], None], None]): The function to be called, or None
+        """
+        SharedData._callback = callback
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """
+        A method to return whether the data is shared through shared memory
+
+        Returns:
+            bool: True if the shared data is enabled, else False
+        """
+        return (
+            SharedData._max_memory > 0
+            and Path(SharedData._shared_memory_folder).is_dir()
+        )
+
+    @staticmethod
+    def get_key(path: str, *arguments) -> Union[str, None]:
+        """
+        A method to generate the key of the data read from the file/folder path with the arguments.
+        The key changes when the files are modified.
+
+        Args:
+            path (str): The file/folder path the data is read from
+            *arguments: The arguments the data is read with (i.e. the columns)
+
+        Returns:
+            Union[str, None]: The key, or None if the shared data is disabled or the path is invalid
+        """
+        if not SharedData.is_enabled() or not isinstance(path, str) or not path:
+            return None
+
+        resolved_path = Path(path).resolve()
+        if resolved_path.is_file():
+            file_paths = [resolved_path]
+        elif resolved_path.is_dir():
+            file_paths = sorted(
+                Path(file)
+                for file in glob.glob(f"{resolved_path}/**/*", recursive=True)
+                if Path(file).is_file()
+            )
+        else:
+            return None
+
+        try:
+            file_stats = tuple(
+                (str(file_path), stat_result.st_mtime_ns, stat_result.st_size)
+                for file_path, stat_result in (
+                    (file_path, file_path.stat()) for file_path in file_paths
+                )
+            )
+        except OSError:
+            return None  # Files changed while generating the key
+
+        signature = repr((str(resolved_path), file_stats, arguments))
+        return hashlib.sha256(signature.encode("utf-8")).hexdigest()[:24]
+
+    @staticmethod
+    def publish(key: str, data: Any, metadata: Dict) -> bool:
+        """
+        A method to place the data in shared memory for the other processes to map
+
+        Args:
+            key (str): The key of the data
+            data (Any): The data to be shared
+            metadata (Dict): The information to be returned with the data (i.e. the serializer)
+
+        Returns:
+            bool: True if the data is in shared memory, else False
+        """
+        if not SharedData.is_enabled() or not key:
+            return False
+
+        try:
+            buffers = list()
+            pickled_data = pickle.dumps(
+                data, protocol=5, buffer_callback=buffers.append
+            )
+            raw_buffers = [buffer.raw() for buffer in buffers]
+        except Exception:
+            return False  # Data cannot be pickled with out-of-band buffers
+
+        # Place the pickled data and the buffers at aligned offsets, followed by the header
+        data_span = (SharedData._alignment, len(pickled_data))
+        offset = SharedData._align(sum(data_span))
+        buffer_spans = list()
+        for raw_buffer in raw_buffers:
+            buffer_spans.append((offset, raw_buffer.nbytes))
+            offset = SharedData._align(offset + raw_buffer.nbytes)
+        header = pickle.dumps(
+            {"metadata": metadata, "data": data_span, "buffers": buffer_spans}
+        )
+        total_size = offset + len(header)
+        if total_size > SharedData._max_memory * 1024 * 1024:
+            return False
+
+        name = SharedData._get_name(key)
+        with SharedData.lock:
+            if not SharedData.is_enabled():
+                return False  # Disabled while the data is being pickled
+            if name in SharedData._published:
+                return True
+
+            try:
+                published_memory = shared_memory.SharedMemory(
+                    name=name, create=True, size=total_size
+                )
+            except OSError:
+                return False  # Published by another process, or out of shared memory
+
+            published_memory.buf[slice(*SharedData._to_range(data_span))] = pickled_data
+            for buffer_span, raw_buffer in zip(buffer_spans, raw_buffers):
+                published_memory.buf[
+                    slice(*SharedData._to_range(buffer_span))
+                ] = raw_buffer
+            published_memory.buf[offset:total_size] = header
+            struct.pack_into(
+                SharedData._prefix_format,
+                published_memory.buf,
+                0,
+                offset,
+                len(header),
+            )
+
+            SharedData._published[name] = (published_memory, total_size)
+            SharedData._current_size += total_size
+            if SharedData._callback is not None:
+                SharedData._callback(name, True)
+
+            # Evict the least recently used data until it is within the memory limit
+            while SharedData._current_size > SharedData._max_memory * 1024 * 1024:
+                SharedData._remove_entry(next(iter(SharedData._published)))
+
+        return True
+
+    @staticmethod
+    def attach(key: str) -> Union[Tuple[Any, Dict], None]:
+        """
+        A method to map the data placed in shared memory by this or another process
+
+        Args:
+            key (str): The key of the data
+
+        Returns:
+            Union[Tuple[Any, Dict], None]: The data and its metadata, or None if the data is not in shared memory
+        """
+        if not SharedData.is_enabled() or not key:
+            return None
+
+        name = SharedData._get_name(key)
+        with SharedData.lock:
+            if name in SharedData._published:
+                # Mark this data as the most recently used
+                SharedData._published.move_to_end(name)
+
+        try:
+            file_descriptor = os.open(
+                Path(SharedData._shared_memory_folder) / name,
+                os.O_RDONLY | os.O_NOFOLLOW,
+            )
+            try:
+                # Only unpickle the data placed by the same user, which cannot be modified by other users
+                if not SharedData._is_trusted(os.fstat(file_descriptor)):
+                    return None
+
+                # The mapping stays valid after the file is closed or the shared memory is removed
+                mapped_memory = mmap.mmap(file_descriptor, 0, access=mmap.ACCESS_COPY)
+            finally:
+                os.close(file_descriptor)
+
+            header_offset, header_size = struct.unpack_from(
+                SharedData._prefix_format, mapped_memory, 0
+            )
+            if header_size == 0:
+                return None  # The data is still being written
+
+            mapped_view = memoryview(mapped_memory)
+            header = pickle.loads(
+                mapped_view[header_offset : header_offset + header_size]
+            )
+            data = pickle.loads(
+                mapped_view[slice(*SharedData._to_range(header["data"]))],
+                buffers=[
+                    mapped_view[slice(*SharedData._to_range(buffer_span))]
+                    for buffer_span in header["buffers"]
+                ],
+            )
+            return data, header["metadata"]
+
+        except Exception:
+            return None  # Not in shared memory, or cannot be mapped
+
+    @staticmethod
+    def release(key: str) -> None:
+        """
+        A method to remove the data this process has placed in shared memory.
+        The processes which have mapped the data can continue to use it.
+
+        Args:
+            key (str): The key of the data
+        """
+        name = SharedData._get_name(key)
+        with SharedData.lock:
+            if name in SharedData._published:
+                SharedData._remove_entry(name)
+
+    @staticmethod
+    def release_all() -> None:
+        """
+        A method to remove all the data this process has placed in shared memory
+        """
+        with SharedData.lock:
+            for name in list(SharedData._published.keys()):
+                SharedData._remove_entry(name)
+
+    @staticmethod
+    def remove(names: List[str]) -> None:
+        """
+        A method to remove the shared memory placed by another process which has exited without releasing it
+        (i.e. terminated)
+
+        Args:
+            names (List[str]): The shared memory names reported to the callback
+        """
+        for name in names:
+            if not isinstance(name, str) or not name.startswith(
+                SharedData._name_prefix
+            ):
+                continue
+            try:
+                os.unlink(Path(SharedData._shared_memory_folder) / Path(name).name)
+            except OSError:
+                pass  # Already removed, or not owned by this user
+
+    @staticmethod
+    def _remove_entry(name: str) -> None:
+        """
+        A helper method to remove the shared memory and update the total size.
+        The caller is expected to hold the lock.
+
+        Args:
+            name (str): The name of the shared memory
+        """
+        published_memory, size = SharedData._published.pop(name)
+        SharedData._current_size -= size
+        published_memory.close()
+        try:
+            published_memory.unlink()
+        except FileNotFoundError:
+            pass  # Already removed
+        if SharedData._callback is not None:
+            SharedData._callback(name, False)
+
+    @staticmethod
+    def _is_trusted(stat_result: os.stat_result) -> bool:
+        """
+        A helper method to check that the shared memory is owned by this user and cannot be written by others
+
+        Args:
+            stat_result (os.stat_result): The status of the shared memory file
+
+        Returns:
+            bool: True if the shared memory can be trusted, else False
+        """
+        return (
+            stat.S_ISREG(stat_result.st_mode)
+            and stat_result.st_uid == os.getuid()
+            and stat_result.st_mode & (stat.S_IWGRP | stat.S_IWOTH) == 0
+        )
+
+    @staticmethod
+    def _get_name(key: str) -> str:
+        """
+        A helper method to return the shared memory name of the key
+
+        Args:
+            key (str): The key of the data
+
+        Returns:
+            str: The shared memory name
+        """
+        if not SharedData._namespace:
+            return f"{SharedData._name_prefix}{key}"
+
+        # The names cannot be predicted (i.e. created in advance by another user) without the namespace
+        signature = f"{SharedData._namespace}:{key}"
+        return f"{SharedData._name_prefix}{hashlib.sha256(signature.encode('utf-8')).hexdigest()[:32]}"
+
+    @staticmethod
+    def _align(offset: int) -> int:
+        """
+        A helper method to round up the offset to the alignment, so that the arrays are aligned when mapped
+
+        Args:
+            offset (int): The offset
+
+        Returns:
+            int: The aligned offset
+        """
+        return -(-offset // SharedData._alignment) * SharedData._alignment
+
+    @staticmethod
+    def _to_range(span: Tuple[int, int]) -> Tuple[int, int]:
+        """
+        A helper method to convert the offset and size to the start and end offsets
+
+        Args:
+            span (Tuple[int, int]): The offset and size
+
+        Returns:
+            Tuple[int, int]: The start and end offsets
+        """
+        offset, size = span
+        return offset, offset + size
@@ -0,0 +1,213 @@
+import pickle
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+import numpy as np
+
+
+class WorkerPool:
+    """
+    WorkerPool class runs independent work items concurrently in a pool of threads or processes,
+    and returns the results in the order of the work items.
+    Threads suit functions that release the GIL (i.e. numpy or native model predictions), while processes
+    suit functions that hold the GIL. In the process pool, numeric numpy data is placed in shared memory
+    and attached once by each worker process instead of being copied with every work item.
+    The data is shared by all the work items and must not be modified by the function.
+    """
+
+    WORKER_TYPE_THREAD: str = "thread"
+    WORKER_TYPE_PROCESS: str = "process"
+
+    # The data and shared arguments attached in the worker process
+    _worker_data: Any = None
+    _worker_shared_arguments: Tuple = tuple()
+    _worker_shared_memory: Union[shared_memory.SharedMemory, None] = None
+
+    @staticmethod
+    def run(
+        function: Callable,
+        data: Any,
+        shared_arguments: Tuple,
+        list_of_arguments: List[Tuple],
+        num_workers: int,
+        worker_type: str = WORKER_TYPE_THREAD,
+        callback: Union[Callable, None] = None,
+    ) -> List:
+        """
+        A method to run the function on each work item and return the results in the order of the work items.
+        The function is called with function(data, *shared_arguments, *arguments) for each work item.
+        The work items are run sequentially in the current thread when there are not more than 1 worker.
+
+        Args:
+            function (Callable): The function to run. It must be picklable (i.e. a module-level function or
+            static method) to run in the process pool
+            data (Any): The data shared by all the work items
+            shared_arguments (Tuple): The arguments shared by all the work items (i.e. the model instance)
+            list_of_arguments (List[Tuple]): The arguments of each work item
+            num_workers (int): The number of workers
+            worker_type (str): The type of workers, either "thread" or "process". Defaults to "thread"
+            callback (Union[Callable, None]): The function to call with the index of each completed work item.
+            Defaults to None
+
+        Raises:
+            RuntimeError: Raise exception when the worker type is not supported
+            RuntimeError: Raise exception when the function cannot be pickled to run in the process pool
+
+        Returns:
+            List: The results of the work items
+        """
+        if worker_type not in [
+            WorkerPool.WORKER_TYPE_THREAD,
+            WorkerPool.WORKER_TYPE_PROCESS,
+        ]:
+            raise RuntimeError(f"The worker type is not supported: {worker_type}")
+
+        results = [None] * len(list_of_arguments)
+        if not isinstance(num_workers, int) or num_workers <= 1:
+            for index, arguments in enumerate(list_of_arguments):
+                results[index] = function(data, *shared_arguments, *arguments)
+                if callback is not None:
+                    callback(index)
+            return results
+
+        if worker_type == WorkerPool.WORKER_TYPE_PROCESS:
+            # Check the function before starting the worker processes, as the pool does not shut down
+            # cleanly when the work items cannot be sent to the worker processes
+            try:
+                pickle.dumps(function)
+            except Exception as error:
+                raise RuntimeError(
+                    f"The function cannot be pickled to run in the process pool: {error}"
+                )
+
+        data_shared_memory = None
+        try:
+            if worker_type == WorkerPool.WORKER_TYPE_PROCESS:
+                if isinstance(data, np.ndarray) and not data.dtype.hasobject:
+                    # Place the data in shared memory for the worker processes to attach
+                    data_shared_memory = shared_memory.SharedMemory(
+                        create=True, size=max(data.nbytes, 1)
+                    )
+                    np.ndarray(
+                        data.shape, dtype=data.dtype, buffer=data_shared_memory.buf
+                    )[...] = data
+                    initializer_arguments = (
+                        None,
+                        data_shared_memory.name,
+                        data.shape,
+                        data.dtype.str,
+                        shared_arguments,
+                    )
+                else:
+                    # Non-numeric data is sent once to each worker process
+                    initializer_arguments = (data, None, None, None, shared_arguments)
+
+                executor = ProcessPoolExecutor(
+                    max_workers=num_workers,
+                    initializer=WorkerPool._attach_worker_data,
+                    initargs=initializer_arguments,
+                )
+                futures = {
+                    executor.submit(
+                        WorkerPool._run_with_worker_data, function, arguments
+                    ): index
+                    for index, arguments in enumerate(list_of_arguments)
+                }
+            else:
+                executor = ThreadPoolExecutor(max_workers=num_workers)
+                futures = {
+                    executor.submit(
+                        function, data, *shared_arguments, *arguments
+                    ): index
+                    for index, arguments in enumerate(list_of_arguments)
+                }
+
+            WorkerPool._collect_results(executor, futures, results, callback)
+
+        finally:
+            if data_shared_memory is not None:
+                data_shared_memory.close()
+                data_shared_memory.unlink()
+
+        return results
+
+    @staticmethod
+    def _collect_results(
+        executor: Executor,
+        futures: Dict[Future, int],
+        results: List,
+        callback: Union[Callable, None],
+    ) -> None:
+        """
+        A helper method to store the results of the work items as they complete.
+        The pending work items are cancelled when a work item has failed.
+
+        Args:
+            executor (Executor): The executor running the work items
+            futures (Dict[Future, int]): The futures of the work items and their indexes
+            results (List): The list to store the results in
+            callback (Union[Callable, None]): The function to call with the index of each completed work item
+        """
+        try:
+            for future in as_completed(futures):
+                index = futures[future]
+                results[index] = future.result()
+                if callback is not None:
+                    callback(index)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _attach_worker_data(
+        data: Any,
+        shared_memory_name: Union[str, None],
+        shape: Union[Tuple, None],
+        dtype: Union[str, None],
+        shared_arguments: Tuple,
+    ) -> None:
+        """
+        A helper method that runs in each worker process to attach the data and shared arguments
+
+        Args:
+            data (Any): The data if it is not placed in shared memory
+            shared_memory_name (Union[str, None]): The name of the shared memory containing the data
+            shape (Union[Tuple, None]): The shape of the data in shared memory
+            dtype (Union[str, None]): The data type of the data in shared memory
+            shared_arguments (Tuple): The arguments shared by all the work items
+        """
+        if shared_memory_name is not None:
+            WorkerPool._worker_shared_memory = shared_memory.SharedMemory(
+                name=shared_memory_name
+            )
+            data = np.ndarray(
+                shape,
+                dtype=np.dtype(dtype),
+                buffer=WorkerPool._worker_shared_memory.buf,
+            )
+            data.setflags(write=False)
+
+        WorkerPool._worker_data = data
+        WorkerPool._worker_shared_arguments = shared_arguments
+
+    @staticmethod
+    def _run_with_worker_data(function: Callable, arguments: Tuple) -> Any:
+        """
+        A helper method that runs in the worker process to run the function with the attached data
+
+        Args:
+            function (Callable): The function to run
+            arguments (Tuple): The arguments of the work item
+
+        Returns:
+            Any: The result of the work item
+        """
+        return function(
+            WorkerPool._worker_data, *WorkerPool._worker_shared_arguments, *arguments
+        )
@@ -6,6 +6,7 @@ import pytest
 from test_engine_core.converters.data_converter import DataConverter
 from test_engine_core.interfaces.iconverter import IConverter
 from test_engine_core.interfaces.idata import IData
+from test_engine_core.plugins.enums.arrow_file_type import ArrowFileType
 from test_engine_core.plugins.enums.data_plugin_type import DataPluginType
 from test_engine_core.plugins.enums.plugin_type import PluginType
 from test_engine_core.plugins.metadata.plugin_metadata import PluginMetadata
@@ -60,6 +61,9 @@ class PandasInstance(IData, IConverter):
     def read_csv_as_df(self, data_path, delimiter_type):
         return data_path, delimiter_type
 
+    def read_arrow_as_df(self, data_path, file_type, columns=None):
+        return data_path, file_type, columns
+
     def read_image_as_df(self, image_paths, column_name):
         return image_paths, column_name
 
@@ -301,6 +305,83 @@ class TestCollectionDataConverter:
             == expected_response
         )
 
+    @pytest.mark.parametrize(
+        "data, expected_response",
+        [
+            (
+                {
+                    "data_path": "tests/dataconverter/test.parquet",
+                    "file_type": ArrowFileType.PARQUET,
+                },
+                ("tests/dataconverter/test.parquet", ArrowFileType.PARQUET, None),
+            ),
+            (
+                {
+                    "data_path": "tests/dataconverter/test.feather",
+                    "file_type": ArrowFileType.ARROW,
+                    "columns": ["Age", "Gender"],
+                },
+                (
+                    "tests/dataconverter/test.feather",
+                    ArrowFileType.ARROW,
+                    ["Age", "Gender"],
+                ),
+            ),
+            # Test data_path
+            (
+                {"data_path": None, "file_type": ArrowFileType.PARQUET},
+                None,
+            ),
+            (
+                {"data_path": "", "file_type": ArrowFileType.PARQUET},
+                None,
+            ),
+            (
+                {"data_path": 123, "file_type": ArrowFileType.PARQUET},
+                None,
+            ),
+            # Test file_type
+            (
+                {"data_path": "tests/dataconverter/test.parquet", "file_type": None},
+                None,
+            ),
+            (
+                {
+                    "data_path": "tests/dataconverter/test.parquet",
+                    "file_type": "PARQUET",
+                },
+                None,
+            ),
+            # Test columns
+            (
+                {
+                    "data_path": "tests/dataconverter/test.parquet",
+                    "file_type": ArrowFileType.PARQUET,
+                    "columns": "Age",
+                },
+                None,
+            ),
+            (
+                {
+                    "data_path": "tests/dataconverter/test.parquet",
+                    "file_type": ArrowFileType.PARQUET,
+                    "columns": {},
+                },
+                None,
+            ),
+        ],
+    )
+    def test_convert_arrow_dict_to_dataframe(self, data, expected_response):
+        """
+        Tests converting arrow dictionary to dataframe
+        """
+        assert (
+            DataConverter.convert_dict_to_dataframe(
+                data, DataPluginType.ARROW, pytest.my_dataframe
+            )
+            == expected_response
+        )
+
     @pytest.mark.parametrize(
         "data_paths, column_name, pandas_instance, expected_response",
         [
@@ -2,6 +2,7 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, Tuple
 
+import pandas as pd
 import pytest
 
 from test_engine_core.interfaces.idata import IData
@@ -10,6 +11,7 @@ from test_engine_core.plugins.enums.data_plugin_type import DataPluginType
 from test_engine_core.plugins.enums.plugin_type import PluginType
 from test_engine_core.plugins.enums.serializer_plugin_type import SerializerPluginType
 from test_engine_core.plugins.metadata.plugin_metadata import PluginMetadata
+from test_engine_core.utils.shared_data import SharedData
 
 
 class RandomPluginTypeData:
@@ -244,6 +246,39 @@ class Serializer:
         return SerializerPluginType.PICKLE
 
 
+class DataFrameData:
+    _data = None
+
+    def Plugin(self, data=None):
+        if data is not None:
+            self._data = data
+        return self
+
+    def is_supported(self):
+        return isinstance(self._data, pd.DataFrame)
+
+    def get_data(self):
+        return self._data
+
+    def get_data_plugin_type(self):
+        return DataPluginType.PANDAS
+
+
+class CsvSerializer:
+    Plugin = None
+
+    def __init__(self):
+        self.number_of_calls = 0
+        self.Plugin = self
+
+    def deserialize_data(self, data_file):
+        self.number_of_calls += 1
+        return pd.read_csv(data_file)
+
+    def get_serializer_plugin_type(self):
+        return SerializerPluginType.DELIMITER
+
+
 class TestCollectionDataManager:
     pytest.pandas_data = PandasData()
     pytest.image_data = ImageData()
@@ -1098,3 +1133,36 @@ class TestCollectionDataManager:
                 data_file, data_plugins, serializer_plugins
             )
             assert response == expected_output
+
+    def test_read_data_with_shared_data(self, tmp_path):
+        """
+        Tests reading data file which is placed in shared memory after it is read
+        """
+        data_file = tmp_path / "data.csv"
+        data_file.write_text("Age,Score\n10,1.5\n20,2.5\n")
+        serializer = CsvSerializer()
+        data_plugins = {"data": DataFrameData()}
+        serializer_plugins = {"pickle": pytest.serializer, "csv": serializer}
+
+        SharedData.setup(1)
+        try:
+            for _ in range(2):
+                (
+                    is_success,
+                    data_instance,
+                    serializer_instance,
+                    error_message,
+                ) = DataManager.read_data(
+                    str(data_file), data_plugins, serializer_plugins
+                )
+                assert is_success is True
+                assert data_instance.get_data()["Score"].tolist() == [1.5, 2.5]
+                assert serializer_instance is serializer
+                assert error_message == ""
+
+            # The data is mapped from shared memory after it is first read
+            assert serializer.number_of_calls == 1
+
+        finally:
+            SharedData.release_all()
+            SharedData.setup(0)
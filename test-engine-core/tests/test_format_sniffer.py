@@ -0,0 +1,116 @@
+import pickle
+
+import pytest
+from sklearn.linear_model import LogisticRegression
+
+from test_engine_core.plugins.enums.model_plugin_type import ModelPluginType
+from test_engine_core.plugins.enums.serializer_plugin_type import SerializerPluginType
+from test_engine_core.utils.format_sniffer import (
+    sniff_model_plugin_types,
+    sniff_serializer_plugin_types,
+    sort_plugins_by_sub_types,
+)
+from test_engine_core.utils.import_modules import LazyModule
+
+
+class Serializer:
+    def __init__(self, serializer_plugin_type):
+        self._serializer_plugin_type = serializer_plugin_type
+        self.Plugin = self
+
+    def get_serializer_plugin_type(self):
+        return self._serializer_plugin_type
+
+
+class TestCollectionFormatSniffer:
+    @pytest.mark.parametrize(
+        "file_content, expected_output",
+        [
+            (
+                pickle.dumps({"a": 1}),
+                [SerializerPluginType.PICKLE, SerializerPluginType.JOBLIB],
+            ),
+            (b"\x1f\x8b\x08\x00", [SerializerPluginType.JOBLIB]),
+            (b"x\x9c\x01\x02", [SerializerPluginType.JOBLIB]),
+            (b"\x89HDF\r\n\x1a\n\x00", [SerializerPluginType.TENSORFLOW]),
+            (b"PK\x03\x04\x00", [SerializerPluginType.TENSORFLOW]),
+            (b"PAR1\x00", [SerializerPluginType.ARROW]),
+            (b"ARROW1\x00\x00", [SerializerPluginType.ARROW]),
+            (b"\x89PNG\r\n\x1a\n\x00", [SerializerPluginType.IMAGE]),
+            (b"\xff\xd8\xff\xe0", [SerializerPluginType.IMAGE]),
+            (b"a,b,c\n1,2,3\n", [SerializerPluginType.DELIMITER]),
+            ("x;y\né;1\n".encode("utf-8"), [SerializerPluginType.DELIMITER]),
+            (b"\x00\x01\x02", []),
+            (b"", []),
+        ],
+    )
+    def test_sniff_serializer_plugin_types(
+        self, tmp_path, file_content, expected_output
+    ):
+        """
+        Tests that it can identify the serializers from the file signature
+        """
+        file_path = tmp_path / "file.sav"
+        file_path.write_bytes(file_content)
+        assert sniff_serializer_plugin_types(str(file_path)) == expected_output
+
+    def test_sniff_serializer_plugin_types_with_folder(self, tmp_path):
+        """
+        Tests that it can identify the TensorFlow SavedModel folder
+        """
+        assert sniff_serializer_plugin_types(str(tmp_path)) == []
+        (tmp_path / "saved_model.pb").write_bytes(b"\x08\x01")
+        assert sniff_serializer_plugin_types(str(tmp_path)) == [
+            SerializerPluginType.TENSORFLOW
+        ]
+
+    @pytest.mark.parametrize("file_path", ["tests/data/not_found.sav", None, 123, ""])
+    def test_sniff_serializer_plugin_types_with_invalid_path(self, file_path):
+        """
+        Tests that it returns no serializers when the file cannot be read
+        """
+        assert sniff_serializer_plugin_types(file_path) == []
+
+    @pytest.mark.parametrize(
+        "model, expected_output",
+        [
+            (LogisticRegression(), [ModelPluginType.SKLEARN]),
+            ("model", []),
+            (None, []),
+        ],
+    )
+    def test_sniff_model_plugin_types(self, model, expected_output):
+        """
+        Tests that it can identify the model plugins from the model package
+        """
+        assert sniff_model_plugin_types(model) == expected_output
+
+    def test_sort_plugins_by_sub_types(self):
+        """
+        Tests that it sorts the sniffed plugins first and keeps the other plugins in order
+        """
+        plugins = {
+            "pickle": Serializer(SerializerPluginType.PICKLE),
+            "invalid": object(),
+            "joblib": Serializer(SerializerPluginType.JOBLIB),
+            "delimiter": Serializer(SerializerPluginType.DELIMITER),
+            "image": LazyModule(
+                "image", "tests/data/not_found.py", plugin_sub_type="IMAGE"
+            ),
+        }
+        output = sort_plugins_by_sub_types(
+            plugins,
+            [SerializerPluginType.IMAGE, SerializerPluginType.JOBLIB],
+            "get_serializer_plugin_type",
+        )
+        assert list(output.keys()) == [
+            "joblib",
+            "image",
+            "pickle",
+            "invalid",
+            "delimiter",
+        ]
+        assert output["image"].is_loaded() is False
+
+        output = sort_plugins_by_sub_types(plugins, [], "get_serializer_plugin_type")
+        assert list(output.keys()) == list(plugins.keys())
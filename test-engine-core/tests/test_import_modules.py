@@ -5,6 +5,7 @@ from types import ModuleType
 import pytest
 
 from test_engine_core.utils.import_modules import (
+    LazyModule,
     create_module_spec,
     get_non_python_files,
     import_module_from_spec,
@@ -71,6 +72,35 @@ class TestCollectionImportModules:
         else:
             assert output == expected_result
 
+    def test_lazy_module(self):
+        """
+        Tests that it only imports the module when the module attribute is accessed
+        """
+        lazy_module = LazyModule(
+            "lazy_example_serializer", "tests/importmodules/example_serializer.py"
+        )
+        assert lazy_module.is_loaded() is False
+        assert lazy_module.__name__ == "lazy_example_serializer"
+        assert lazy_module.__file__.endswith(
+            "tests/importmodules/example_serializer.py"
+        )
+        assert lazy_module.Plugin.get_metadata()
+        assert lazy_module.is_loaded() is True
+        assert isinstance(lazy_module.load(), ModuleType)
+
+        # The module is registered so that its functions can be pickled
+        assert sys.modules["lazy_example_serializer"] is lazy_module.load()
+
+    def test_lazy_module_with_invalid_attribute(self):
+        """
+        Tests that it raises error when the module attribute does not exist
+        """
+        lazy_module = LazyModule(
+            "lazy_example_serializer", "tests/importmodules/example_serializer.py"
+        )
+        with pytest.raises(AttributeError):
+            lazy_module.NotPlugin
+
     @pytest.mark.parametrize(
         "discover_folder, module_name, expected_result",
         [
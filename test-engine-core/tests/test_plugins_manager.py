@@ -1,4 +1,6 @@
 import logging
+import os
+import shutil
 from pathlib import Path
 
 import pytest
@@ -10,6 +12,8 @@ from test_engine_core.plugins.enums.plugin_type import PluginType
 from test_engine_core.plugins.model_manager import ModelManager
 from test_engine_core.plugins.pipeline_manager import PipelineManager
 from test_engine_core.plugins.plugins_manager import PluginManager
+from test_engine_core.utils.import_modules import LazyModule
+from test_engine_core.utils.worker_pool import WorkerPool
 
 
 class RandomData:
@@ -64,6 +68,7 @@ class TestCollectionPluginsManager:
         PluginManager._plugins = {
             plugin_type.name: dict() for plugin_type in PluginType
         }
+        PluginManager._discovery_index = dict()
 
         # Perform tests
         yield
@@ -73,6 +78,7 @@ class TestCollectionPluginsManager:
         PluginManager._plugins = {
             plugin_type.name: dict() for plugin_type in PluginType
         }
+        PluginManager._discovery_index = dict()
 
     @pytest.mark.parametrize(
         "logger, expected_response",
@@ -128,6 +134,66 @@ class TestCollectionPluginsManager:
             else:
                 assert PluginManager._plugins[plugin_type][module_name]
 
+    def test_discover_with_index(self, mocker, tmp_path):
+        """
+        Tests that it only imports new or modified files when the discovery index exists
+        """
+        discover_folder = tmp_path / "plugins"
+        shutil.copytree("tests/other_import_modules", discover_folder)
+        PluginManager.discover(str(discover_folder))
+        assert (discover_folder / PluginManager.index_file_name).exists()
+
+        # Discover again in a new process with the index file
+        PluginManager._plugins = {
+            plugin_type.name: dict() for plugin_type in PluginType
+        }
+        PluginManager._discovery_index = dict()
+        index_module_spy = mocker.spy(PluginManager, "_index_module")
+        PluginManager.discover(str(discover_folder))
+        assert index_module_spy.call_count == 0
+        data_plugin = PluginManager._plugins[PluginType.DATA.name]["example_data"]
+        assert isinstance(data_plugin, LazyModule)
+        assert data_plugin.is_loaded() is False
+        assert list(PluginManager._plugins[PluginType.ALGORITHM.name].keys()) == [
+            "example_algo"
+        ]
+
+        # Modified files are imported again
+        model_path = discover_folder / "example_model.py"
+        os.utime(model_path, ns=(0, model_path.stat().st_mtime_ns + 1))
+        PluginManager.discover(str(discover_folder))
+        assert index_module_spy.call_count == 1
+        assert data_plugin.Plugin.get_plugin_type() is PluginType.DATA
+        assert data_plugin.is_loaded() is True
+
+    def test_run_plugin_function_in_worker_processes(self, tmp_path):
+        """
+        Tests that the functions of the discovered plugins can run in worker processes
+        """
+        discover_folder = tmp_path / "plugins"
+        shutil.copytree("tests/other_import_modules", discover_folder)
+        with open(discover_folder / "example_algo.py", "a") as file:
+            file.write(
+                "\n\ndef multiply(data, multiplier, index):\n"
+                "    return data[index] * multiplier\n"
+            )
+
+        # The plugin is imported when it is discovered, then imported lazily with the discovery index
+        for _ in range(2):
+            PluginManager._plugins = {
+                plugin_type.name: dict() for plugin_type in PluginType
+            }
+            PluginManager._discovery_index = dict()
+            PluginManager.discover(str(discover_folder))
+            algorithm_plugin = PluginManager._plugins[PluginType.ALGORITHM.name][
+                "example_algo"
+            ]
+            results = WorkerPool.run(
+                algorithm_plugin.multiply, [1, 2, 3], (2,), [(2,), (0,)], 2, "process"
+            )
+            assert results == [6, 2]
+        assert isinstance(algorithm_plugin, LazyModule)
+
     @pytest.mark.parametrize(
         "plugin_type, kwargs, expected_result",
         [
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from test_engine_core.utils.prediction_utils import normalize_predictions
+
+
+class TestCollectionPredictionUtils:
+    @pytest.mark.parametrize(
+        "predictions, expected_output, expected_kind",
+        [
+            (np.array([0, 1, 1]), [0, 1, 1], "i"),
+            ([np.int64(1), np.int64(0)], [1, 0], "i"),
+            ([np.float32(0.5), np.float64(1.5)], [0.5, 1.5], "f"),
+            (["1", "0", "1"], [1, 0, 1], "i"),
+            (["0.5", "1"], [0.5, 1.0], "f"),
+            (["True", "False"], [True, False], "b"),
+            (["cat", "dog", "cat"], ["cat", "dog", "cat"], "U"),
+            ([1, "2", 3.5], [1.0, 2.0, 3.5], "f"),
+            (np.array(["1", "2"], dtype=object), [1, 2], "i"),
+            (np.array([[0.1, 0.9], [0.2, 0.8]]), [[0.1, 0.9], [0.2, 0.8]], "f"),
+            (["[0.1, 0.9]", "[0.3, 0.7]"], [[0.1, 0.9], [0.3, 0.7]], "f"),
+            (["(0.1, 0.9)", "(0.3, 0.7)"], [[0.1, 0.9], [0.3, 0.7]], "f"),
+            ([], [], "f"),
+        ],
+    )
+    def test_normalize_predictions(self, predictions, expected_output, expected_kind):
+        output = normalize_predictions(predictions)
+        assert isinstance(output, np.ndarray)
+        assert output.tolist() == expected_output
+        assert output.dtype.kind == expected_kind
+
+    def test_normalize_predictions_with_different_lengths(self):
+        output = normalize_predictions(["[0.1, 0.9]", "[1.0]"])
+        assert output.dtype == object
+        assert output.tolist() == [[0.1, 0.9], [1.0]]
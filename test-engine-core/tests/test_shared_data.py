@@ -0,0 +1,158 @@
+import multiprocessing
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from test_engine_core.utils.shared_data import SharedData
+
+
+def sum_shared_column(key, column_name):
+    SharedData.setup(1)
+    data, _ = SharedData.attach(key)
+    return float(data[column_name].sum())
+
+
+class TestCollectionSharedData:
+    @pytest.fixture(autouse=True)
+    def init(self):
+        # Reset
+        SharedData.release_all()
+        SharedData.setup(1)
+
+        # Perform tests
+        yield
+
+        # Reset
+        SharedData.release_all()
+        SharedData.set_callback(None)
+        SharedData.setup(0, "")
+
+    def test_publish_and_attach(self):
+        data = pd.DataFrame({"Name": ["a", "b"], "Age": [10, 20], "Score": [1.5, 2.5]})
+        assert SharedData.publish("test_key", data, {"serializer": "PICKLE"}) is True
+        assert SharedData.publish("test_key", data, {"serializer": "PICKLE"}) is True
+
+        shared_data = SharedData.attach("test_key")
+        assert shared_data is not None
+        output, metadata = shared_data
+        assert output.equals(data)
+        assert metadata == {"serializer": "PICKLE"}
+
+        # In-place changes are kept private to the process
+        output.iloc[0, 1] = 30
+        assert output["Age"].tolist() == [30, 20]
+        assert SharedData.attach("test_key")[0]["Age"].tolist() == [10, 20]
+
+    def test_attach_in_another_process(self):
+        data = pd.DataFrame({"Age": np.arange(100), "Score": np.arange(100) / 2})
+        assert SharedData.publish("test_key", data, {}) is True
+
+        with multiprocessing.get_context("spawn").Pool(1) as pool:
+            assert pool.apply(sum_shared_column, ("test_key", "Score")) == 2475.0
+
+    def test_release(self):
+        assert SharedData.publish("test_key", np.arange(10), {}) is True
+        mapped_data, _ = SharedData.attach("test_key")
+
+        SharedData.release("test_key")
+        assert SharedData.attach("test_key") is None
+        assert SharedData._current_size == 0
+
+        # The mapped data can still be used after it is released
+        assert mapped_data.tolist() == list(range(10))
+
+    def test_publish_exceeding_memory_limit(self):
+        # 1 MB limit
+        assert SharedData.publish("test_key", np.zeros(200000), {}) is False
+        assert SharedData.attach("test_key") is None
+
+        # Evicts the least recently used data
+        assert SharedData.publish("test_key_1", np.zeros(50000), {}) is True
+        assert SharedData.publish("test_key_2", np.zeros(50000), {}) is True
+        assert SharedData.attach("test_key_1") is not None
+        assert SharedData.publish("test_key_3", np.zeros(50000), {}) is True
+        assert SharedData.attach("test_key_1") is not None
+        assert SharedData.attach("test_key_2") is None
+        assert SharedData.attach("test_key_3") is not None
+
+    def test_attach_untrusted_shared_memory(self, monkeypatch):
+        assert SharedData.publish("test_key", np.arange(10), {}) is True
+        file_path = Path(SharedData._shared_memory_folder) / SharedData._get_name(
+            "test_key"
+        )
+
+        # Writable by other users
+        os.chmod(file_path, 0o622)
+        assert SharedData.attach("test_key") is None
+        os.chmod(file_path, 0o600)
+        assert SharedData.attach("test_key") is not None
+
+        # Owned by another user
+        user_id = os.getuid()
+        monkeypatch.setattr(os, "getuid", lambda: user_id + 1)
+        assert SharedData.attach("test_key") is None
+
+    def test_namespace(self):
+        SharedData.setup(1, "secret")
+        assert SharedData._get_name("test_key") != "aiverify_test_key"
+        assert SharedData.publish("test_key", np.arange(10), {}) is True
+        assert SharedData.attach("test_key")[0].tolist() == list(range(10))
+
+        # Processes with another namespace cannot find the data
+        SharedData.setup(1, "another secret")
+        assert SharedData.attach("test_key") is None
+        SharedData.setup(1, "secret")
+
+    def test_callback_and_remove(self):
+        events = list()
+        SharedData.set_callback(
+            lambda name, is_published: events.append((name, is_published))
+        )
+        assert SharedData.publish("test_key_1", np.arange(10), {}) is True
+        assert SharedData.publish("test_key_2", np.arange(10), {}) is True
+        SharedData.release("test_key_1")
+        name_1 = SharedData._get_name("test_key_1")
+        name_2 = SharedData._get_name("test_key_2")
+        assert events == [(name_1, True), (name_2, True), (name_1, False)]
+
+        # The shared memory is removed as if by the parent process of a terminated process
+        SharedData.remove([name_2, "not_shared_data", None])
+        assert SharedData.attach("test_key_2") is None
+        assert not (Path(SharedData._shared_memory_folder) / name_2).exists()
+
+    def test_publish_with_unpicklable_data(self):
+        assert SharedData.publish("test_key", lambda x: x, {}) is False
+        assert SharedData.attach("test_key") is None
+
+    def test_disabled(self, tmp_path):
+        SharedData.setup(0)
+        file_path = tmp_path / "data.csv"
+        file_path.write_text("a,b\n1,2\n")
+
+        assert SharedData.is_enabled() is False
+        assert SharedData.get_key(str(file_path)) is None
+        assert SharedData.publish("test_key", np.arange(10), {}) is False
+        assert SharedData.attach("test_key") is None
+
+    def test_get_key(self, tmp_path):
+        file_path = tmp_path / "data.csv"
+        file_path.write_text("a,b\n1,2\n")
+
+        key = SharedData.get_key(str(file_path))
+        assert key == SharedData.get_key(str(file_path))
+        assert key == SharedData.get_key(
+            str(tmp_path / ".." / tmp_path.name / "data.csv")
+        )
+        assert key != SharedData.get_key(str(file_path), ["a"])
+        assert key != SharedData.get_key(str(tmp_path))
+
+        # The key changes when the file is modified
+        file_path.write_text("a,b\n1,2\n3,4\n")
+        assert key != SharedData.get_key(str(file_path))
+
+    @pytest.mark.parametrize("path", ["tests/data/not_found.csv", None, 123, ""])
+    def test_get_key_with_invalid_path(self, path):
+        assert SharedData.get_key(path) is None
@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from test_engine_core.utils.worker_pool import WorkerPool
+
+
+def sum_column(data, multiplier, column_index):
+    return float(np.sum(data[:, column_index]) * multiplier)
+
+
+def sum_dataframe_column(data, multiplier, column_name):
+    return float(data[column_name].sum() * multiplier)
+
+
+def raise_error(data, column_index):
+    raise ValueError(f"Invalid column: {column_index}")
+
+
+class TestCollectionWorkerPool:
+    pytest.data = np.arange(12, dtype=np.float64).reshape(4, 3)
+
+    @pytest.mark.parametrize(
+        "num_workers, worker_type",
+        [
+            (0, "thread"),
+            (1, "process"),
+            (2, "thread"),
+            (3, "process"),
+            (None, "thread"),
+        ],
+    )
+    def test_run(self, num_workers, worker_type):
+        completed = list()
+        results = WorkerPool.run(
+            sum_column,
+            pytest.data,
+            (2,),
+            [(2,), (0,), (1,)],
+            num_workers,
+            worker_type,
+            completed.append,
+        )
+        assert results == [52.0, 36.0, 44.0]
+        assert sorted(completed) == [0, 1, 2]
+
+    def test_run_process_with_non_numeric_data(self):
+        data = pd.DataFrame({"Name": ["a", "b"], "Age": [10, 20], "Score": [1.5, 2.5]})
+        results = WorkerPool.run(
+            sum_dataframe_column, data, (2,), [("Score",), ("Age",)], 2, "process"
+        )
+        assert results == [8.0, 60.0]
+
+    @pytest.mark.parametrize(
+        "num_workers, worker_type",
+        [
+            (1, "thread"),
+            (2, "thread"),
+            (2, "process"),
+        ],
+    )
+    def test_run_with_exception(self, num_workers, worker_type):
+        with pytest.raises(ValueError) as exc_info:
+            WorkerPool.run(
+                raise_error, pytest.data, tuple(), [(0,)], num_workers, worker_type
+            )
+        assert str(exc_info.value) == "Invalid column: 0"
+
+    @pytest.mark.parametrize("worker_type", ["None", None, "threads", 1])
+    def test_run_with_invalid_worker_type(self, worker_type):
+        with pytest.raises(RuntimeError) as exc_info:
+            WorkerPool.run(sum_column, pytest.data, (1,), [(0,)], 2, worker_type)
+        assert str(exc_info.value) == f"The worker type is not supported: {worker_type}"
+
+    def test_run_process_with_unpicklable_function(self):
+        with pytest.raises(RuntimeError) as exc_info:
+            WorkerPool.run(
+                lambda data, column_index: column_index,
+                pytest.data,
+                tuple(),
+                [(0,)],
+                2,
+                "process",
+            )
+        assert str(exc_info.value).startswith(
+            "The function cannot be pickled to run in the process pool"
+        )